@@ -0,0 +1,28 @@
+"""add question sampling indexes
+
+Revision ID: add_question_sampling_indexes
+Revises: add_order_index_questions
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_question_sampling_indexes'
+down_revision: Union[str, None] = 'add_order_index_questions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_questions_subject_id_id', 'questions', ['subject_id', 'id'], unique=False)
+    op.create_index('ix_questions_chapter_id_id', 'questions', ['chapter_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questions_chapter_id_id', table_name='questions')
+    op.drop_index('ix_questions_subject_id_id', table_name='questions')
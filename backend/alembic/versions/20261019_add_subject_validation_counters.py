@@ -0,0 +1,71 @@
+"""add subject validation counters
+
+Revision ID: add_subject_validation_counters
+Revises: typed_question_options
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_subject_validation_counters'
+down_revision: Union[str, None] = 'typed_question_options'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('subject_validation_counters',
+    sa.Column('subject_id', sqlmodel.sql.sqltypes.GUID(), nullable=False),
+    sa.Column('chapter_count', sa.Integer(), nullable=False),
+    sa.Column('chapters_with_textbook', sa.Integer(), nullable=False),
+    sa.Column('chapters_with_video', sa.Integer(), nullable=False),
+    sa.Column('chapters_complete', sa.Integer(), nullable=False),
+    sa.Column('question_count', sa.Integer(), nullable=False),
+    sa.Column('questions_with_textbook', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['subject_id'], ['subjects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('subject_id')
+    )
+
+    # 기존 과목 카운터 백필
+    op.execute("""
+        INSERT INTO subject_validation_counters
+        SELECT
+            s.id,
+            COALESCE(c.chapter_count, 0),
+            COALESCE(c.chapters_with_textbook, 0),
+            COALESCE(c.chapters_with_video, 0),
+            COALESCE(c.chapters_complete, 0),
+            COALESCE(q.question_count, 0),
+            COALESCE(q.questions_with_textbook, 0),
+            timezone('utc', now())
+        FROM subjects s
+        LEFT JOIN (
+            SELECT
+                subject_id,
+                COUNT(*) AS chapter_count,
+                COUNT(*) FILTER (WHERE textbook_page IS NOT NULL) AS chapters_with_textbook,
+                COUNT(*) FILTER (WHERE video_id IS NOT NULL) AS chapters_with_video,
+                COUNT(*) FILTER (WHERE textbook_page IS NOT NULL AND video_id IS NOT NULL) AS chapters_complete
+            FROM chapters
+            GROUP BY subject_id
+        ) c ON c.subject_id = s.id
+        LEFT JOIN (
+            SELECT
+                subject_id,
+                COUNT(*) AS question_count,
+                COUNT(*) FILTER (WHERE textbook_page IS NOT NULL) AS questions_with_textbook
+            FROM questions
+            GROUP BY subject_id
+        ) q ON q.subject_id = s.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('subject_validation_counters')
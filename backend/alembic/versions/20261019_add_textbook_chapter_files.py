@@ -0,0 +1,38 @@
+"""add per-chapter textbook pdf files
+
+Revision ID: add_textbook_chapter_files
+Revises: add_textbook_original_file_url
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_textbook_chapter_files'
+down_revision: Union[str, None] = 'add_textbook_original_file_url'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('textbook_chapter_files',
+    sa.Column('textbook_id', sqlmodel.sql.sqltypes.GUID(), nullable=False),
+    sa.Column('chapter_id', sqlmodel.sql.sqltypes.GUID(), nullable=False),
+    sa.Column('from_page', sa.Integer(), nullable=False),
+    sa.Column('to_page', sa.Integer(), nullable=False),
+    sa.Column('file_url', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('file_size', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['chapter_id'], ['chapters.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['textbook_id'], ['textbooks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('textbook_id', 'chapter_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('textbook_chapter_files')
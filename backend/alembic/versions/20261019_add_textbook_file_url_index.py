@@ -0,0 +1,26 @@
+"""add textbook file_url index for shared file references
+
+Revision ID: add_textbook_file_url_index
+Revises: add_validation_content_version
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_textbook_file_url_index'
+down_revision: Union[str, None] = 'add_validation_content_version'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_textbooks_file_url'), 'textbooks', ['file_url'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_textbooks_file_url'), table_name='textbooks')
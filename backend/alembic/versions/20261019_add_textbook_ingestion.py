@@ -0,0 +1,47 @@
+"""add textbook pdf ingestion status, outline and page texts
+
+Revision ID: add_textbook_ingestion
+Revises: add_textbook_file_url_index
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_textbook_ingestion'
+down_revision: Union[str, None] = 'add_textbook_file_url_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ingestion_status = sa.Enum('PENDING', 'PROCESSING', 'DONE', 'FAILED', name='ingestionstatus')
+
+
+def upgrade() -> None:
+    ingestion_status.create(op.get_bind(), checkfirst=True)
+    op.add_column('textbooks', sa.Column('ingestion_status', ingestion_status, nullable=False, server_default='PENDING'))
+    op.add_column('textbooks', sa.Column('ingestion_error', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+    op.add_column('textbooks', sa.Column('ingested_at', sa.DateTime(), nullable=True))
+    op.add_column('textbooks', sa.Column('outline', sa.JSON(), nullable=True))
+
+    op.create_table('textbook_pages',
+    sa.Column('textbook_id', sqlmodel.sql.sqltypes.GUID(), nullable=False),
+    sa.Column('page_number', sa.Integer(), nullable=False),
+    sa.Column('text', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.ForeignKeyConstraint(['textbook_id'], ['textbooks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('textbook_id', 'page_number')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('textbook_pages')
+    op.drop_column('textbooks', 'outline')
+    op.drop_column('textbooks', 'ingested_at')
+    op.drop_column('textbooks', 'ingestion_error')
+    op.drop_column('textbooks', 'ingestion_status')
+    ingestion_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,29 @@
+"""keep original textbook file when serving an optimized copy
+
+Revision ID: add_textbook_original_file_url
+Revises: add_textbook_ingestion
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_textbook_original_file_url'
+down_revision: Union[str, None] = 'add_textbook_ingestion'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('textbooks', sa.Column('original_file_url', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+    op.create_index(op.f('ix_textbooks_original_file_url'), 'textbooks', ['original_file_url'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_textbooks_original_file_url'), table_name='textbooks')
+    op.drop_column('textbooks', 'original_file_url')
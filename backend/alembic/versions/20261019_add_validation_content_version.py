@@ -0,0 +1,26 @@
+"""add content_version to subject validation counters
+
+Revision ID: add_validation_content_version
+Revises: add_subject_validation_counters
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_validation_content_version'
+down_revision: Union[str, None] = 'add_subject_validation_counters'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('subject_validation_counters', sa.Column('content_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    op.drop_column('subject_validation_counters', 'content_version')
@@ -0,0 +1,60 @@
+"""store question options as text[] and correct_answer as integer
+
+Revision ID: typed_question_options
+Revises: add_question_sampling_indexes
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'typed_question_options'
+down_revision: Union[str, None] = 'add_question_sampling_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # {"options": [...]} JSON -> text[] 백필
+    op.add_column('questions', sa.Column('options_array', postgresql.ARRAY(sa.Text()), nullable=False, server_default='{}'))
+    op.execute("""
+        UPDATE questions
+        SET options_array = ARRAY(SELECT json_array_elements_text(options->'options'))
+        WHERE json_typeof(options->'options') = 'array'
+    """)
+    op.drop_column('questions', 'options')
+    op.alter_column('questions', 'options_array', new_column_name='options')
+
+    # "0" -> 0 (숫자가 아닌 값은 기존 응답 변환과 동일하게 0)
+    op.alter_column(
+        'questions',
+        'correct_answer',
+        type_=sa.Integer(),
+        existing_type=sa.String(),
+        existing_nullable=False,
+        postgresql_using="CASE WHEN correct_answer ~ '^[0-9]+$' THEN correct_answer::integer ELSE 0 END"
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'questions',
+        'correct_answer',
+        type_=sa.String(),
+        existing_type=sa.Integer(),
+        existing_nullable=False,
+        postgresql_using="correct_answer::text"
+    )
+
+    op.add_column('questions', sa.Column('options_json', postgresql.JSON(astext_type=sa.Text()), nullable=True))
+    op.execute("""
+        UPDATE questions
+        SET options_json = json_build_object('options', to_json(options))
+    """)
+    op.drop_column('questions', 'options')
+    op.alter_column('questions', 'options_json', new_column_name='options')
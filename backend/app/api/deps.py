@@ -0,0 +1,59 @@
+"""API 경로 파라미터 의존성 (경로의 리소스를 현재 사용자 소유인지 확인 후 주입)"""
+from uuid import UUID
+from fastapi import Depends, HTTPException, status
+from sqlmodel import Session
+
+from app.core.deps import get_session, get_current_active_user
+from app.models.user import User
+from app.models.certificate import Certificate
+from app.models.subject import Subject
+from app.models.textbook import Textbook
+from app.services.certificate_service import CertificateService
+from app.services.subject_service import SubjectService
+from app.services.textbook_service import TextbookService
+
+
+def get_owned_certificate(
+    certificate_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+) -> Certificate:
+    """경로의 자격증 (현재 사용자 소유가 아니면 404)"""
+    certificate = CertificateService(session).get_by_id(certificate_id, current_user.id)
+    if not certificate:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="자격증을 찾을 수 없습니다"
+        )
+    return certificate
+
+
+def get_owned_subject(
+    subject_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+) -> Subject:
+    """경로의 과목 (현재 사용자 소유가 아니면 404)"""
+    subject = SubjectService(session).get_by_id(subject_id, current_user.id)
+    if not subject:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="과목을 찾을 수 없습니다"
+        )
+    return subject
+
+
+def get_owned_textbook(
+    subject_id: UUID,
+    textbook_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+) -> Textbook:
+    """경로의 교재 (현재 사용자 소유가 아니거나 경로의 과목 교재가 아니면 404)"""
+    textbook = TextbookService(session).get_by_id(textbook_id, current_user.id)
+    if not textbook or textbook.subject_id != subject_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="교재를 찾을 수 없습니다"
+        )
+    return textbook
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, certificates, subjects, chapters, textbooks, videos, questions, validation
+from app.api.v1.endpoints import auth, certificates, subjects, chapters, textbooks, videos, questions, validation, exams, files
 
 api_router = APIRouter(prefix="/api/v1")
 
@@ -11,4 +11,7 @@ api_router.include_router(textbooks.router)
 api_router.include_router(videos.router)
 api_router.include_router(questions.router)
 api_router.include_router(validation.router)
+api_router.include_router(validation.certificate_router)
+api_router.include_router(exams.router)
+api_router.include_router(files.router)
 
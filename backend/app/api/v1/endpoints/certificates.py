@@ -1,9 +1,11 @@
 from typing import List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
 from app.core.deps import get_session, get_current_active_user, get_current_creator
+from app.api.deps import get_owned_certificate
 from app.models.user import User
 from app.schemas.certificate import (
     CertificateCreate,
@@ -14,6 +16,7 @@ from app.schemas.certificate import (
 from app.schemas.subject import SubjectResponse
 from app.schemas.auth import MessageResponse
 from app.services.certificate_service import CertificateService
+from app.services.question_export_service import QuestionExportService
 
 router = APIRouter(prefix="/certificates", tags=["자격증"])
 
@@ -109,6 +112,26 @@ async def get_certificate_with_subjects(
     }
 
 
+@router.get(
+    "/{certificate_id}/questions/export",
+    dependencies=[Depends(get_current_creator), Depends(get_owned_certificate)]
+)
+async def export_certificate_questions(
+    certificate_id: UUID,
+    export_format: str = Query("csv", alias="format", pattern="^(csv|jsonl|xlsx)$", description="csv, jsonl, xlsx"),
+    session: Session = Depends(get_session)
+):
+    """
+    자격증 전체 문제 내보내기 (제작자 전용, 스트리밍)
+    """
+    service = QuestionExportService(session)
+    return StreamingResponse(
+        service.stream(export_format, certificate_id=certificate_id),
+        media_type=service.MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="questions_{certificate_id}.{export_format}"'}
+    )
+
+
 @router.put("/{certificate_id}", response_model=CertificateResponse)
 async def update_certificate(
     certificate_id: UUID,
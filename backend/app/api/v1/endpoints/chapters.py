@@ -1,9 +1,11 @@
 from typing import List
 from uuid import UUID
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, Query, status, HTTPException
 from sqlmodel import Session
 
 from app.core.deps import get_session, get_current_active_user
+from app.api.deps import get_owned_textbook
+from app.models.textbook import Textbook
 from app.models.user import User
 from app.schemas.chapter import (
     ChapterCreate,
@@ -12,10 +14,16 @@ from app.schemas.chapter import (
     ChapterMappingUpdate,
     ChapterVideoMappingUpdate,
     ChapterBulkCreate,
-    ChapterMappingBulkUpdate
+    ChapterMappingBulkUpdate,
+    ChapterOutlineImport,
+    ChapterOutlinePreview,
+    ChapterAutoMappingResponse
 )
 from app.schemas.auth import MessageResponse
 from app.services.chapter_service import ChapterService
+from app.services.textbook_service import TextbookService
+from app.services.textbook_ingestion_service import get_ingestion_executor
+from app.services.chapter_auto_mapping_service import ChapterAutoMappingService
 
 
 router = APIRouter(
@@ -78,6 +86,60 @@ async def bulk_create_chapters(
     return service.bulk_create(subject_id, data.chapters, current_user.id)
 
 
+@router.get("/outline-preview", response_model=ChapterOutlinePreview)
+async def preview_outline_chapters(
+    subject_id: UUID,
+    textbook_id: UUID,
+    max_depth: int = Query(2, ge=0, le=2, description="가져올 최대 깊이 (0=장, 1=절, 2=소단원)"),
+    textbook: Textbook = Depends(get_owned_textbook),
+    session: Session = Depends(get_session)
+):
+    """
+    교재 PDF 목차(책갈피)로 만들 목차 트리 미리보기
+    - depth, textbook_page가 채워진 트리 반환 (저장하지 않음)
+    """
+    service = ChapterService(session)
+    return service.preview_outline(textbook, max_depth)
+
+
+@router.post("/outline-import", response_model=List[ChapterResponse], status_code=status.HTTP_201_CREATED)
+async def import_outline_chapters(
+    subject_id: UUID,
+    data: ChapterOutlineImport,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    교재 PDF 목차(책갈피)로 목차 일괄 생성
+    - 미리보기와 같은 트리를 한 번에 저장 (기존 목차 뒤에 추가)
+    """
+    textbook = TextbookService(session).get_by_id(data.textbook_id, current_user.id)
+    if not textbook or textbook.subject_id != subject_id:
+        raise HTTPException(status_code=404, detail="교재를 찾을 수 없습니다")
+    service = ChapterService(session)
+    return service.import_outline(textbook, data.max_depth)
+
+
+@router.get("/auto-mapping", response_model=ChapterAutoMappingResponse)
+async def suggest_textbook_mapping(
+    subject_id: UUID,
+    textbook_id: UUID,
+    min_score: float = Query(0.1, ge=0, le=1, description="이보다 낮은 추천은 page를 비움"),
+    top_k: int = Query(3, ge=1, le=10),
+    keep_existing: bool = Query(True, description="이미 매핑된 페이지를 고정점으로 사용"),
+    textbook: Textbook = Depends(get_owned_textbook),
+    session: Session = Depends(get_session)
+):
+    """
+    목차-교재 페이지 자동 매핑 추천
+    - 목차 제목과 페이지 본문의 유사도로 목차 순서를 지키는 페이지를 추천
+    - mappings를 bulk-textbook-mapping으로 보내면 추천을 그대로 적용
+    """
+    return await ChapterAutoMappingService.suggest(
+        session, textbook, get_ingestion_executor(), min_score, top_k, keep_existing
+    )
+
+
 @router.get("/{chapter_id}", response_model=ChapterResponse)
 async def get_chapter(
     subject_id: UUID,
@@ -0,0 +1,75 @@
+"""모의고사 API 엔드포인트"""
+from uuid import UUID
+from fastapi import APIRouter, Depends
+from sqlmodel import Session
+
+from app.core.deps import get_session, get_current_active_user
+from app.models.user import User
+from app.schemas.exam import ExamGenerateRequest, ExamResponse
+from app.schemas.grading import GradeRequest, GradeResponse
+from app.services.exam_service import ExamService
+from app.services.grading_service import GradingService
+
+router = APIRouter(tags=["모의고사"])
+
+
+@router.post("/subjects/{subject_id}/exams/generate", response_model=ExamResponse)
+async def generate_subject_exam(
+    subject_id: UUID,
+    data: ExamGenerateRequest,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    과목 모의고사 생성
+    - quotas: 목차별 문항 수 (나머지는 과목 전체에서 출제)
+    - 같은 seed로 요청하면 같은 시험지를 받음
+    """
+    service = ExamService(session)
+    return service.generate_for_subject(subject_id, data)
+
+
+@router.post("/certificates/{certificate_id}/exams/generate", response_model=ExamResponse)
+async def generate_certificate_exam(
+    certificate_id: UUID,
+    data: ExamGenerateRequest,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    자격증 모의고사 생성
+    - quotas: 과목별 문항 수 (나머지는 과목에 고르게 배분)
+    - 같은 seed로 요청하면 같은 시험지를 받음
+    """
+    service = ExamService(session)
+    return service.generate_for_certificate(certificate_id, data)
+
+
+@router.post("/subjects/{subject_id}/exams/grade", response_model=GradeResponse)
+async def grade_subject_exam(
+    subject_id: UUID,
+    data: GradeRequest,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    과목 답안 일괄 채점
+    - 문항별 정답 여부와 해설 반환
+    """
+    service = GradingService(session)
+    return service.grade_subject(subject_id, data.answers)
+
+
+@router.post("/certificates/{certificate_id}/exams/grade", response_model=GradeResponse)
+async def grade_certificate_exam(
+    certificate_id: UUID,
+    data: GradeRequest,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    자격증 모의고사 답안 일괄 채점
+    - 문항별 정답 여부와 해설 반환
+    """
+    service = GradingService(session)
+    return service.grade_certificate(certificate_id, data.answers)
@@ -0,0 +1,25 @@
+"""서명된 URL 파일 다운로드 엔드포인트"""
+from fastapi import APIRouter, Query, Request
+
+from app.services.file_delivery_service import FileDeliveryService
+
+
+router = APIRouter(
+    prefix="/files",
+    tags=["파일"]
+)
+
+
+@router.get("/{file_path:path}")
+async def download_signed_file(
+    file_path: str,
+    request: Request,
+    expires: int = Query(...),
+    signature: str = Query(...)
+):
+    """
+    서명된 만료 URL로 파일 다운로드 (인증 헤더 없이 사용)
+    - URL은 교재 file-url 엔드포인트에서 발급
+    """
+    file_url = FileDeliveryService.verify(file_path, expires, signature)
+    return FileDeliveryService.response(file_url, request.headers)
@@ -1,9 +1,11 @@
 from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
 from app.core.deps import get_session, get_current_active_user
+from app.api.deps import get_owned_subject
 from app.models.user import User
 from app.schemas.question import (
     QuestionCreate,
@@ -16,6 +18,7 @@ from app.schemas.question import (
 )
 from app.schemas.auth import MessageResponse
 from app.services.question_service import QuestionService
+from app.services.question_export_service import QuestionExportService
 
 
 router = APIRouter(
@@ -41,14 +44,33 @@ async def list_questions(
 @router.get("/stats", response_model=QuestionStats)
 async def get_question_stats(
     subject_id: UUID,
+    page_bucket_size: int = Query(10, ge=1, le=1000, description="교재 페이지 구간 크기"),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     문제 통계 조회
+    - 전체/매핑/미매핑 수와 목차별, 장별, 교재 페이지 구간별 문제 수
     """
     service = QuestionService(session)
-    return service.get_stats(subject_id, current_user.id)
+    return service.get_stats(subject_id, current_user.id, page_bucket_size)
+
+
+@router.get("/export", dependencies=[Depends(get_owned_subject)])
+async def export_questions(
+    subject_id: UUID,
+    export_format: str = Query("csv", alias="format", pattern="^(csv|jsonl|xlsx)$", description="csv, jsonl, xlsx"),
+    session: Session = Depends(get_session)
+):
+    """
+    과목의 문제 내보내기 (스트리밍)
+    """
+    service = QuestionExportService(session)
+    return StreamingResponse(
+        service.stream(export_format, subject_id=subject_id),
+        media_type=service.MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="questions_{subject_id}.{export_format}"'}
+    )
 
 
 @router.post("", response_model=QuestionResponse, status_code=status.HTTP_201_CREATED)
@@ -1,19 +1,37 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, UploadFile, File, status, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, Form, Header, Query, Request, Response, status
+from fastapi.responses import FileResponse
 from sqlmodel import Session
 
+from app.core.config import settings
 from app.core.deps import get_session, get_current_active_user
+from app.api.deps import get_owned_textbook
+from app.models.textbook import Textbook
 from app.models.user import User
 from app.schemas.textbook import (
     TextbookCreate,
     TextbookUpdate,
     TextbookResponse,
-    FileUploadResponse
+    TextbookIngestionRequest,
+    TextbookIngestionResponse,
+    TextbookChapterFileResponse,
+    TextbookChapterSplitResponse,
+    TextbookSearchResponse,
+    FileUploadResponse,
+    ResumableUploadCreate,
+    ResumableUploadResponse
 )
 from app.schemas.auth import MessageResponse
 from app.services.textbook_service import TextbookService
 from app.services.file_service import FileService
+from app.services.resumable_upload_service import ResumableUploadService
+from app.services.textbook_ingestion_service import TextbookIngestionService, get_ingestion_executor
+from app.services.pdf_page_service import PdfPageService
+from app.services.thumbnail_service import ThumbnailService
+from app.services.file_delivery_service import FileDeliveryService
+from app.services.chapter_split_service import ChapterSplitService
+from app.services.search_index_service import SearchIndexService
 
 
 router = APIRouter(
@@ -39,48 +57,319 @@ async def list_textbooks(
 async def upload_textbook_file(
     subject_id: UUID,
     file: UploadFile = File(...),
+    password: Optional[str] = Form(None),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     교재 PDF 파일 업로드
-    - 파일 업로드 후 file_url 반환
-    - 이후 create 엔드포인트로 교재 정보 등록
+    - 파일 업로드 후 file_url과 암호화 여부 반환
+    - password를 보내면 암호가 맞는지만 확인 (저장하지 않음)
+    - 이후 create 엔드포인트로 교재 정보 등록 (암호화된 PDF는 pdf_password 포함)
     """
     result = await FileService.save_file(file, "textbooks")
-    return FileUploadResponse(**result)
+    encrypted = await TextbookIngestionService.check_password(result["file_url"], password)
+    return FileUploadResponse(
+        **result,
+        encrypted=encrypted,
+        upload_token=FileService.upload_token(result["file_url"], current_user.id)
+    )
+
+
+@router.post("/uploads", response_model=ResumableUploadResponse, status_code=status.HTTP_201_CREATED)
+async def create_resumable_upload(
+    subject_id: UUID,
+    data: ResumableUploadCreate,
+    response: Response,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    이어 올리기 업로드 생성
+    - 이후 PATCH로 Upload-Offset을 지정해 청크 전송, 완료 후 finalize
+    """
+    result = ResumableUploadService.create(subject_id, current_user.id, data.file_name, data.file_size)
+    response.headers["Upload-Offset"] = str(result["offset"])
+    return result
+
+
+@router.get("/uploads/{upload_id}", response_model=ResumableUploadResponse)
+async def get_resumable_upload(
+    subject_id: UUID,
+    upload_id: UUID,
+    response: Response,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    이어 올리기 업로드 상태 조회 (재개할 오프셋 확인)
+    """
+    result = ResumableUploadService.get(upload_id, subject_id, current_user.id)
+    response.headers["Upload-Offset"] = str(result["offset"])
+    return result
+
+
+@router.patch("/uploads/{upload_id}", response_model=ResumableUploadResponse)
+async def append_resumable_upload(
+    subject_id: UUID,
+    upload_id: UUID,
+    request: Request,
+    response: Response,
+    upload_offset: int = Header(..., ge=0),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    이어 올리기 청크 전송
+    - 요청 본문(application/offset+octet-stream)을 Upload-Offset 위치부터 이어 씀
+    """
+    result = await ResumableUploadService.append(
+        upload_id, subject_id, current_user.id, upload_offset, request.stream()
+    )
+    response.headers["Upload-Offset"] = str(result["offset"])
+    return result
+
+
+@router.post("/uploads/{upload_id}/finalize", response_model=FileUploadResponse)
+async def finalize_resumable_upload(
+    subject_id: UUID,
+    upload_id: UUID,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    이어 올리기 완료
+    - 업로드와 같은 file_url 반환, 이후 create 엔드포인트로 교재 정보 등록
+    """
+    result = await ResumableUploadService.finalize(upload_id, subject_id, current_user.id)
+    encrypted = await TextbookIngestionService.check_password(result["file_url"], None)
+    return FileUploadResponse(
+        **result,
+        encrypted=encrypted,
+        upload_token=FileService.upload_token(result["file_url"], current_user.id)
+    )
+
+
+@router.delete("/uploads/{upload_id}", response_model=MessageResponse)
+async def cancel_resumable_upload(
+    subject_id: UUID,
+    upload_id: UUID,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    이어 올리기 업로드 취소
+    """
+    ResumableUploadService.cancel(upload_id, subject_id, current_user.id)
+    return MessageResponse(message="업로드가 취소되었습니다")
 
 
 @router.post("", response_model=TextbookResponse, status_code=status.HTTP_201_CREATED)
 async def create_textbook(
     subject_id: UUID,
     data: TextbookCreate,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     교재 정보 등록 (파일 업로드 후)
+    - 등록 후 백그라운드에서 PDF 분석 (페이지 수, 페이지별 텍스트, 목차)
+    - 암호화된 PDF는 pdf_password로 분석 시 한 번 복호화 (암호는 저장하지 않음)
     """
     service = TextbookService(session)
-    return service.create(subject_id, data, current_user.id)
+    textbook = service.create(subject_id, data, current_user.id)
+    background_tasks.add_task(TextbookIngestionService.ingest, textbook.id, data.pdf_password)
+    return textbook
 
 
 @router.get("/{textbook_id}", response_model=TextbookResponse)
 async def get_textbook(
     subject_id: UUID,
     textbook_id: UUID,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_active_user)
+    textbook: Textbook = Depends(get_owned_textbook)
 ):
     """
     교재 상세 조회
     """
-    service = TextbookService(session)
-    textbook = service.get_by_id(textbook_id, current_user.id)
-    if not textbook:
-        raise HTTPException(status_code=404, detail="교재를 찾을 수 없습니다")
     return textbook
 
 
+@router.get("/{textbook_id}/file")
+async def download_textbook_file(
+    subject_id: UUID,
+    textbook_id: UUID,
+    request: Request,
+    textbook: Textbook = Depends(get_owned_textbook)
+):
+    """
+    교재 PDF 다운로드 (권한 확인 후 전송은 FILE_DELIVERY 방식으로 위임)
+    """
+    return FileDeliveryService.response(textbook.file_url, request.headers, f"{textbook.title}.pdf")
+
+
+@router.get("/{textbook_id}/file-url")
+async def get_textbook_signed_url(
+    subject_id: UUID,
+    textbook_id: UUID,
+    textbook: Textbook = Depends(get_owned_textbook)
+):
+    """
+    교재 PDF 서명 URL 발급 (SIGNED_URL_EXPIRE_SECONDS 동안 인증 없이 접근 가능)
+    """
+    return FileDeliveryService.sign(textbook.file_url)
+
+
+@router.get("/{textbook_id}/ingestion", response_model=TextbookIngestionResponse)
+async def get_textbook_ingestion(
+    subject_id: UUID,
+    textbook_id: UUID,
+    textbook: Textbook = Depends(get_owned_textbook)
+):
+    """
+    교재 PDF 분석 상태 조회 (페이지 수, 목차 포함)
+    """
+    return TextbookIngestionService.get_status(textbook)
+
+
+@router.post("/{textbook_id}/ingestion", response_model=TextbookIngestionResponse, status_code=status.HTTP_202_ACCEPTED)
+async def restart_textbook_ingestion(
+    subject_id: UUID,
+    textbook_id: UUID,
+    background_tasks: BackgroundTasks,
+    data: Optional[TextbookIngestionRequest] = None,
+    textbook: Textbook = Depends(get_owned_textbook)
+):
+    """
+    교재 PDF 다시 분석
+    - 암호 오류로 실패한 교재는 pdf_password와 함께 요청
+    """
+    password = data.pdf_password if data else None
+    background_tasks.add_task(TextbookIngestionService.ingest, textbook.id, password)
+    return TextbookIngestionService.get_status(textbook)
+
+
+@router.get("/{textbook_id}/pages/{from_page}")
+async def get_textbook_pages(
+    subject_id: UUID,
+    textbook_id: UUID,
+    from_page: int,
+    request: Request,
+    to_page: Optional[int] = Query(None, alias="to", description="마지막 페이지 (생략하면 한 페이지)"),
+    textbook: Textbook = Depends(get_owned_textbook)
+):
+    """
+    교재의 한 페이지 또는 페이지 범위를 PDF로 조회
+    - 목차에 매핑된 페이지로 바로 이동할 때 전체 PDF 대신 사용
+    """
+    return await PdfPageService.range_response(
+        textbook, from_page, to_page, request.headers, get_ingestion_executor()
+    )
+
+
+@router.get("/{textbook_id}/search", response_model=TextbookSearchResponse)
+async def search_textbook(
+    subject_id: UUID,
+    textbook_id: UUID,
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    limit: int = Query(20, ge=1, le=100),
+    textbook: Textbook = Depends(get_owned_textbook),
+    session: Session = Depends(get_session)
+):
+    """
+    교재 본문 검색
+    - 검색어의 음절쌍을 모두 포함하는 페이지를 출현 횟수 순으로 반환 (미리보기 문구 포함)
+    """
+    return await SearchIndexService.search(session, textbook, q, limit, get_ingestion_executor())
+
+
+@router.post(
+    "/{textbook_id}/chapter-files",
+    response_model=TextbookChapterSplitResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def split_textbook_chapters(
+    subject_id: UUID,
+    textbook_id: UUID,
+    background_tasks: BackgroundTasks,
+    max_depth: int = Query(0, ge=0, le=2, description="분할할 목차 깊이 (0=장, 1=절까지, 2=소단원까지)"),
+    textbook: Textbook = Depends(get_owned_textbook),
+    session: Session = Depends(get_session)
+):
+    """
+    목차별 교재 PDF 생성
+    - 목차의 교재 페이지 매핑으로 범위를 계산해 목차마다 PDF 하나를 백그라운드에서 병렬로 생성
+    - 다시 요청하면 기존 결과를 교체 (생성 중이면 409)
+    """
+    ranges = ChapterSplitService.start(session, textbook, max_depth)
+    background_tasks.add_task(
+        ChapterSplitService.run, textbook.id, textbook.file_url, ranges,
+        get_ingestion_executor(), settings.INGESTION_WORKERS
+    )
+    return {"textbook_id": textbook.id, "chapters": len(ranges)}
+
+
+@router.get("/{textbook_id}/chapter-files", response_model=List[TextbookChapterFileResponse])
+async def list_textbook_chapter_files(
+    subject_id: UUID,
+    textbook_id: UUID,
+    textbook: Textbook = Depends(get_owned_textbook),
+    session: Session = Depends(get_session)
+):
+    """
+    목차별 교재 PDF 목록 조회
+    """
+    return ChapterSplitService.list_files(session, textbook.id)
+
+
+@router.get("/{textbook_id}/chapter-files/{chapter_id}")
+async def download_textbook_chapter_file(
+    subject_id: UUID,
+    textbook_id: UUID,
+    chapter_id: UUID,
+    request: Request,
+    textbook: Textbook = Depends(get_owned_textbook),
+    session: Session = Depends(get_session)
+):
+    """
+    목차 PDF 다운로드 (학습 중인 목차만 받을 때 사용)
+    """
+    chapter_file = ChapterSplitService.get_file(session, textbook.id, chapter_id)
+    return FileDeliveryService.response(
+        chapter_file["file_url"], request.headers, f"{textbook.title} - {chapter_file['title']}.pdf"
+    )
+
+
+@router.get("/{textbook_id}/thumbnails")
+async def get_textbook_thumbnails(
+    subject_id: UUID,
+    textbook_id: UUID,
+    request: Request,
+    textbook: Textbook = Depends(get_owned_textbook)
+):
+    """
+    교재 페이지 썸네일 목록 조회
+    - 스프라이트 한 장에 pages_per_sprite페이지, 칸 크기는 스프라이트별 cell_width/cell_height
+    """
+    return await ThumbnailService.get_manifest(textbook, request.url.path)
+
+
+@router.get("/{textbook_id}/thumbnails/{key}/{signature}/{kind}/{number}.webp")
+async def get_textbook_thumbnail_image(
+    subject_id: UUID,
+    textbook_id: UUID,
+    key: str,
+    signature: str,
+    kind: str,
+    number: int
+):
+    """
+    교재 썸네일(kind=pages) 또는 스프라이트(kind=sprites) 이미지
+    - 인증 헤더 대신 썸네일 목록에서 발급한 경로의 서명으로 확인 (<img>/CSS에서 사용)
+    - URL에 파일 내용 키가 포함되고 만료 파라미터가 없으므로 immutable 캐시
+    """
+    path = ThumbnailService.get_image_path(key, signature, kind, number)
+    return FileResponse(
+        path,
+        media_type="image/webp",
+        headers={"Cache-Control": ThumbnailService.CACHE_CONTROL}
+    )
+
+
 @router.put("/{textbook_id}", response_model=TextbookResponse)
 async def update_textbook(
     subject_id: UUID,
@@ -105,14 +394,9 @@ async def delete_textbook(
 ):
     """
     교재 삭제
+    - 같은 파일을 참조하는 다른 교재가 없으면 파일도 삭제
     """
     service = TextbookService(session)
-    
-    # 파일도 삭제
-    textbook = service.get_by_id(textbook_id, current_user.id)
-    if textbook:
-        FileService.delete_file(textbook.file_url)
-    
     service.delete(textbook_id, current_user.id)
     return MessageResponse(message="교재가 삭제되었습니다")
 
@@ -1,10 +1,13 @@
 """검수(Validation) API 엔드포인트"""
+from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
 from app.core.deps import get_session, get_current_active_user
 from app.models.user import User
+from app.schemas.validation import ValidationStatus
 from app.services.validation_service import ValidationService
 
 router = APIRouter(
@@ -12,42 +15,125 @@ router = APIRouter(
     tags=["검수"]
 )
 
+certificate_router = APIRouter(
+    prefix="/certificates/{certificate_id}/validation",
+    tags=["검수"]
+)
+
 
 @router.get("")
 async def get_full_validation(
     subject_id: UUID,
+    response: Response,
+    status_filter: Optional[ValidationStatus] = Query(None, alias="status", description="ok, warning, error"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="목차/문제별 최대 항목 수"),
+    if_none_match: Optional[str] = Header(None),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     전체 검수 결과 조회
+    - 목차/문제가 바뀌지 않았으면 If-None-Match로 304 응답
     """
     service = ValidationService(session)
-    return service.get_full_validation(subject_id, current_user.id)
+    etag, result = service.get_full_validation_cached(
+        subject_id, current_user.id, status_filter, limit, if_none_match
+    )
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if result is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return result
+
+
+@router.get("/stream")
+async def stream_full_validation(
+    subject_id: UUID,
+    status_filter: Optional[ValidationStatus] = Query(None, alias="status", description="ok, warning, error"),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    전체 검수 결과 스트리밍 (NDJSON)
+    - 첫 줄은 요약, 이후 목차/문제 항목을 한 줄씩 전송
+    """
+    service = ValidationService(session)
+    return StreamingResponse(
+        service.stream_full_validation(subject_id, current_user.id, status_filter),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.get("/summary")
+async def get_validation_summary(
+    subject_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    검수 요약 조회 (매핑 진행률 폴링용)
+    """
+    service = ValidationService(session)
+    return service.get_summary(subject_id, current_user.id)
 
 
 @router.get("/chapters")
 async def validate_chapters(
     subject_id: UUID,
+    status_filter: Optional[ValidationStatus] = Query(None, alias="status", description="ok, warning, error"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     목차 검수 결과 조회
+    - status로 상태별 항목만 조회, skip/limit으로 페이지 지정
     """
     service = ValidationService(session)
-    return service.validate_chapters(subject_id, current_user.id)
+    return service.validate_chapters(subject_id, current_user.id, status_filter, skip, limit)
 
 
 @router.get("/questions")
 async def validate_questions(
     subject_id: UUID,
+    status_filter: Optional[ValidationStatus] = Query(None, alias="status", description="ok, warning, error"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     문제 검수 결과 조회
+    - status로 상태별 항목만 조회, skip/limit으로 페이지 지정
+    """
+    service = ValidationService(session)
+    return service.validate_questions(subject_id, current_user.id, status_filter, skip, limit)
+
+
+@router.get("/consistency")
+async def validate_consistency(
+    subject_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    교차 정합성 검수 결과 조회
+    - 교재 페이지 수/영상 길이 초과, 목차 순서와 어긋난 페이지, 다른 과목 목차에 연결된 문제
     """
     service = ValidationService(session)
-    return service.validate_questions(subject_id, current_user.id)
+    return service.get_consistency_issues(subject_id, current_user.id)
+
 
+@certificate_router.get("")
+async def get_certificate_validation(
+    certificate_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    자격증 전체 검수 요약 조회
+    - 과목별 완료율과 전체 완료율
+    """
+    service = ValidationService(session)
+    return service.get_certificate_validation(certificate_id, current_user.id)
@@ -15,6 +15,36 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "uploads"
     MAX_FILE_SIZE: int = 50 * 1024 * 1024  # 50MB
     ALLOWED_EXTENSIONS: Set[str] = {"pdf", "png", "jpg", "jpeg"}
+    
+    # 업로드 파일 전달 방식: python(직접 전송), x-accel(nginx), x-sendfile(Apache 등)
+    FILE_DELIVERY: str = "python"
+    X_ACCEL_PREFIX: str = "/protected-uploads"  # nginx internal location
+    SIGNED_URL_EXPIRE_SECONDS: int = 300
+    PUBLIC_UPLOADS: bool = True  # False면 /uploads 정적 경로를 열지 않음 (권한 확인 경로만 사용)
+    PROTECTED_UPLOAD_DIR: str = "protected"  # 암호 해제본 등 /uploads로 공개하지 않는 하위 폴더
+    
+    # 이어 올리기 업로드 설정 (대용량 컬러 교재용)
+    RESUMABLE_MAX_FILE_SIZE: int = 500 * 1024 * 1024  # 500MB
+    RESUMABLE_UPLOAD_EXPIRE_HOURS: int = 24
+    UPLOAD_TOKEN_EXPIRE_HOURS: int = 24  # 업로드 후 교재 등록까지 허용 시간
+    
+    # PDF 분석 워커 프로세스 수
+    INGESTION_WORKERS: int = 2
+    
+    # PDF 최적화 (선형화 사본 생성, 긴 변이 이 픽셀 수를 넘는 이미지 축소, 0이면 축소 안 함)
+    PDF_OPTIMIZE: bool = True
+    PDF_MAX_IMAGE_PIXELS: int = 2000
+    
+    # 페이지 PDF 디스크 캐시 (업로드 폴더 밖)
+    PAGE_CACHE_DIR: str = "cache/pages"
+    PAGE_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024  # 1GB
+    
+    # 페이지 썸네일/스프라이트 저장 위치
+    THUMBNAIL_DIR: str = "cache/thumbnails"
+    
+    # 교재 본문 검색 색인 저장 위치, 프로세스당 열어 둘 색인(mmap) 수
+    SEARCH_INDEX_DIR: str = "cache/search"
+    SEARCH_INDEX_OPEN_MAX: int = 32
 
     model_config = SettingsConfigDict(
         env_file=".env",
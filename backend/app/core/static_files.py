@@ -0,0 +1,214 @@
+"""업로드 파일 서빙 (Range/206, 강한 ETag, immutable 캐시)"""
+import os
+import re
+import typing
+from contextlib import nullcontext
+from email.utils import formatdate
+from mimetypes import guess_type
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from app.core.config import settings
+
+
+# 내용 주소 파일명 (FileService.blob_path): <sha256>.<ext>
+CONTENT_ADDRESSED_NAME = re.compile(r"^([0-9a-f]{64})\.[A-Za-z0-9]+$")
+
+
+def parse_range(range_header: str, size: int) -> typing.Optional[typing.Tuple[int, int]]:
+    """
+    단일 바이트 범위 해석 -> (start, end) (end 포함)
+    - 해석할 수 없거나 여러 범위면 None (전체 응답)
+    - 만족할 수 없는 범위면 ValueError (416)
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, _, last = spec.strip().partition("-")
+    try:
+        if first == "":
+            # 마지막 N바이트
+            suffix = int(last)
+            if suffix <= 0:
+                raise ValueError
+            return max(size - suffix, 0), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        if first == "" and last.isdigit():
+            raise
+        return None
+
+    if start >= size:
+        raise ValueError
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+
+class RangeFileResponse(Response):
+    """
+    바이트 범위를 지원하는 파일 응답
+
+    본문은 스레드에서 청크 단위로 읽어 보낸다. 현재 사용하는 uvicorn은 zero-copy 확장을
+    제공하지 않으므로 항상 이 경로로 전송된다. scope["extensions"]에
+    http.response.pathsend / http.response.zerocopysend를 알리는 ASGI 서버에서 실행할 때만
+    해당 확장으로 전송을 서버에 맡긴다.
+    이미 연 파일(file)을 넘기면 경로를 다시 열지 않으므로 전송 전에 파일이 삭제되어도
+    끝까지 보낼 수 있다 (캐시 파일용, 전송 후 닫음).
+    """
+
+    chunk_size = 256 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        stat_result: os.stat_result,
+        etag: str,
+        cache_control: str,
+        request_headers: Headers,
+        file: typing.Optional[typing.BinaryIO] = None
+    ) -> None:
+        self.path = path
+        self.file = file
+        self.background = None
+        self.media_type = guess_type(path)[0] or "application/octet-stream"
+        self.status_code = 200
+
+        size = stat_result.st_size
+        last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+        self.init_headers({
+            "accept-ranges": "bytes",
+            "etag": etag,
+            "last-modified": last_modified,
+            "cache-control": cache_control
+        })
+
+        self.start, self.end = 0, size - 1
+        range_header = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+        # If-Range가 현재 버전과 다르면 범위를 무시하고 전체 전송
+        if range_header and size and (if_range is None or if_range in (etag, last_modified)):
+            try:
+                byte_range = parse_range(range_header, size)
+            except ValueError:
+                self.status_code = 416
+                self.start, self.end = 0, -1
+                self.headers["content-range"] = f"bytes */{size}"
+            else:
+                if byte_range is not None:
+                    self.status_code = 206
+                    self.start, self.end = byte_range
+                    self.headers["content-range"] = f"bytes {self.start}-{self.end}/{size}"
+
+        self.full = self.status_code == 200
+        self.headers["content-length"] = str(self.end - self.start + 1)
+
+    async def _send_chunks(self, send: Send) -> None:
+        if self.file is not None:
+            await self._send_from(anyio.wrap_file(self.file), send)
+            return
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await self._send_from(file, send)
+
+    async def _send_from(self, file: anyio.AsyncFile, send: Send) -> None:
+        remaining = self.end - self.start + 1
+        await file.seek(self.start)
+        while remaining > 0:
+            chunk = await file.read(min(self.chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            await send({
+                "type": "http.response.body",
+                "body": chunk,
+                "more_body": remaining > 0
+            })
+        if remaining > 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self._send(scope, send)
+        finally:
+            if self.file is not None:
+                self.file.close()
+
+    async def _send(self, scope: Scope, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers
+        })
+
+        extensions = scope.get("extensions") or {}
+        count = self.end - self.start + 1
+        if scope["method"].upper() == "HEAD" or count <= 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif self.full and self.file is None and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": os.path.abspath(self.path)})
+        elif "http.response.zerocopysend" in extensions:
+            with nullcontext(self.file) if self.file is not None else open(self.path, "rb") as file:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file.fileno(),
+                    "offset": self.start,
+                    "count": count,
+                    "more_body": False
+                })
+        else:
+            await self._send_chunks(send)
+
+
+class UploadFiles(StaticFiles):
+    """
+    업로드 파일 정적 서빙
+
+    업로드 파일은 덮어쓰지 않으므로(내용 주소 또는 고유 이름) 강한 ETag와
+    immutable 캐시를 보낸다. PDF.js 부분 로딩을 위해 Range/If-Range를 처리하고,
+    '_'로 시작하는 내부 디렉토리(이어 올리기 세션 등)와 PROTECTED_UPLOAD_DIR
+    (암호 해제본, 권한 확인 경로로만 제공)은 제공하지 않는다.
+    """
+
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        parts = path.split("/")
+        if parts[0] == settings.PROTECTED_UPLOAD_DIR or any(
+            part.startswith("_") or part.endswith(".part") for part in parts
+        ):
+            raise HTTPException(status_code=404)
+        return await super().get_response(path, scope)
+
+    @staticmethod
+    def etag_for(full_path: str, stat_result: os.stat_result) -> str:
+        """내용 주소 파일은 해시, 그 외에는 inode/크기/수정 시각 기반 ETag"""
+        match = CONTENT_ADDRESSED_NAME.match(os.path.basename(full_path))
+        if match:
+            return f'"{match.group(1)}"'
+        return f'"{stat_result.st_ino:x}-{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+    def file_response(
+        self,
+        full_path: typing.Union[str, "os.PathLike[str]"],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        response = RangeFileResponse(
+            str(full_path),
+            stat_result,
+            etag=self.etag_for(str(full_path), stat_result),
+            cache_control=self.CACHE_CONTROL,
+            request_headers=request_headers
+        )
+        if response.full and self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -1,8 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from app.api.v1 import api_router
 from app.core.config import settings
+from app.core.static_files import UploadFiles
 import os
 
 app = FastAPI(
@@ -27,9 +27,11 @@ app.add_middleware(
     max_age=3600,
 )
 
-# 정적 파일 서빙 (업로드된 파일)
+# 정적 파일 서빙 (업로드된 파일, Range/ETag/immutable 캐시)
+# PUBLIC_UPLOADS=False면 교재 파일은 권한 확인 엔드포인트/서명 URL로만 제공
 os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
+if settings.PUBLIC_UPLOADS:
+    app.mount("/uploads", UploadFiles(directory=settings.UPLOAD_DIR), name="uploads")
 
 # API 라우터 등록
 app.include_router(api_router)
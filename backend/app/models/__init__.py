@@ -2,9 +2,10 @@ from app.models.user import User, UserRole
 from app.models.certificate import Certificate
 from app.models.subject import Subject, SubjectProficiencyWeight
 from app.models.chapter import Chapter
-from app.models.textbook import Textbook
+from app.models.textbook import Textbook, TextbookPage, TextbookChapterFile, IngestionStatus
 from app.models.video import Video
 from app.models.question import Question
+from app.models.validation_counter import SubjectValidationCounter
 
 __all__ = [
     "User",
@@ -14,7 +15,11 @@ __all__ = [
     "SubjectProficiencyWeight",
     "Chapter",
     "Textbook",
+    "TextbookPage",
+    "TextbookChapterFile",
+    "IngestionStatus",
     "Video",
     "Question",
+    "SubjectValidationCounter",
 ]
 
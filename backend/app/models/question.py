@@ -1,21 +1,29 @@
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Column
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import Column, Index, Text
+from sqlalchemy.dialects.postgresql import ARRAY
 from uuid import UUID, uuid4
 from datetime import datetime
-from typing import Any
+from typing import List
 
 
 class Question(SQLModel, table=True):
     __tablename__ = "questions"
+    __table_args__ = (
+        # 무작위 출제 시 id 범위 탐색용 인덱스
+        Index("ix_questions_subject_id_id", "subject_id", "id"),
+        Index("ix_questions_chapter_id_id", "chapter_id", "id"),
+    )
     
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     subject_id: UUID = Field(foreign_key="subjects.id", index=True)
     chapter_id: UUID | None = Field(default=None, foreign_key="chapters.id", index=True)
     
     content: str  # 문제 내용
-    options: dict[str, Any] = Field(default={}, sa_column=Column(JSON))  # JSON 형태의 선택지
-    correct_answer: str  # 정답 (인덱스를 문자열로 저장)
+    options: List[str] = Field(
+        default_factory=list,
+        sa_column=Column(ARRAY(Text), nullable=False, server_default="{}")
+    )  # 선택지 (text[])
+    correct_answer: int  # 정답 인덱스 (0부터 시작)
     explanation: str | None = Field(default=None)  # 해설
     
     # 교재 매핑
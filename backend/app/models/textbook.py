@@ -1,6 +1,17 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, ForeignKey, JSON
+from sqlmodel.sql.sqltypes import GUID
 from uuid import UUID, uuid4
 from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+
+class IngestionStatus(str, Enum):
+    PENDING = "pending"        # 분석 대기
+    PROCESSING = "processing"  # 분석 중
+    DONE = "done"              # 완료
+    FAILED = "failed"          # 실패
 
 
 class Textbook(SQLModel, table=True):
@@ -9,7 +20,42 @@ class Textbook(SQLModel, table=True):
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     subject_id: UUID = Field(foreign_key="subjects.id", index=True)
     title: str
-    file_url: str
+    file_url: str = Field(index=True)  # 같은 파일을 여러 교재가 참조할 수 있음
+    original_file_url: Optional[str] = Field(default=None, index=True)  # 최적화 전 원본
     total_pages: int = Field(default=0)
+    
+    # PDF 분석 결과 (페이지 수, 목차(outline), 페이지별 텍스트는 textbook_pages)
+    ingestion_status: IngestionStatus = Field(default=IngestionStatus.PENDING)
+    ingestion_error: Optional[str] = Field(default=None)
+    ingested_at: Optional[datetime] = Field(default=None)
+    outline: Optional[List[dict]] = Field(default=None, sa_column=Column(JSON))
+    
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+
+class TextbookPage(SQLModel, table=True):
+    """교재 페이지별 추출 텍스트"""
+    __tablename__ = "textbook_pages"
+    
+    textbook_id: UUID = Field(
+        sa_column=Column(GUID(), ForeignKey("textbooks.id", ondelete="CASCADE"), primary_key=True)
+    )
+    page_number: int = Field(primary_key=True)  # 1부터 시작
+    text: str = Field(default="")
+
+
+class TextbookChapterFile(SQLModel, table=True):
+    """목차별로 분할한 교재 PDF"""
+    __tablename__ = "textbook_chapter_files"
+    
+    textbook_id: UUID = Field(
+        sa_column=Column(GUID(), ForeignKey("textbooks.id", ondelete="CASCADE"), primary_key=True)
+    )
+    chapter_id: UUID = Field(
+        sa_column=Column(GUID(), ForeignKey("chapters.id", ondelete="CASCADE"), primary_key=True)
+    )
+    from_page: int
+    to_page: int
+    file_url: str
+    file_size: int = Field(default=0)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,29 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, ForeignKey
+from sqlmodel.sql.sqltypes import GUID
+from uuid import UUID
+from datetime import datetime
+
+
+class SubjectValidationCounter(SQLModel, table=True):
+    """과목별 검수 카운터 (매핑 변경 시 트랜잭션 안에서 증감)"""
+    __tablename__ = "subject_validation_counters"
+    
+    subject_id: UUID = Field(
+        sa_column=Column(GUID(), ForeignKey("subjects.id", ondelete="CASCADE"), primary_key=True)
+    )
+    
+    # 목차
+    chapter_count: int = Field(default=0)
+    chapters_with_textbook: int = Field(default=0)
+    chapters_with_video: int = Field(default=0)
+    chapters_complete: int = Field(default=0)  # 교재, 영상 모두 매핑
+    
+    # 문제
+    question_count: int = Field(default=0)
+    questions_with_textbook: int = Field(default=0)
+    
+    # 목차/문제가 바뀔 때마다 증가 (검수 결과 캐시/ETag 키)
+    content_version: int = Field(default=0)
+    
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
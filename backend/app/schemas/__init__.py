@@ -29,12 +29,27 @@ from app.schemas.chapter import (
     ChapterBulkCreate,
     ChapterMappingBulkItem,
     ChapterMappingBulkUpdate,
+    ChapterOutlineImport,
+    ChapterOutlineNode,
+    ChapterOutlinePreview,
+    ChapterPageCandidate,
+    ChapterAutoMappingSuggestion,
+    ChapterAutoMappingResponse,
 )
 from app.schemas.textbook import (
     TextbookCreate,
     TextbookUpdate,
     TextbookResponse,
+    TextbookOutlineItem,
+    TextbookIngestionRequest,
+    TextbookIngestionResponse,
+    TextbookChapterFileResponse,
+    TextbookChapterSplitResponse,
+    TextbookSearchResult,
+    TextbookSearchResponse,
     FileUploadResponse,
+    ResumableUploadCreate,
+    ResumableUploadResponse,
 )
 from app.schemas.video import (
     VideoCreate,
@@ -52,6 +67,8 @@ from app.schemas.question import (
     QuestionMappingUpdate,
     QuestionMappingBulkItem,
     QuestionMappingBulkUpdate,
+    QuestionChapterCount,
+    QuestionPageBucket,
     QuestionStats,
 )
 from app.schemas.validation import (
@@ -63,6 +80,18 @@ from app.schemas.validation import (
     QuestionValidationResult,
     FullValidationResult,
 )
+from app.schemas.exam import (
+    ExamQuota,
+    ExamGenerateRequest,
+    ExamQuestion,
+    ExamResponse,
+)
+from app.schemas.grading import (
+    GradeAnswer,
+    GradeRequest,
+    GradeResultItem,
+    GradeResponse,
+)
 
 __all__ = [
     # Auth
@@ -93,11 +122,26 @@ __all__ = [
     "ChapterBulkCreate",
     "ChapterMappingBulkItem",
     "ChapterMappingBulkUpdate",
+    "ChapterOutlineImport",
+    "ChapterOutlineNode",
+    "ChapterOutlinePreview",
+    "ChapterPageCandidate",
+    "ChapterAutoMappingSuggestion",
+    "ChapterAutoMappingResponse",
     # Textbook
     "TextbookCreate",
     "TextbookUpdate",
     "TextbookResponse",
+    "TextbookOutlineItem",
+    "TextbookIngestionRequest",
+    "TextbookIngestionResponse",
+    "TextbookChapterFileResponse",
+    "TextbookChapterSplitResponse",
+    "TextbookSearchResult",
+    "TextbookSearchResponse",
     "FileUploadResponse",
+    "ResumableUploadCreate",
+    "ResumableUploadResponse",
     # Video
     "VideoCreate",
     "VideoUpdate",
@@ -113,6 +157,8 @@ __all__ = [
     "QuestionMappingUpdate",
     "QuestionMappingBulkItem",
     "QuestionMappingBulkUpdate",
+    "QuestionChapterCount",
+    "QuestionPageBucket",
     "QuestionStats",
     # Validation
     "ValidationStatus",
@@ -122,4 +168,14 @@ __all__ = [
     "ChapterValidationResult",
     "QuestionValidationResult",
     "FullValidationResult",
+    # Exam
+    "ExamQuota",
+    "ExamGenerateRequest",
+    "ExamQuestion",
+    "ExamResponse",
+    # Grading
+    "GradeAnswer",
+    "GradeRequest",
+    "GradeResultItem",
+    "GradeResponse",
 ]
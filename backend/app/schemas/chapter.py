@@ -73,3 +73,53 @@ class ChapterMappingBulkUpdate(BaseModel):
     """일괄 매핑 요청"""
     mappings: List[ChapterMappingBulkItem]
 
+
+
+class ChapterOutlineImport(BaseModel):
+    """교재 PDF 목차(outline)로 목차 생성 요청"""
+    textbook_id: UUID
+    max_depth: int = Field(2, ge=0, le=2)  # 이보다 깊은 outline 항목은 제외
+
+
+class ChapterOutlineNode(BaseModel):
+    """outline에서 만든 목차 미리보기 노드"""
+    title: str
+    order_index: int
+    depth: int
+    textbook_page: Optional[int]
+    children: List["ChapterOutlineNode"] = []
+
+
+ChapterOutlineNode.model_rebuild()
+
+
+class ChapterOutlinePreview(BaseModel):
+    """outline 목차 미리보기"""
+    textbook_id: UUID
+    total_count: int
+    mapped_count: int  # 교재 페이지가 채워진 항목 수
+    chapters: List[ChapterOutlineNode]
+
+
+class ChapterPageCandidate(BaseModel):
+    """자동 매핑 후보 페이지"""
+    page: int
+    score: float  # 목차 제목과 페이지 본문의 TF-IDF 코사인 유사도
+
+
+class ChapterAutoMappingSuggestion(BaseModel):
+    """목차별 자동 매핑 추천"""
+    chapter_id: UUID
+    title: str
+    depth: int
+    current_page: Optional[int]
+    page: Optional[int]  # 목차 순서 제약을 지킨 추천 페이지 (점수가 낮으면 None)
+    score: float
+    candidates: List[ChapterPageCandidate]  # 순서 제약 없이 점수가 높은 페이지
+
+
+class ChapterAutoMappingResponse(BaseModel):
+    """목차-교재 페이지 자동 매핑 결과"""
+    textbook_id: UUID
+    suggestions: List[ChapterAutoMappingSuggestion]
+    mappings: List[ChapterMappingBulkItem]  # 바뀌는 항목만, bulk-textbook-mapping 요청에 그대로 사용
@@ -0,0 +1,37 @@
+"""모의고사 관련 Pydantic 스키마"""
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from uuid import UUID
+
+
+# ===== 모의고사 생성 =====
+
+class ExamQuota(BaseModel):
+    """출제 할당 항목"""
+    target_id: UUID  # 과목 시험: chapter_id, 자격증 시험: subject_id
+    count: int = Field(gt=0)
+
+
+class ExamGenerateRequest(BaseModel):
+    """모의고사 생성 요청"""
+    question_count: int = Field(gt=0, le=200)  # 총 문항 수
+    quotas: List[ExamQuota] = []  # 목차/과목별 문항 수 (나머지는 전체에서 출제)
+    exclude_ids: List[UUID] = Field(default=[], max_length=1000)  # 제외할 문제 ID (이미 푼 문제 등)
+    seed: Optional[int] = Field(None, ge=0)  # 같은 seed면 같은 시험지 생성
+
+
+class ExamQuestion(BaseModel):
+    """시험 문항 (정답/해설 제외)"""
+    id: UUID
+    subject_id: UUID
+    chapter_id: Optional[UUID]
+    content: str
+    options: List[str]
+    textbook_page: Optional[int]
+
+
+class ExamResponse(BaseModel):
+    """모의고사 응답"""
+    seed: int
+    question_count: int
+    questions: List[ExamQuestion]
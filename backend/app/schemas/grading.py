@@ -0,0 +1,32 @@
+"""채점 관련 Pydantic 스키마"""
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from uuid import UUID
+
+
+class GradeAnswer(BaseModel):
+    """제출 답안 항목"""
+    question_id: UUID
+    chosen_index: int = Field(ge=0)  # 선택한 보기 인덱스 (0부터 시작)
+
+
+class GradeRequest(BaseModel):
+    """답안 일괄 제출"""
+    answers: List[GradeAnswer] = Field(min_length=1, max_length=500)
+
+
+class GradeResultItem(BaseModel):
+    """문항별 채점 결과"""
+    question_id: UUID
+    chosen_index: int
+    correct_answer: int
+    is_correct: bool
+    explanation: Optional[str]  # 틀린 문항만 (맞힌 문항은 None)
+
+
+class GradeResponse(BaseModel):
+    """채점 결과"""
+    total: int
+    correct_count: int
+    score: float  # 정답률 (%)
+    items: List[GradeResultItem]
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, model_validator
-from typing import Optional, List, Any
+from pydantic import BaseModel, Field
+from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
 
@@ -41,42 +41,6 @@ class QuestionResponse(BaseModel):
     order_index: int
     created_at: datetime
 
-    @model_validator(mode='before')
-    @classmethod
-    def convert_options_and_answer(cls, data: Any) -> Any:
-        """Question 모델의 options와 correct_answer를 변환"""
-        # SQLModel 객체인 경우 dict로 변환
-        if hasattr(data, '__dict__'):
-            data = data.__dict__
-        
-        if isinstance(data, dict):
-            # options 변환: dict에서 리스트 추출
-            if 'options' in data:
-                options_value = data['options']
-                if isinstance(options_value, dict):
-                    # {"options": [...]} 형태에서 리스트 추출
-                    if 'options' in options_value:
-                        data['options'] = options_value['options']
-                    else:
-                        # 그냥 dict인 경우 빈 리스트로
-                        data['options'] = []
-                elif isinstance(options_value, list):
-                    # 이미 리스트인 경우 그대로 사용
-                    pass
-                else:
-                    # 다른 타입인 경우 빈 리스트로
-                    data['options'] = []
-            
-            # correct_answer 변환: str에서 int로
-            if 'correct_answer' in data:
-                correct_answer_value = data['correct_answer']
-                if isinstance(correct_answer_value, str):
-                    try:
-                        data['correct_answer'] = int(correct_answer_value)
-                    except (ValueError, TypeError):
-                        data['correct_answer'] = 0
-        return data
-
     class Config:
         from_attributes = True
 
@@ -108,9 +72,27 @@ class QuestionMappingBulkUpdate(BaseModel):
 
 # ===== 문제 통계 =====
 
+class QuestionChapterCount(BaseModel):
+    """목차별 문제 수"""
+    chapter_id: Optional[UUID]  # None: 목차 미지정
+    title: Optional[str] = None  # 장(depth 0) 집계에서만 사용
+    total_count: int
+    mapped_count: int
+
+
+class QuestionPageBucket(BaseModel):
+    """교재 페이지 구간별 문제 수"""
+    page_start: int
+    page_end: int
+    count: int
+
+
 class QuestionStats(BaseModel):
     """문제 통계"""
     total_count: int
     mapped_count: int  # 교재 매핑된 문제 수
     unmapped_count: int  # 매핑 안 된 문제 수
+    by_chapter: List[QuestionChapterCount] = []  # 목차별
+    by_root_chapter: List[QuestionChapterCount] = []  # 장(depth 0)별
+    by_page_bucket: List[QuestionPageBucket] = []  # 교재 페이지 구간별
 
@@ -1,14 +1,18 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
+from app.models.textbook import IngestionStatus
+
 
 class TextbookCreate(BaseModel):
     """교재 생성 요청 (파일 업로드 후)"""
     title: str = Field(min_length=1, max_length=200)
     file_url: str
-    total_pages: int = Field(gt=0)
+    upload_token: str = Field(max_length=200)  # 업로드 응답의 upload_token
+    total_pages: Optional[int] = Field(None, gt=0)  # 생략하면 PDF 분석 결과로 채움
+    pdf_password: Optional[str] = Field(None, max_length=128)  # 암호화된 PDF만, 저장하지 않고 분석에만 사용
 
 
 class TextbookUpdate(BaseModel):
@@ -23,16 +27,90 @@ class TextbookResponse(BaseModel):
     subject_id: UUID
     title: str
     file_url: str
+    original_file_url: Optional[str] = None
     total_pages: int
+    ingestion_status: IngestionStatus
+    ingestion_error: Optional[str] = None
     created_at: datetime
 
     class Config:
         from_attributes = True
 
 
+class TextbookOutlineItem(BaseModel):
+    """PDF 목차(outline) 항목"""
+    title: str
+    page: Optional[int]
+    depth: int
+
+
+class TextbookIngestionRequest(BaseModel):
+    """PDF 다시 분석 요청"""
+    pdf_password: Optional[str] = Field(None, max_length=128)
+
+
+class TextbookIngestionResponse(BaseModel):
+    """PDF 분석 상태"""
+    textbook_id: UUID
+    status: IngestionStatus
+    error: Optional[str] = None
+    total_pages: int
+    ingested_at: Optional[datetime] = None
+    outline: List[TextbookOutlineItem] = []
+
+
+class TextbookChapterFileResponse(BaseModel):
+    """목차별 분할 PDF"""
+    chapter_id: UUID
+    title: str
+    depth: int
+    from_page: int
+    to_page: int
+    file_size: int
+    created_at: datetime
+
+
+class TextbookChapterSplitResponse(BaseModel):
+    """목차별 PDF 생성 요청 결과 (생성은 백그라운드에서 진행, 끝나면 목록 조회에 반영)"""
+    textbook_id: UUID
+    chapters: int  # 만들 목차 PDF 수
+
+
+class TextbookSearchResult(BaseModel):
+    """교재 본문 검색 결과 페이지"""
+    page: int
+    score: int  # 검색어 음절쌍 출현 횟수 합
+    snippet: str
+
+
+class TextbookSearchResponse(BaseModel):
+    """교재 본문 검색 응답"""
+    query: str
+    total: int  # 일치한 전체 페이지 수
+    results: List[TextbookSearchResult]
+
+
 class FileUploadResponse(BaseModel):
     """파일 업로드 응답"""
     file_url: str
     file_name: str
     file_size: int
+    sha256: Optional[str] = None
+    encrypted: Optional[bool] = None  # True면 교재 등록 시 pdf_password 필요
+    upload_token: str  # 교재 등록 시 file_url과 함께 전송 (업로드한 사용자만 등록 가능)
 
+
+
+class ResumableUploadCreate(BaseModel):
+    """이어 올리기 업로드 생성 요청"""
+    file_name: str = Field(min_length=1, max_length=255)
+    file_size: int = Field(gt=0)
+
+
+class ResumableUploadResponse(BaseModel):
+    """이어 올리기 업로드 상태"""
+    upload_id: UUID
+    file_name: str
+    file_size: int
+    offset: int
+    expires_at: datetime
@@ -4,9 +4,20 @@ from app.services.subject_service import SubjectService
 from app.services.chapter_service import ChapterService
 from app.services.textbook_service import TextbookService
 from app.services.file_service import FileService
+from app.services.resumable_upload_service import ResumableUploadService
+from app.services.textbook_ingestion_service import TextbookIngestionService
+from app.services.pdf_page_service import PdfPageService
+from app.services.thumbnail_service import ThumbnailService
+from app.services.chapter_split_service import ChapterSplitService
+from app.services.search_index_service import SearchIndexService
+from app.services.chapter_auto_mapping_service import ChapterAutoMappingService
+from app.services.file_delivery_service import FileDeliveryService
 from app.services.video_service import VideoService
 from app.services.question_service import QuestionService
+from app.services.question_export_service import QuestionExportService
 from app.services.validation_service import ValidationService
+from app.services.exam_service import ExamService
+from app.services.grading_service import GradingService
 
 __all__ = [
     "AuthService",
@@ -15,8 +26,19 @@ __all__ = [
     "ChapterService",
     "TextbookService",
     "FileService",
+    "ResumableUploadService",
+    "TextbookIngestionService",
+    "PdfPageService",
+    "ThumbnailService",
+    "ChapterSplitService",
+    "SearchIndexService",
+    "ChapterAutoMappingService",
+    "FileDeliveryService",
     "VideoService",
     "QuestionService",
+    "QuestionExportService",
     "ValidationService",
+    "ExamService",
+    "GradingService",
 ]
 
@@ -0,0 +1,207 @@
+"""목차-교재 페이지 자동 매핑 서비스"""
+import re
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+from sqlmodel import Session, select
+from starlette.concurrency import run_in_threadpool
+
+from app.models.chapter import Chapter
+from app.models.textbook import Textbook
+from app.services.chapter_split_service import toc_order
+from app.services.search_index_service import SearchIndexService, tokenize, CHAR_BITS
+
+
+# 목차 제목 앞 번호 (제1장, 1.2, Ⅱ., ①, 가. 등)는 본문과 맞출 때 잡음이 되므로 제거
+TITLE_NUMBERING = re.compile(r"^\s*(제\s*\d+\s*[편장절관]|[\dⅠ-Ⅻ]+(?:[.\-]\d+)*[.)]?|[①-⑳]|[가-하][.)])\s*")
+ANCHOR_BONUS = 10.0  # 이미 매핑된 페이지 가중치 (코사인 유사도 최댓값 1보다 충분히 큼)
+KEY_BITS = CHAR_BITS * 2
+CHUNK_ENTRIES = 2_000_000  # 한 번에 펼칠 (제목 토큰 × 페이지) 곱 수 상한
+
+
+def _title_terms(titles: Sequence[str], keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    제목별 토큰 -> (행, 색인 토큰 번호, 출현 횟수, 색인에 있는지) (행 순으로 정렬)
+    - 색인에 없는 토큰도 제목 벡터 크기 계산에는 포함
+    """
+    token_lists = [list(tokenize(TITLE_NUMBERING.sub("", title) or title)) for title in titles]
+    rows = np.repeat(np.arange(len(titles)), [len(tokens) for tokens in token_lists])
+    title_keys = np.fromiter(
+        (key for tokens in token_lists for key in tokens), dtype=np.uint64, count=len(rows)
+    )
+
+    # (행, 토큰 키)를 한 정수로 묶어 중복 집계 (토큰 키는 42비트)
+    pairs, tf = np.unique((rows.astype(np.uint64) << np.uint64(KEY_BITS)) | title_keys, return_counts=True)
+    rows = (pairs >> np.uint64(KEY_BITS)).astype(np.int64)
+    title_keys = pairs & np.uint64((1 << KEY_BITS) - 1)
+    positions = np.minimum(np.searchsorted(keys, title_keys), max(len(keys) - 1, 0))
+    found = (keys[positions] == title_keys) if len(keys) else np.zeros(len(rows), dtype=bool)
+    return rows, positions, tf, found
+
+
+def score_matrix(index_arrays: Tuple, page_count: int, titles: Sequence[str]) -> np.ndarray:
+    """
+    목차 제목 × 페이지 TF-IDF 코사인 유사도 행렬 (열 0은 사용 안 함, 페이지는 1부터)
+
+    페이지 벡터는 검색 색인의 포스팅(토큰별 페이지/출현 횟수)을 그대로 희소 행렬로 쓰고,
+    제목 토큰마다 해당 토큰의 포스팅 구간을 펼쳐 bincount로 한 번에 누적한다.
+    """
+    keys_view, offsets_view, pages_view, counts_view = index_arrays
+    keys = np.asarray(keys_view, dtype=np.uint64)
+    offsets = np.asarray(offsets_view, dtype=np.int64)
+    pages = np.asarray(pages_view, dtype=np.int64)
+    counts = np.asarray(counts_view, dtype=np.float64)
+    width = page_count + 1
+
+    # 페이지 벡터: tf * idf, 페이지별 L2 정규화
+    df = np.diff(offsets)
+    idf = np.log((1 + page_count) / (1 + df)) + 1
+    weights = counts * np.repeat(idf, df)
+    norms = np.sqrt(np.bincount(pages, weights=weights * weights, minlength=width))
+    norms[norms == 0] = 1
+    weights /= norms[pages]
+
+    # 제목 벡터: 같은 방식 (색인에 없는 토큰은 df=0의 idf)
+    rows, terms, tf, found = _title_terms(titles, keys)
+    title_weights = tf * np.where(found, idf[terms] if len(idf) else 0, np.log(1 + page_count) + 1)
+    title_norms = np.sqrt(np.bincount(rows, weights=title_weights * title_weights, minlength=len(titles)))
+    title_norms[title_norms == 0] = 1
+    title_weights /= title_norms[rows]
+    rows, terms, title_weights = rows[found], terms[found], title_weights[found]
+
+    scores = np.zeros((len(titles), width))
+    lengths = df[terms]
+    ends = np.cumsum(lengths)
+    start = 0
+    while start < len(rows):
+        # 펼친 곱의 수가 CHUNK_ENTRIES를 넘지 않게 나눠 누적 (메모리 상한)
+        stop = max(int(np.searchsorted(ends, ends[start] - lengths[start] + CHUNK_ENTRIES, side="right")), start + 1)
+        chunk_lengths = lengths[start:stop]
+        total = int(chunk_lengths.sum())
+        if total:
+            first = offsets[terms[start:stop]] - (np.cumsum(chunk_lengths) - chunk_lengths)
+            postings = np.arange(total) + np.repeat(first, chunk_lengths)
+            flat = np.repeat(rows[start:stop], chunk_lengths) * width + pages[postings]
+            scores += np.bincount(
+                flat,
+                weights=np.repeat(title_weights[start:stop], chunk_lengths) * weights[postings],
+                minlength=scores.size
+            ).reshape(scores.shape)
+        start = stop
+    return scores
+
+
+def monotone_pages(scores: np.ndarray) -> np.ndarray:
+    """
+    목차 순서대로 페이지가 줄어들지 않는 배정 중 점수 합이 최대인 것 (동적 계획법)
+    - best[p] = 현재 목차까지 마지막 페이지가 p일 때 최대 합, 이전 목차는 p 이하의 최댓값 위치
+    """
+    count, width = scores.shape
+    if count == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    columns = np.arange(width)
+    back = np.zeros((count, width), dtype=np.int32)
+    best = scores[0].copy()
+    for i in range(1, count):
+        prefix_best = np.maximum.accumulate(best)
+        back[i] = np.maximum.accumulate(np.where(best == prefix_best, columns, 0))
+        best = prefix_best + scores[i]
+
+    assigned = np.zeros(count, dtype=np.int64)
+    assigned[-1] = int(np.argmax(best))
+    for i in range(count - 1, 0, -1):
+        assigned[i - 1] = back[i, assigned[i]]
+    return assigned
+
+
+def compute_auto_mapping(
+    index_arrays: Tuple,
+    page_count: int,
+    titles: Sequence[str],
+    anchors: Sequence[Optional[int]],
+    top_k: int
+) -> Dict[str, np.ndarray]:
+    """유사도 행렬 계산 후 순서 제약 배정과 목차별 상위 후보 반환 (스레드 풀에서 실행)"""
+    scores = score_matrix(index_arrays, page_count, titles)
+    scores[:, 0] = -np.inf
+
+    constrained = scores.copy()
+    for i, page in enumerate(anchors):
+        if page is not None and 1 <= page <= page_count:
+            constrained[i, page] += ANCHOR_BONUS
+    assigned = monotone_pages(constrained)
+
+    k = min(top_k, page_count)
+    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k] if k else np.zeros((len(titles), 0), dtype=np.int64)
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=1), axis=1)
+    candidates = np.take_along_axis(candidates, order, axis=1)
+    return {
+        "assigned": assigned,
+        "assigned_scores": scores[np.arange(len(titles)), assigned],
+        "candidates": candidates,
+        "candidate_scores": np.take_along_axis(scores, candidates, axis=1)
+    }
+
+
+class ChapterAutoMappingService:
+    """
+    목차-교재 페이지 자동 매핑 서비스
+
+    교재 검색 색인의 페이지 벡터와 목차 제목 벡터(음절 2-gram TF-IDF)의 코사인 유사도를
+    NumPy로 한 번에 계산하고, 목차 순서에서 페이지가 줄어들지 않도록 배정한다.
+    결과의 mappings는 그대로 /chapters/bulk-textbook-mapping에 보낼 수 있다.
+    """
+
+    @staticmethod
+    async def suggest(
+        session: Session,
+        textbook: Textbook,
+        executor,
+        min_score: float = 0.1,
+        top_k: int = 3,
+        keep_existing: bool = True
+    ) -> Dict:
+        """목차별 추천 페이지와 상위 후보"""
+        chapters = toc_order(list(
+            session.exec(select(Chapter).where(Chapter.subject_id == textbook.subject_id)).all()
+        ))
+        async with SearchIndexService.open_index(session, textbook, executor) as index:
+            if not chapters or not index.page_count:
+                return {"textbook_id": textbook.id, "suggestions": [], "mappings": []}
+
+            anchors = [chapter.textbook_page if keep_existing else None for chapter in chapters]
+            result = await run_in_threadpool(
+                compute_auto_mapping,
+                index.arrays(),
+                index.page_count,
+                [chapter.title for chapter in chapters],
+                anchors,
+                top_k
+            )
+
+        suggestions = []
+        mappings = []
+        for i, chapter in enumerate(chapters):
+            score = float(result["assigned_scores"][i])
+            page = int(result["assigned"][i])
+            if keep_existing and chapter.textbook_page is not None:
+                page = chapter.textbook_page
+            elif score < min_score:
+                page = None
+            suggestions.append({
+                "chapter_id": chapter.id,
+                "title": chapter.title,
+                "depth": chapter.depth,
+                "current_page": chapter.textbook_page,
+                "page": page,
+                "score": round(score, 4),
+                "candidates": [
+                    {"page": int(candidate), "score": round(float(candidate_score), 4)}
+                    for candidate, candidate_score in zip(result["candidates"][i], result["candidate_scores"][i])
+                    if candidate_score > 0
+                ]
+            })
+            if page is not None and page != chapter.textbook_page:
+                mappings.append({"chapter_id": chapter.id, "textbook_page": page})
+
+        return {"textbook_id": textbook.id, "suggestions": suggestions, "mappings": mappings}
@@ -1,17 +1,61 @@
+from collections import Counter
+from datetime import datetime
 from typing import List, Optional, Dict
-from uuid import UUID
-from sqlmodel import Session, select
+from uuid import UUID, uuid4
+from sqlmodel import Session, select, func
+from sqlalchemy import insert
 from fastapi import HTTPException, status
 
 from app.models.chapter import Chapter
 from app.models.subject import Subject
+from app.models.textbook import Textbook
 from app.models.certificate import Certificate
 from app.schemas.chapter import ChapterCreate, ChapterUpdate, ChapterMappingUpdate, ChapterVideoMappingUpdate
+from app.services.validation_counter_service import ValidationCounterService
+
+
+MAX_CHAPTER_DEPTH = 2  # 0=장, 1=절, 2=소단원
+
+
+def outline_to_chapters(outline: List[Dict], total_pages: int, max_depth: int = MAX_CHAPTER_DEPTH) -> List[Dict]:
+    """
+    PDF outline(제목, 페이지, 깊이) -> 목차 행 목록 (목차 순서)
+    - max_depth보다 깊은 항목은 제외하고, 중간 깊이를 건너뛴 항목은 바로 위 항목의 하위로 맞춤
+    - id/parent_id를 미리 정해 두어 한 번의 INSERT로 트리 전체를 넣을 수 있음
+    """
+    rows: List[Dict] = []
+    stack: List[Dict] = []  # 깊이별 마지막 행 (현재 경로)
+    next_order: Dict = {}
+    for item in outline:
+        depth = min(int(item.get("depth") or 0), len(stack))
+        if depth > max_depth:
+            continue
+        del stack[depth:]
+        parent_id = stack[-1]["id"] if stack else None
+
+        page = item.get("page")
+        if not page or page < 1 or (total_pages and page > total_pages):
+            page = None
+        title = str(item.get("title") or "").strip()[:200] or "(제목 없음)"
+
+        row = {
+            "id": uuid4(),
+            "parent_id": parent_id,
+            "title": title,
+            "order_index": next_order.get(parent_id, 0),
+            "depth": depth,
+            "textbook_page": page
+        }
+        next_order[parent_id] = row["order_index"] + 1
+        stack.append(row)
+        rows.append(row)
+    return rows
 
 
 class ChapterService:
     def __init__(self, session: Session):
         self.session = session
+        self.counters = ValidationCounterService(session)
 
     def _verify_subject_ownership(self, subject_id: UUID, creator_id: UUID) -> Subject:
         """과목 소유권 확인"""
@@ -81,12 +125,17 @@ class ChapterService:
         
         return tree
 
-    def get_by_id(self, chapter_id: UUID, creator_id: UUID) -> Optional[Chapter]:
-        """목차 ID로 조회"""
+    def get_by_id(self, chapter_id: UUID, creator_id: UUID, for_update: bool = False) -> Optional[Chapter]:
+        """
+        목차 ID로 조회
+        - for_update: 수정/삭제 전 행 잠금 (변경 전 상태로 검수 카운터를 증감하므로 동시 수정 시 어긋남 방지)
+        """
         statement = select(Chapter).join(Subject).join(Certificate).where(
             Chapter.id == chapter_id,
             Certificate.creator_id == creator_id
         )
+        if for_update:
+            statement = statement.with_for_update(of=Chapter).execution_options(populate_existing=True)
         return self.session.exec(statement).first()
 
     def create(self, subject_id: UUID, data: ChapterCreate, creator_id: UUID) -> Chapter:
@@ -112,13 +161,14 @@ class ChapterService:
             depth=depth
         )
         self.session.add(chapter)
+        self.counters.apply(subject_id, self.counters.chapter_state(None, None))
         self.session.commit()
         self.session.refresh(chapter)
         return chapter
 
     def update(self, chapter_id: UUID, data: ChapterUpdate, creator_id: UUID) -> Chapter:
         """목차 수정"""
-        chapter = self.get_by_id(chapter_id, creator_id)
+        chapter = self.get_by_id(chapter_id, creator_id, for_update=True)
         if not chapter:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -135,13 +185,14 @@ class ChapterService:
             setattr(chapter, key, value)
         
         self.session.add(chapter)
+        self.counters.bump_version(chapter.subject_id)
         self.session.commit()
         self.session.refresh(chapter)
         return chapter
 
     def delete(self, chapter_id: UUID, creator_id: UUID) -> bool:
         """목차 삭제 (하위 목차도 함께 삭제)"""
-        chapter = self.get_by_id(chapter_id, creator_id)
+        chapter = self.get_by_id(chapter_id, creator_id, for_update=True)
         if not chapter:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -149,18 +200,25 @@ class ChapterService:
             )
         
         # 하위 목차 재귀 삭제
-        self._delete_children(chapter_id)
+        removed = self._delete_children(chapter_id)
+        removed.update(self.counters.chapter_state(chapter.textbook_page, chapter.video_id))
         self.session.delete(chapter)
+        self.counters.apply(chapter.subject_id, self.counters.diff(removed, Counter()))
         self.session.commit()
         return True
 
-    def _delete_children(self, parent_id: UUID):
-        """하위 목차 재귀 삭제"""
-        statement = select(Chapter).where(Chapter.parent_id == parent_id)
+    def _delete_children(self, parent_id: UUID) -> Counter:
+        """하위 목차 재귀 삭제 (삭제된 목차의 카운터 기여값 반환)"""
+        removed = Counter()
+        statement = select(Chapter).where(
+            Chapter.parent_id == parent_id
+        ).with_for_update().execution_options(populate_existing=True)
         children = self.session.exec(statement).all()
         for child in children:
-            self._delete_children(child.id)
+            removed.update(self._delete_children(child.id))
+            removed.update(self.counters.chapter_state(child.textbook_page, child.video_id))
             self.session.delete(child)
+        return removed
 
     def update_textbook_mapping(
         self, 
@@ -169,15 +227,20 @@ class ChapterService:
         creator_id: UUID
     ) -> Chapter:
         """목차-교재 매핑 수정"""
-        chapter = self.get_by_id(chapter_id, creator_id)
+        chapter = self.get_by_id(chapter_id, creator_id, for_update=True)
         if not chapter:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="목차를 찾을 수 없습니다"
             )
         
+        before = self.counters.chapter_state(chapter.textbook_page, chapter.video_id)
         chapter.textbook_page = data.textbook_page
         self.session.add(chapter)
+        self.counters.apply(
+            chapter.subject_id,
+            self.counters.diff(before, self.counters.chapter_state(chapter.textbook_page, chapter.video_id))
+        )
         self.session.commit()
         self.session.refresh(chapter)
         return chapter
@@ -189,16 +252,21 @@ class ChapterService:
         creator_id: UUID
     ) -> Chapter:
         """목차-영상 매핑 수정"""
-        chapter = self.get_by_id(chapter_id, creator_id)
+        chapter = self.get_by_id(chapter_id, creator_id, for_update=True)
         if not chapter:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="목차를 찾을 수 없습니다"
             )
         
+        before = self.counters.chapter_state(chapter.textbook_page, chapter.video_id)
         chapter.video_id = data.video_id
         chapter.video_start_seconds = data.video_start_seconds
         self.session.add(chapter)
+        self.counters.apply(
+            chapter.subject_id,
+            self.counters.diff(before, self.counters.chapter_state(chapter.textbook_page, chapter.video_id))
+        )
         self.session.commit()
         self.session.refresh(chapter)
         return chapter
@@ -213,6 +281,7 @@ class ChapterService:
         self._verify_subject_ownership(subject_id, creator_id)
         
         created_chapters = []
+        delta = Counter()
         for data in chapters_data:
             depth = self._calculate_depth(data.parent_id)
             chapter = Chapter(
@@ -224,13 +293,83 @@ class ChapterService:
             )
             self.session.add(chapter)
             created_chapters.append(chapter)
+            delta.update(self.counters.chapter_state(None, None))
         
+        self.counters.apply(subject_id, delta)
         self.session.commit()
         for chapter in created_chapters:
             self.session.refresh(chapter)
         
         return created_chapters
 
+    def _outline_rows(self, textbook: Textbook, max_depth: int) -> List[Dict]:
+        """교재의 PDF outline을 목차 행으로 변환 (교재 소유권은 호출자가 확인)"""
+        if textbook.outline is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="PDF 분석이 끝난 뒤 목차를 가져올 수 있습니다"
+            )
+        rows = outline_to_chapters(textbook.outline, textbook.total_pages, max_depth)
+        if not rows:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="PDF에 목차(책갈피)가 없습니다"
+            )
+        return rows
+
+    def preview_outline(self, textbook: Textbook, max_depth: int = MAX_CHAPTER_DEPTH) -> Dict:
+        """교재 PDF outline으로 만들 목차 트리 미리보기 (저장하지 않음)"""
+        rows = self._outline_rows(textbook, max_depth)
+        
+        nodes = {row["id"]: {**row, "children": []} for row in rows}
+        tree = []
+        for node in nodes.values():
+            if node["parent_id"] is None:
+                tree.append(node)
+            else:
+                nodes[node["parent_id"]]["children"].append(node)
+        
+        return {
+            "textbook_id": textbook.id,
+            "total_count": len(rows),
+            "mapped_count": sum(1 for row in rows if row["textbook_page"] is not None),
+            "chapters": tree
+        }
+
+    def import_outline(self, textbook: Textbook, max_depth: int = MAX_CHAPTER_DEPTH) -> List[Chapter]:
+        """
+        교재 PDF outline으로 교재 과목에 목차 일괄 생성 (depth, textbook_page 포함)
+        - 기존 목차가 있으면 그 뒤에 이어 붙임
+        - 전체 트리를 한 번의 INSERT(executemany)로 저장
+        """
+        rows = self._outline_rows(textbook, max_depth)
+        subject_id = textbook.subject_id
+        
+        last_order = self.session.exec(
+            select(func.max(Chapter.order_index)).where(
+                Chapter.subject_id == subject_id,
+                Chapter.parent_id.is_(None)
+            )
+        ).one()
+        offset = last_order + 1 if last_order is not None else 0
+        
+        now = datetime.utcnow()
+        delta = Counter()
+        for row in rows:
+            row["subject_id"] = subject_id
+            row["created_at"] = now
+            if row["parent_id"] is None:
+                row["order_index"] += offset
+            delta.update(self.counters.chapter_state(row["textbook_page"], None))
+        
+        self.session.execute(insert(Chapter), rows)
+        self.counters.apply(subject_id, delta)
+        self.session.commit()
+        
+        ids = [row["id"] for row in rows]
+        chapters = {c.id: c for c in self.session.exec(select(Chapter).where(Chapter.id.in_(ids))).all()}
+        return [chapters[chapter_id] for chapter_id in ids]
+
     def bulk_update_textbook_mapping(
         self,
         subject_id: UUID,
@@ -240,24 +379,30 @@ class ChapterService:
         """목차-교재 매핑 일괄 수정"""
         self._verify_subject_ownership(subject_id, creator_id)
         
+        # 변경 전 상태를 읽기 전에 대상 목차를 id 순서로 한 번에 잠금 (교착 방지)
+        # (과목 소유권은 위에서 확인했으므로 같은 과목의 목차만 대상)
+        ids = [mapping.get("chapter_id") for mapping in mappings]
+        statement = select(Chapter).where(
+            Chapter.id.in_(ids),
+            Chapter.subject_id == subject_id
+        ).order_by(Chapter.id).with_for_update().execution_options(populate_existing=True)
+        chapters = {chapter.id: chapter for chapter in self.session.exec(statement).all()}
+        
         updated_count = 0
+        delta = Counter()
         for mapping in mappings:
             chapter_id = mapping.get("chapter_id")
             textbook_page = mapping.get("textbook_page")
             
-            chapter = self.session.get(Chapter, chapter_id)
-            if chapter and chapter.subject_id == subject_id:
-                # 소유권 확인
-                statement = select(Chapter).join(Subject).join(Certificate).where(
-                    Chapter.id == chapter_id,
-                    Certificate.creator_id == creator_id
-                )
-                verified_chapter = self.session.exec(statement).first()
-                if verified_chapter:
-                    chapter.textbook_page = textbook_page
-                    self.session.add(chapter)
-                    updated_count += 1
+            chapter = chapters.get(chapter_id)
+            if chapter:
+                delta.subtract(self.counters.chapter_state(chapter.textbook_page, chapter.video_id))
+                chapter.textbook_page = textbook_page
+                delta.update(self.counters.chapter_state(chapter.textbook_page, chapter.video_id))
+                self.session.add(chapter)
+                updated_count += 1
         
+        self.counters.apply(subject_id, delta)
         self.session.commit()
         return updated_count
 
@@ -0,0 +1,267 @@
+"""교재 목차별 PDF 분할 서비스"""
+import asyncio
+import fcntl
+import os
+import shutil
+from datetime import datetime
+from typing import IO, Dict, List
+from uuid import UUID
+from fastapi import HTTPException, status
+from sqlmodel import Session, select, delete
+from sqlalchemy import insert
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import engine
+from app.models.chapter import Chapter
+from app.models.textbook import Textbook, TextbookChapterFile
+from app.services.file_service import FileService
+from app.services.pdf_page_service import split_pdf_ranges
+
+
+def toc_order(chapters: List[Chapter]) -> List[Chapter]:
+    """목차를 트리 전위 순회 순서(화면 목차 순서)로 정렬"""
+    children: Dict = {}
+    for chapter in chapters:
+        children.setdefault(chapter.parent_id, []).append(chapter)
+
+    ordered: List[Chapter] = []
+
+    def walk(parent_id) -> None:
+        for chapter in sorted(children.get(parent_id, []), key=lambda c: c.order_index):
+            ordered.append(chapter)
+            walk(chapter.id)
+
+    walk(None)
+    return ordered
+
+
+def compute_chapter_ranges(chapters: List[Chapter], total_pages: int, max_depth: int = 0) -> List[Dict]:
+    """
+    목차별 페이지 범위 계산
+    - 시작은 목차의 textbook_page, 끝은 같은 깊이 이하인 다음 목차의 시작 페이지 - 1
+      (다음 목차가 같은 페이지에서 시작하면 그 페이지까지, 없으면 마지막 페이지까지)
+    - max_depth보다 깊은 목차는 따로 분할하지 않고 상위 목차 범위에 포함
+    """
+    mapped = [
+        chapter for chapter in toc_order(chapters)
+        if chapter.textbook_page and 1 <= chapter.textbook_page <= total_pages
+    ]
+
+    ranges = []
+    for i, chapter in enumerate(mapped):
+        if chapter.depth > max_depth:
+            continue
+        next_page = next(
+            (other.textbook_page for other in mapped[i + 1:] if other.depth <= chapter.depth),
+            total_pages + 1
+        )
+        ranges.append({
+            "chapter_id": chapter.id,
+            "title": chapter.title,
+            "depth": chapter.depth,
+            "from_page": chapter.textbook_page,
+            "to_page": max(chapter.textbook_page, next_page - 1)
+        })
+    return ranges
+
+
+class ChapterSplitService:
+    """
+    교재 목차별 PDF 분할 서비스
+
+    목차에 매핑된 페이지로 범위를 계산해 목차마다 PDF 하나를 만든다. 범위는 워커 수만큼
+    나눠 프로세스 풀에서 병렬로 쓰고(워커당 원본은 한 번만 연다), 결과는
+    textbook_chapter_files에 등록한다. 파일은 PROTECTED_UPLOAD_DIR 아래에 두고
+    권한 확인 경로로만 제공한다.
+    """
+
+    # 이 프로세스에서 분할 중인 교재별 잠금 파일 (POSIX 잠금은 프로세스 단위라 같은 프로세스의
+    # 두 번째 요청은 lockf로 막을 수 없고, 그 요청이 같은 파일을 닫으면 잠금까지 풀리므로 먼저 확인)
+    _locks: Dict[UUID, IO] = {}
+
+    @staticmethod
+    def directory_for(textbook_id: UUID) -> str:
+        return f"{settings.UPLOAD_DIR}/{settings.PROTECTED_UPLOAD_DIR}/chapters/{textbook_id}"
+
+    @staticmethod
+    def file_url_for(textbook_id: UUID, chapter_id: UUID) -> str:
+        return f"/uploads/{settings.PROTECTED_UPLOAD_DIR}/chapters/{textbook_id}/{chapter_id}.pdf"
+
+    @staticmethod
+    def acquire(textbook_id: UUID) -> None:
+        """
+        교재 분할 잠금 (같은 교재의 분할이 동시에 실행되면 서로의 결과 파일을 정리해 버리므로 409)
+        - 프로세스 사이: lockf 잠금 (flock과 달리 fork된 분할 워커에 상속되지 않음)
+        - 같은 프로세스 안: 잠금 파일을 열기 전에 _locks로 확인
+        """
+        if textbook_id in ChapterSplitService._locks:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="이 교재의 목차별 PDF를 만드는 중입니다. 잠시 후 다시 시도하세요"
+            )
+        directory = ChapterSplitService.directory_for(textbook_id)
+        os.makedirs(directory, exist_ok=True)
+        lock_file = open(f"{directory}/.lock", "a")
+        try:
+            fcntl.lockf(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (BlockingIOError, PermissionError):
+            # 이 프로세스는 이 파일에 잠금을 갖고 있지 않으므로 닫아도 다른 잠금에 영향 없음
+            lock_file.close()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="이 교재의 목차별 PDF를 만드는 중입니다. 잠시 후 다시 시도하세요"
+            )
+        ChapterSplitService._locks[textbook_id] = lock_file
+
+    @staticmethod
+    def release(textbook_id: UUID) -> None:
+        lock_file = ChapterSplitService._locks.pop(textbook_id, None)
+        if lock_file:
+            lock_file.close()
+
+    @staticmethod
+    def start(session: Session, textbook: Textbook, max_depth: int = 0) -> List[Dict]:
+        """
+        목차별 PDF 생성 준비 (요청 안에서 실행)
+        - 범위를 계산하고 교재 분할 잠금을 잡은 뒤 범위 목록 반환
+        - 반환 후 run을 BackgroundTasks로 실행해야 잠금이 풀림
+        """
+        source_path = FileService.local_path(textbook.file_url)
+        if not source_path or not os.path.exists(source_path):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="교재 파일을 찾을 수 없습니다"
+            )
+        if not textbook.total_pages:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="교재 페이지 수를 알 수 없습니다. PDF 분석이 끝난 뒤 다시 시도하세요"
+            )
+
+        chapters = session.exec(select(Chapter).where(Chapter.subject_id == textbook.subject_id)).all()
+        ranges = compute_chapter_ranges(list(chapters), textbook.total_pages, max_depth)
+        if not ranges:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="교재 페이지가 매핑된 목차가 없습니다"
+            )
+
+        ChapterSplitService.acquire(textbook.id)
+        return ranges
+
+    @staticmethod
+    async def run(textbook_id: UUID, file_url: str, ranges: List[Dict], executor, workers: int) -> None:
+        """목차별 PDF 생성 후 등록, 기존 분할 결과는 교체 (BackgroundTasks에서 실행, 끝나면 잠금 해제)"""
+        try:
+            await ChapterSplitService._split_locked(
+                textbook_id, FileService.local_path(file_url),
+                ChapterSplitService.directory_for(textbook_id), ranges, executor, workers
+            )
+        except Exception:
+            # 실패하면 기존 분할 결과를 그대로 둠 (다시 요청하면 재시도)
+            pass
+        finally:
+            ChapterSplitService.release(textbook_id)
+
+    @staticmethod
+    async def _split_locked(
+        textbook_id: UUID,
+        source_path: str,
+        directory: str,
+        ranges: List[Dict],
+        executor,
+        workers: int
+    ) -> None:
+        """교재별 잠금을 잡은 상태에서 분할/등록/정리"""
+        jobs = [
+            (f"{directory}/{item['chapter_id']}.pdf", item["from_page"], item["to_page"])
+            for item in ranges
+        ]
+
+        # 번갈아 나눠 워커별 페이지 양을 비슷하게 맞춤
+        workers = max(1, min(workers, len(jobs)))
+        batches = [list(range(i, len(jobs), workers)) for i in range(workers)]
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(executor, split_pdf_ranges, source_path, [jobs[j] for j in batch])
+            for batch in batches
+        ])
+        for batch, sizes in zip(batches, results):
+            for j, size in zip(batch, sizes):
+                ranges[j]["file_size"] = size
+
+        await run_in_threadpool(ChapterSplitService._register, textbook_id, ranges)
+
+        # 더 이상 매핑되지 않은 목차의 이전 파일 정리
+        current = {os.path.basename(job[0]) for job in jobs}
+        for name in os.listdir(directory):
+            # 잠금 파일과 쓰는 중인 임시 파일(.part)은 그대로 둠
+            if name.endswith(".pdf") and name not in current:
+                try:
+                    os.remove(f"{directory}/{name}")
+                except FileNotFoundError:
+                    pass
+
+    @staticmethod
+    def _register(textbook_id: UUID, ranges: List[Dict]) -> None:
+        """분할 결과를 textbook_chapter_files에 교체 등록"""
+        now = datetime.utcnow()
+        with Session(engine) as session:
+            session.exec(delete(TextbookChapterFile).where(TextbookChapterFile.textbook_id == textbook_id))
+            session.execute(insert(TextbookChapterFile), [
+                {
+                    "textbook_id": textbook_id,
+                    "chapter_id": item["chapter_id"],
+                    "from_page": item["from_page"],
+                    "to_page": item["to_page"],
+                    "file_url": ChapterSplitService.file_url_for(textbook_id, item["chapter_id"]),
+                    "file_size": item["file_size"],
+                    "created_at": now
+                }
+                for item in ranges
+            ])
+            session.commit()
+
+    @staticmethod
+    def list_files(session: Session, textbook_id: UUID) -> List[Dict]:
+        """등록된 목차별 PDF 목록 (시작 페이지 순)"""
+        statement = select(TextbookChapterFile, Chapter.title, Chapter.depth).join(
+            Chapter, Chapter.id == TextbookChapterFile.chapter_id
+        ).where(
+            TextbookChapterFile.textbook_id == textbook_id
+        ).order_by(TextbookChapterFile.from_page, Chapter.depth)
+        return [
+            {
+                "chapter_id": chapter_file.chapter_id,
+                "title": title,
+                "depth": depth,
+                "from_page": chapter_file.from_page,
+                "to_page": chapter_file.to_page,
+                "file_size": chapter_file.file_size,
+                "created_at": chapter_file.created_at
+            }
+            for chapter_file, title, depth in session.exec(statement).all()
+        ]
+
+    @staticmethod
+    def get_file(session: Session, textbook_id: UUID, chapter_id: UUID) -> Dict:
+        """목차 PDF의 file_url과 목차 제목"""
+        statement = select(TextbookChapterFile.file_url, Chapter.title).join(
+            Chapter, Chapter.id == TextbookChapterFile.chapter_id
+        ).where(
+            TextbookChapterFile.textbook_id == textbook_id,
+            TextbookChapterFile.chapter_id == chapter_id
+        )
+        row = session.exec(statement).first()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="목차 PDF를 찾을 수 없습니다"
+            )
+        return {"file_url": row[0], "title": row[1]}
+
+    @staticmethod
+    def delete_files(textbook_id: UUID) -> None:
+        """교재의 목차별 PDF 파일 삭제 (등록 행은 FK CASCADE로 삭제)"""
+        shutil.rmtree(ChapterSplitService.directory_for(textbook_id), ignore_errors=True)
@@ -0,0 +1,285 @@
+"""모의고사 출제 서비스"""
+import random
+import secrets
+from typing import List, Dict, Optional, Set, Tuple
+from uuid import UUID
+from sqlmodel import Session, select
+from sqlalchemy import values, column, true, Integer, Uuid
+from sqlalchemy.orm import aliased
+from fastapi import HTTPException, status
+
+from app.models.subject import Subject
+from app.models.certificate import Certificate
+from app.models.chapter import Chapter
+from app.models.question import Question
+from app.models.validation_counter import SubjectValidationCounter
+from app.schemas.exam import ExamGenerateRequest
+
+
+class ExamService:
+    """
+    모의고사 출제 서비스
+
+    ORDER BY random()으로 문제 은행 전체를 정렬하지 않는다.
+    무작위 UUID 피벗마다 (subject_id, id) / (chapter_id, id) 인덱스에서
+    "피벗 이상인 첫 번째 id"를 찾아 뽑으므로 비용이 출제 문항 수에만 비례한다.
+
+    피벗 방식은 균등 추출이 아니다. 각 문제가 뽑힐 확률은 바로 앞 id와의 간격에
+    비례하므로(간격이 큰 id일수록 자주 뽑힘) 문제가 적을수록 치우침이 커지고,
+    피벗으로 채우지 못한 부족분은 id가 작은 문제부터 채운다. 그래서 층의 문제 수가
+    SMALL_POOL_ROWS 이하이면 피벗 대신 ID 전체를 읽어 seed 기반으로 균등 추출한다.
+    과목 층의 문제 수는 검수 카운터(subject_validation_counters.question_count)로
+    바로 알 수 있어 큰 과목은 세지 않고 피벗으로 간다. 목차 층은 하위 목차까지 포함하며
+    ID를 SMALL_POOL_ROWS + 1개까지만 읽어 작은 층인지 판단한다.
+    """
+
+    # 중복/범위 밖 피벗을 보충하기 위한 재시도 횟수와 초과 추출 배수
+    SAMPLING_ROUNDS = 3
+    OVERSAMPLE_FACTOR = 2
+    # 이 수 이하의 층은 ID를 모두 읽어 균등 추출 (피벗 치우침 회피)
+    SMALL_POOL_ROWS = 10_000
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _resolve_quotas(self, data: ExamGenerateRequest) -> Dict[UUID, int]:
+        """출제 할당 정리 및 총 문항 수 확인"""
+        quotas: Dict[UUID, int] = {}
+        for quota in data.quotas:
+            quotas[quota.target_id] = quotas.get(quota.target_id, 0) + quota.count
+
+        if sum(quotas.values()) > data.question_count:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="할당된 문항 수의 합이 총 문항 수를 초과합니다"
+            )
+        return quotas
+
+    def _subject_pool_sizes(self, subject_ids: List[UUID]) -> Dict[UUID, int]:
+        """과목별 문제 수 (검수 카운터, 카운터 행이 없는 과목은 제외)"""
+        statement = select(
+            SubjectValidationCounter.subject_id,
+            SubjectValidationCounter.question_count
+        ).where(SubjectValidationCounter.subject_id.in_(subject_ids))
+        return dict(self.session.exec(statement).all())
+
+    def _chapter_subtrees(self, chapter_ids: List[UUID]) -> Dict[UUID, List[UUID]]:
+        """목차별 자신과 모든 하위 목차 ID (재귀 CTE 한 번)"""
+        tree = select(
+            Chapter.id.label("chapter_id"),
+            Chapter.id.label("root_id")
+        ).where(
+            Chapter.id.in_(chapter_ids)
+        ).cte("chapter_tree", recursive=True)
+        child = aliased(Chapter)
+        tree = tree.union_all(
+            select(child.id, tree.c.root_id).join(tree, child.parent_id == tree.c.chapter_id)
+        )
+        subtrees: Dict[UUID, List[UUID]] = {chapter_id: [] for chapter_id in chapter_ids}
+        for chapter_id, root_id in self.session.exec(select(tree.c.chapter_id, tree.c.root_id)).all():
+            subtrees[root_id].append(chapter_id)
+        return subtrees
+
+    def _sample_stratum(
+        self,
+        conditions: list,
+        count: int,
+        rng: random.Random,
+        seen: Set[UUID],
+        pool_size: Optional[int] = None
+    ) -> List[UUID]:
+        """
+        조건에 맞는 문제 ID를 count개까지 무작위 추출 (seen에 추가됨)
+        - pool_size: 층의 문제 수 (모르면 None, 이때는 ID를 상한까지 읽어 판단)
+        """
+        # 작은 층: ID 전체에서 균등 추출 (seed로 재현 가능)
+        if pool_size is None or pool_size <= self.SMALL_POOL_ROWS:
+            statement = select(Question.id).where(*conditions).order_by(Question.id).limit(self.SMALL_POOL_ROWS + 1)
+            pool = list(self.session.exec(statement).all())
+            if len(pool) <= self.SMALL_POOL_ROWS:
+                pool = [question_id for question_id in pool if question_id not in seen]
+                chosen = rng.sample(pool, min(count, len(pool)))
+                seen.update(chosen)
+                return chosen
+
+        chosen: List[UUID] = []
+
+        for _ in range(self.SAMPLING_ROUNDS):
+            needed = count - len(chosen)
+            if needed <= 0:
+                break
+
+            pivots = values(
+                column("ord", Integer),
+                column("pivot", Uuid),
+                name="pivots"
+            ).data([
+                (i, UUID(int=rng.getrandbits(128)))
+                for i in range(needed * self.OVERSAMPLE_FACTOR)
+            ])
+
+            # 피벗마다 인덱스 탐색 한 번 (LATERAL ... LIMIT 1)
+            picked = select(Question.id).where(
+                *conditions,
+                Question.id >= pivots.c.pivot
+            )
+            if seen:
+                picked = picked.where(Question.id.notin_(seen))
+            picked = picked.order_by(Question.id).limit(1).lateral("picked")
+
+            statement = select(pivots.c.ord, picked.c.id).select_from(pivots).join(
+                picked, true()
+            ).order_by(pivots.c.ord)
+
+            for row in self.session.exec(statement).all():
+                if row.id in seen:
+                    continue
+                seen.add(row.id)
+                chosen.append(row.id)
+                if len(chosen) >= count:
+                    break
+
+        # 문제 수가 적어 피벗으로 채우지 못한 경우 id 순으로 남은 문제를 채움
+        needed = count - len(chosen)
+        if needed > 0:
+            statement = select(Question.id).where(*conditions)
+            if seen:
+                statement = statement.where(Question.id.notin_(seen))
+            statement = statement.order_by(Question.id).limit(needed)
+            for question_id in self.session.exec(statement).all():
+                seen.add(question_id)
+                chosen.append(question_id)
+
+        return chosen
+
+    def _build_exam(
+        self,
+        strata: List[Tuple[list, int, Optional[int]]],
+        scope: Tuple[list, Optional[int]],
+        data: ExamGenerateRequest,
+        seed: int,
+        rng: random.Random
+    ) -> Dict:
+        """층별 추출 후 시험지 구성"""
+        seen: Set[UUID] = set(data.exclude_ids)
+        chosen: List[UUID] = []
+        shortfall = 0
+
+        for conditions, count, pool_size in strata:
+            picked = self._sample_stratum(conditions, count, rng, seen, pool_size)
+            chosen.extend(picked)
+            shortfall += count - len(picked)
+
+        # 할당량을 채우지 못한 층의 부족분은 전체 범위에서 보충
+        if shortfall > 0:
+            scope_conditions, scope_size = scope
+            chosen.extend(self._sample_stratum(scope_conditions, shortfall, rng, seen, scope_size))
+
+        rng.shuffle(chosen)
+
+        questions = {}
+        if chosen:
+            statement = select(Question).where(Question.id.in_(chosen))
+            questions = {q.id: q for q in self.session.exec(statement).all()}
+
+        items = []
+        for question_id in chosen:
+            question = questions[question_id]
+            items.append({
+                "id": question.id,
+                "subject_id": question.subject_id,
+                "chapter_id": question.chapter_id,
+                "content": question.content,
+                "options": question.options,
+                "textbook_page": question.textbook_page
+            })
+
+        return {
+            "seed": seed,
+            "question_count": len(items),
+            "questions": items
+        }
+
+    def generate_for_subject(self, subject_id: UUID, data: ExamGenerateRequest) -> Dict:
+        """과목 모의고사 생성 (할당: 목차별)"""
+        subject = self.session.get(Subject, subject_id)
+        if not subject:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="과목을 찾을 수 없습니다"
+            )
+
+        quotas = self._resolve_quotas(data)
+        if quotas:
+            statement = select(Chapter.id).where(
+                Chapter.subject_id == subject_id,
+                Chapter.id.in_(quotas.keys())
+            )
+            valid_ids = set(self.session.exec(statement).all())
+            if len(valid_ids) != len(quotas):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="할당 대상 목차가 유효하지 않습니다"
+                )
+
+        seed = data.seed if data.seed is not None else secrets.randbits(31)
+        rng = random.Random(seed)
+
+        # 목차 할당은 하위 목차의 문제까지 포함
+        subtrees = self._chapter_subtrees(list(quotas.keys())) if quotas else {}
+        scope = ([Question.subject_id == subject_id], self._subject_pool_sizes([subject_id]).get(subject_id))
+        strata = [
+            ([Question.chapter_id.in_(subtrees[chapter_id])], count, None)
+            for chapter_id, count in quotas.items()
+        ]
+        remainder = data.question_count - sum(quotas.values())
+        if remainder > 0:
+            strata.append((scope[0], remainder, scope[1]))
+
+        return self._build_exam(strata, scope, data, seed, rng)
+
+    def generate_for_certificate(self, certificate_id: UUID, data: ExamGenerateRequest) -> Dict:
+        """자격증 모의고사 생성 (할당: 과목별, 나머지는 과목에 고르게 배분)"""
+        certificate = self.session.get(Certificate, certificate_id)
+        if not certificate:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="자격증을 찾을 수 없습니다"
+            )
+
+        statement = select(Subject.id).where(
+            Subject.certificate_id == certificate_id
+        ).order_by(Subject.order_index)
+        subject_ids = list(self.session.exec(statement).all())
+
+        quotas = self._resolve_quotas(data)
+        if not set(quotas.keys()) <= set(subject_ids):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="할당 대상 과목이 유효하지 않습니다"
+            )
+
+        seed = data.seed if data.seed is not None else secrets.randbits(31)
+        rng = random.Random(seed)
+
+        counts = {subject_id: quotas.get(subject_id, 0) for subject_id in subject_ids}
+        remainder = data.question_count - sum(quotas.values())
+        if remainder > 0 and subject_ids:
+            base, extra = divmod(remainder, len(subject_ids))
+            for subject_id in subject_ids:
+                counts[subject_id] += base
+            for subject_id in rng.sample(subject_ids, extra):
+                counts[subject_id] += 1
+
+        pool_sizes = self._subject_pool_sizes(subject_ids) if subject_ids else {}
+        strata = [
+            ([Question.subject_id == subject_id], count, pool_sizes.get(subject_id))
+            for subject_id, count in counts.items()
+            if count > 0
+        ]
+        scope = (
+            [Question.subject_id.in_(subject_ids)],
+            sum(pool_sizes.values()) if len(pool_sizes) == len(subject_ids) else None
+        )
+
+        return self._build_exam(strata, scope, data, seed, rng)
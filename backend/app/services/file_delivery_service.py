@@ -0,0 +1,111 @@
+"""업로드 파일 전달(권한 확인 후 프록시 위임) 서비스"""
+import hashlib
+import hmac
+import os
+import time
+from typing import Dict, Optional
+from urllib.parse import quote, urlencode
+from fastapi import HTTPException, status
+from fastapi.responses import Response
+from starlette.datastructures import Headers
+
+from app.core.config import settings
+from app.core.static_files import RangeFileResponse, UploadFiles
+from app.services.file_service import FileService
+
+
+class FileDeliveryService:
+    """
+    업로드 파일 전달 서비스
+
+    권한 확인은 API에서 하고, 실제 전송은 FILE_DELIVERY 설정에 따라
+    - "x-accel": nginx internal location(X_ACCEL_PREFIX)으로 X-Accel-Redirect
+    - "x-sendfile": Apache/Lighttpd X-Sendfile (절대 경로)
+    - "python": 애플리케이션이 직접 전송 (Range 지원)
+    으로 처리한다. 서명된 만료 URL은 인증 헤더를 붙일 수 없는 클라이언트(PDF 뷰어 등)용이다.
+    """
+
+    SIGNED_PATH = "/api/v1/files"
+
+    @staticmethod
+    def _relative_path(file_url: str) -> str:
+        """file_url -> 업로드 폴더 기준 상대 경로 (업로드 파일이 아니면 404)"""
+        file_path = FileService.local_path(file_url)
+        relative_path = file_url[len("/uploads/"):] if file_path else ""
+        parts = relative_path.split("/")
+        if (
+            not relative_path
+            or any(part in ("", ".", "..") or part.startswith("_") for part in parts)
+            or not os.path.isfile(file_path)
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="파일을 찾을 수 없습니다"
+            )
+        return relative_path
+
+    @staticmethod
+    def response(file_url: str, request_headers: Headers, filename: Optional[str] = None) -> Response:
+        """설정된 방식으로 파일 응답 생성"""
+        relative_path = FileDeliveryService._relative_path(file_url)
+        file_path = f"{settings.UPLOAD_DIR}/{relative_path}"
+
+        headers = {"Cache-Control": "private, max-age=3600"}
+        if filename:
+            headers["Content-Disposition"] = f"inline; filename*=utf-8''{quote(filename)}"
+
+        if settings.FILE_DELIVERY == "x-accel":
+            headers["X-Accel-Redirect"] = f"{settings.X_ACCEL_PREFIX.rstrip('/')}/{quote(relative_path)}"
+            return Response(headers=headers, media_type="application/pdf")
+        if settings.FILE_DELIVERY == "x-sendfile":
+            headers["X-Sendfile"] = os.path.abspath(file_path)
+            return Response(headers=headers, media_type="application/pdf")
+
+        stat_result = os.stat(file_path)
+        response = RangeFileResponse(
+            file_path,
+            stat_result,
+            etag=UploadFiles.etag_for(file_path, stat_result),
+            cache_control=headers.pop("Cache-Control"),
+            request_headers=request_headers
+        )
+        response.headers.update(headers)
+        return response
+
+    @staticmethod
+    def _signature(relative_path: str, expires: int) -> str:
+        message = f"{relative_path}:{expires}".encode("utf-8")
+        return hmac.new(settings.SECRET_KEY.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def sign_path(path: str, expires: Optional[int] = None) -> Dict:
+        """경로(파일 또는 디렉토리 키)에 대한 만료 시각과 서명"""
+        if expires is None:
+            expires = int(time.time()) + settings.SIGNED_URL_EXPIRE_SECONDS
+        return {"expires": expires, "signature": FileDeliveryService._signature(path, expires)}
+
+    @staticmethod
+    def verify_path(path: str, expires: int, signature: str) -> None:
+        """서명 확인 (만료되었거나 일치하지 않으면 403)"""
+        expected = FileDeliveryService._signature(path, expires)
+        if expires < time.time() or not hmac.compare_digest(expected, signature):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="만료되었거나 유효하지 않은 링크입니다"
+            )
+
+    @staticmethod
+    def sign(file_url: str) -> Dict:
+        """서명된 만료 URL 생성"""
+        relative_path = FileDeliveryService._relative_path(file_url)
+        signed = FileDeliveryService.sign_path(relative_path)
+        return {
+            "url": f"{FileDeliveryService.SIGNED_PATH}/{quote(relative_path)}?{urlencode(signed)}",
+            "expires_at": signed["expires"]
+        }
+
+    @staticmethod
+    def verify(relative_path: str, expires: int, signature: str) -> str:
+        """서명 확인 후 file_url 반환"""
+        FileDeliveryService.verify_path(relative_path, expires, signature)
+        return f"/uploads/{relative_path}"
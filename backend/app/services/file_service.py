@@ -1,11 +1,27 @@
+import hashlib
+import hmac
 import os
-import uuid
-from datetime import datetime
+import tempfile
+import time
+from typing import BinaryIO, Optional
+from uuid import UUID
 from fastapi import UploadFile, HTTPException, status
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
 
 
 class FileService:
+    """
+    파일 저장 서비스
+
+    파일은 SHA-256 내용 주소로 {subfolder}/ab/cd/<sha256>.<ext>에 저장되므로
+    같은 파일은 한 번만 저장된다. 여러 교재가 같은 file_url을 참조할 수 있어
+    삭제는 참조가 모두 사라졌을 때만 호출한다 (TextbookService.delete).
+    """
+
+    # 업로드 스트리밍 단위 (메모리에는 이 크기만 유지)
+    UPLOAD_CHUNK_SIZE = 1024 * 1024
+
     @staticmethod
     def validate_file(file: UploadFile, allowed_types: set = None) -> None:
         """파일 유효성 검사"""
@@ -20,54 +36,143 @@ class FileService:
                 detail=f"허용되지 않는 파일 형식입니다. 허용: {allowed_types}"
             )
 
+    @staticmethod
+    def file_extension(file_name: str, default_ext: str = "pdf") -> str:
+        """파일 확장자 (소문자)"""
+        return file_name.split(".")[-1].lower() if file_name else default_ext
+
+    @staticmethod
+    def blob_path(subfolder: str, sha256: str, file_ext: str) -> str:
+        """내용 주소 상대 경로 (해시 앞 4자리로 2단계 분산)"""
+        return f"{subfolder}/{sha256[:2]}/{sha256[2:4]}/{sha256}.{file_ext}"
+
+    @staticmethod
+    def blob_subfolder(file_url: str) -> str:
+        """내용 주소 file_url의 하위 폴더 (blob_path의 역)"""
+        return file_url[len("/uploads/"):].rsplit("/", 3)[0]
+
+    @staticmethod
+    def _upload_signature(file_url: str, creator_id: UUID, expires: int) -> str:
+        message = f"upload:{file_url}:{creator_id}:{expires}".encode("utf-8")
+        return hmac.new(settings.SECRET_KEY.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def upload_token(file_url: str, creator_id: UUID) -> str:
+        """
+        업로드한 사용자에게만 발급하는 등록 토큰 (<만료 시각>.<서명>)
+        - 내용 주소 file_url은 해시로 추측할 수 있으므로 교재 등록 시 file_url 대신 이 토큰으로 업로드 여부 확인
+        """
+        expires = int(time.time()) + settings.UPLOAD_TOKEN_EXPIRE_HOURS * 3600
+        return f"{expires}.{FileService._upload_signature(file_url, creator_id, expires)}"
+
+    @staticmethod
+    def verify_upload_token(file_url: str, creator_id: UUID, token: str) -> bool:
+        """이 사용자가 file_url을 업로드하고 받은 토큰인지 (만료 포함)"""
+        expires, _, signature = token.partition(".")
+        if not expires.isdigit() or int(expires) < time.time():
+            return False
+        expected = FileService._upload_signature(file_url, creator_id, int(expires))
+        return hmac.compare_digest(expected, signature)
+
+    @staticmethod
+    def is_protected(file_url: str) -> bool:
+        """공개 경로(/uploads)로 제공하지 않는 파일인지 여부"""
+        return file_url.startswith(f"/uploads/{settings.PROTECTED_UPLOAD_DIR}/")
+
+    @staticmethod
+    def store_blob(temp_path: str, subfolder: str, sha256: str, file_ext: str) -> str:
+        """
+        임시 파일을 내용 주소 경로로 원자적 이동 후 file_url 반환
+        - 같은 내용이 이미 있으면 기존 파일(inode)을 그대로 쓰고 임시 파일은 삭제
+        """
+        relative_path = FileService.blob_path(subfolder, sha256, file_ext)
+        file_path = f"{settings.UPLOAD_DIR}/{relative_path}"
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        if os.path.exists(file_path):
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, file_path)
+        return f"/uploads/{relative_path}"
+
+    @staticmethod
+    def _write_chunk(f: BinaryIO, digest, chunk: bytes) -> None:
+        """청크 기록 및 해시 갱신 (스레드 풀에서 실행)"""
+        f.write(chunk)
+        digest.update(chunk)
+
+    @staticmethod
+    def _sync(f: BinaryIO) -> None:
+        """임시 파일을 디스크에 반영 후 닫기 (스레드 풀에서 실행)"""
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+
     @staticmethod
     async def save_file(
         file: UploadFile, 
         subfolder: str = "textbooks"
     ) -> dict:
-        """파일 저장 후 정보 반환"""
+        """
+        파일 저장 후 정보 반환
+        - UPLOAD_CHUNK_SIZE 단위로 임시 파일에 기록하며 크기 제한과 SHA-256을 누적 계산
+        - 디스크 I/O는 스레드 풀에서 실행하고, 완료 후 내용 주소 경로로 원자적으로 이동
+        """
         # 파일 유효성 검사
         FileService.validate_file(file, {"pdf"} if subfolder == "textbooks" else None)
+        file_ext = FileService.file_extension(file.filename)
         
-        # 고유 파일명 생성
-        file_ext = file.filename.split(".")[-1].lower() if file.filename else "pdf"
-        unique_filename = f"{uuid.uuid4()}_{datetime.now().strftime('%Y%m%d%H%M%S')}.{file_ext}"
-        
-        # 저장 경로
+        # 임시 파일은 원자적 이동을 위해 같은 파일시스템(업로드 폴더)에 생성
         save_dir = f"{settings.UPLOAD_DIR}/{subfolder}"
         os.makedirs(save_dir, exist_ok=True)
-        file_path = f"{save_dir}/{unique_filename}"
-        
-        # 파일 저장
-        content = await file.read()
+        fd, temp_path = tempfile.mkstemp(dir=save_dir, suffix=".part")
         
-        # 파일 크기 확인
-        if len(content) > settings.MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"파일 크기가 너무 큽니다. 최대: {settings.MAX_FILE_SIZE / 1024 / 1024}MB"
+        file_size = 0
+        digest = hashlib.sha256()
+        f = os.fdopen(fd, "wb")
+        try:
+            while chunk := await file.read(FileService.UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                
+                # 파일 크기 확인 (제한을 넘는 즉시 중단)
+                if file_size > settings.MAX_FILE_SIZE:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"파일 크기가 너무 큽니다. 최대: {settings.MAX_FILE_SIZE / 1024 / 1024}MB"
+                    )
+                
+                await run_in_threadpool(FileService._write_chunk, f, digest, chunk)
+            
+            await run_in_threadpool(FileService._sync, f)
+            sha256 = digest.hexdigest()
+            file_url = await run_in_threadpool(
+                FileService.store_blob, temp_path, subfolder, sha256, file_ext
             )
-        
-        with open(file_path, "wb") as f:
-            f.write(content)
-        
-        # 상대 경로를 URL로 반환
-        file_url = f"/uploads/{subfolder}/{unique_filename}"
+        except BaseException:
+            f.close()
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
         
         return {
             "file_url": file_url,
             "file_name": file.filename,
-            "file_size": len(content)
+            "file_size": file_size,
+            "sha256": sha256
         }
 
     @staticmethod
-    def delete_file(file_url: str) -> bool:
-        """파일 삭제"""
-        # URL에서 경로 추출
+    def local_path(file_url: str) -> Optional[str]:
+        """file_url에 해당하는 로컬 경로 (업로드 파일이 아니면 None)"""
         if file_url.startswith("/uploads/"):
-            file_path = file_url.replace("/uploads/", f"{settings.UPLOAD_DIR}/")
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                return True
+            return file_url.replace("/uploads/", f"{settings.UPLOAD_DIR}/", 1)
+        return None
+
+    @staticmethod
+    def delete_file(file_url: str) -> bool:
+        """파일 삭제 (참조하는 교재가 없는지는 호출자가 확인)"""
+        file_path = FileService.local_path(file_url)
+        if file_path and os.path.exists(file_path):
+            os.remove(file_path)
+            return True
         return False
 
@@ -0,0 +1,173 @@
+"""채점 서비스"""
+import threading
+from array import array
+from collections import OrderedDict
+from typing import List, Dict, Optional
+from uuid import UUID
+from sqlmodel import Session, select
+from fastapi import HTTPException, status
+
+from app.models.subject import Subject
+from app.models.certificate import Certificate
+from app.models.question import Question
+from app.models.validation_counter import SubjectValidationCounter
+from app.schemas.grading import GradeAnswer
+
+
+class AnswerKey:
+    """
+    과목 하나의 정답표 (문제 ID -> 배열 인덱스, 정답은 1바이트 배열)
+    - 해설은 길어서 캐시하지 않고 틀린 문항만 채점 때 조회
+    """
+
+    __slots__ = ("index", "answers", "version")
+
+    def __init__(self, rows: list, version: Optional[int]):
+        self.index: Dict[UUID, int] = {}
+        self.answers = array("b")
+        for i, row in enumerate(rows):
+            self.index[row.id] = i
+            self.answers.append(row.correct_answer)
+        self.version = version
+
+
+class AnswerKeyCache:
+    """
+    과목별 정답표 캐시 (프로세스 내, LRU)
+
+    문제 생성/수정/삭제 시 증가하는 과목 내용 버전(SubjectValidationCounter.content_version)을
+    정답표와 함께 저장하고, 조회할 때마다 현재 버전과 비교해 다르면 다시 적재한다.
+    따라서 다른 워커에서의 변경도 다음 채점부터 바로 반영된다.
+    카운터 행이 없는 과목은 버전으로 변경을 알 수 없으므로 캐시하지 않고 매번 적재한다.
+    """
+
+    MAX_SUBJECTS = 256
+
+    def __init__(self):
+        self._keys: "OrderedDict[UUID, AnswerKey]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, session: Session, subject_ids: List[UUID]) -> List[AnswerKey]:
+        """과목들의 정답표 (현재 내용 버전은 한 번의 쿼리로 확인)"""
+        statement = select(
+            SubjectValidationCounter.subject_id,
+            SubjectValidationCounter.content_version
+        ).where(SubjectValidationCounter.subject_id.in_(subject_ids))
+        versions = dict(session.exec(statement).all())
+        return [self.get(session, subject_id, versions.get(subject_id)) for subject_id in subject_ids]
+
+    def get(self, session: Session, subject_id: UUID, version: Optional[int]) -> AnswerKey:
+        """정답표 조회 (없거나 버전이 다르면 한 번의 쿼리로 적재)"""
+        with self._lock:
+            key = self._keys.get(subject_id)
+            if key and version is not None and key.version == version:
+                self._keys.move_to_end(subject_id)
+                return key
+
+        statement = select(
+            Question.id,
+            Question.correct_answer
+        ).where(Question.subject_id == subject_id)
+        # 버전을 먼저 읽었으므로 그 사이 변경이 있어도 다음 조회에서 다시 적재됨
+        key = AnswerKey(session.exec(statement).all(), version)
+        if version is None:
+            return key
+
+        with self._lock:
+            self._keys[subject_id] = key
+            self._keys.move_to_end(subject_id)
+            while len(self._keys) > self.MAX_SUBJECTS:
+                self._keys.popitem(last=False)
+        return key
+
+    def invalidate(self, subject_id: UUID) -> None:
+        """과목 정답표 무효화"""
+        with self._lock:
+            self._keys.pop(subject_id, None)
+
+
+answer_key_cache = AnswerKeyCache()
+
+
+class GradingService:
+    """채점 서비스"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _explanations(self, question_ids: List[UUID]) -> Dict[UUID, Optional[str]]:
+        """문제 해설 (한 번의 IN 쿼리)"""
+        if not question_ids:
+            return {}
+        statement = select(Question.id, Question.explanation).where(Question.id.in_(question_ids))
+        return dict(self.session.exec(statement).all())
+
+    def _grade(self, subject_ids: List[UUID], answers: List[GradeAnswer]) -> Dict:
+        """정답표로 한 번에 채점 (해설은 틀린 문항만)"""
+        keys = answer_key_cache.get_many(self.session, subject_ids)
+
+        def lookup(question_id: UUID):
+            for key in keys:
+                i = key.index.get(question_id)
+                if i is not None:
+                    return key, i
+            return None, None
+
+        items = []
+        correct_count = 0
+        for answer in answers:
+            key, i = lookup(answer.question_id)
+            if key is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"문제를 찾을 수 없습니다: {answer.question_id}"
+                )
+            correct_answer = key.answers[i]
+            is_correct = answer.chosen_index == correct_answer
+            if is_correct:
+                correct_count += 1
+            items.append({
+                "question_id": answer.question_id,
+                "chosen_index": answer.chosen_index,
+                "correct_answer": correct_answer,
+                "is_correct": is_correct,
+                "explanation": None
+            })
+
+        explanations = self._explanations([item["question_id"] for item in items if not item["is_correct"]])
+        for item in items:
+            if not item["is_correct"]:
+                item["explanation"] = explanations.get(item["question_id"])
+
+        total = len(items)
+        return {
+            "total": total,
+            "correct_count": correct_count,
+            "score": round(correct_count / total * 100, 1) if total else 0,
+            "items": items
+        }
+
+    def grade_subject(self, subject_id: UUID, answers: List[GradeAnswer]) -> Dict:
+        """과목 답안 채점"""
+        subject = self.session.get(Subject, subject_id)
+        if not subject:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="과목을 찾을 수 없습니다"
+            )
+        return self._grade([subject_id], answers)
+
+    def grade_certificate(self, certificate_id: UUID, answers: List[GradeAnswer]) -> Dict:
+        """자격증 답안 채점 (여러 과목에 걸친 모의고사)"""
+        certificate = self.session.get(Certificate, certificate_id)
+        if not certificate:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="자격증을 찾을 수 없습니다"
+            )
+
+        statement = select(Subject.id).where(
+            Subject.certificate_id == certificate_id
+        ).order_by(Subject.order_index)
+        subject_ids = list(self.session.exec(statement).all())
+        return self._grade(subject_ids, answers)
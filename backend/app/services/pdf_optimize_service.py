@@ -0,0 +1,117 @@
+"""교재 PDF 최적화(선형화, 이미지 축소, 암호 해제) 서비스"""
+import hashlib
+import io
+import os
+import tempfile
+from typing import Dict, Optional
+import pikepdf
+from pikepdf import Name, PdfImage
+from PIL import Image
+
+
+JPEG_QUALITY = 75
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _downsample_images(pdf: pikepdf.Pdf, max_pixels: int) -> int:
+    """
+    긴 변이 max_pixels를 넘는 RGB/흑백 8bit 이미지를 JPEG로 축소 후 교체
+    - 같은 이미지 객체가 여러 페이지에 쓰여도 한 번만 처리
+    """
+    seen = set()
+    replaced = 0
+    for page in pdf.pages:
+        for _, raw_image in page.images.items():
+            key = raw_image.objgen
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if max(int(raw_image.Width), int(raw_image.Height)) <= max_pixels:
+                continue
+            if raw_image.get(Name.ImageMask, False) or raw_image.get(Name.BitsPerComponent) != 8:
+                continue
+            if raw_image.get(Name.ColorSpace) not in (Name.DeviceRGB, Name.DeviceGray):
+                continue
+
+            try:
+                image = PdfImage(raw_image).as_pil_image()
+            except Exception:
+                continue
+
+            image.thumbnail((max_pixels, max_pixels), Image.LANCZOS)
+            image = image.convert("RGB" if raw_image.ColorSpace == Name.DeviceRGB else "L")
+            buffer = io.BytesIO()
+            image.save(buffer, "JPEG", quality=JPEG_QUALITY, optimize=True)
+
+            raw_image.write(buffer.getvalue(), filter=Name.DCTDecode)
+            raw_image.Width = image.width
+            raw_image.Height = image.height
+            if Name.DecodeParms in raw_image:
+                del raw_image[Name.DecodeParms]
+            replaced += 1
+    return replaced
+
+
+def _save_copy(pdf: pikepdf.Pdf, source_path: str) -> Dict:
+    """선형화된 사본을 원본과 같은 폴더의 임시 파일에 저장 -> {"path", "sha256"}"""
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(source_path), suffix=".part")
+    os.close(fd)
+    try:
+        # 같은 입력이면 같은 결과(내용 주소)가 나오도록 /ID 고정, 암호화는 제거
+        pdf.save(
+            temp_path,
+            linearize=True,
+            compress_streams=True,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+            encryption=False,
+            deterministic_id=True
+        )
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    digest = hashlib.sha256()
+    with open(temp_path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return {"path": temp_path, "sha256": digest.hexdigest()}
+
+
+def optimize_pdf(source_path: str, max_image_pixels: int) -> Optional[Dict]:
+    """
+    선형화(빠른 웹 보기)된 사본 생성 (워커 프로세스에서 실행)
+    - 원본과 같은 폴더의 임시 파일에 저장하고 {"path", "sha256", "images"} 반환
+    - 이미 선형화되어 있고 축소할 이미지도 없으면 None (원본 그대로 사용)
+    """
+    with pikepdf.open(source_path) as pdf:
+        replaced = _downsample_images(pdf, max_image_pixels) if max_image_pixels else 0
+        if pdf.is_linearized and replaced == 0:
+            return None
+        return {**_save_copy(pdf, source_path), "images": replaced}
+
+
+def decrypt_pdf(source_path: str, password: Optional[str] = None) -> Optional[Dict]:
+    """
+    암호를 해제한 선형화 사본 생성 (워커 프로세스에서 실행)
+    - 암호화되지 않았으면 None, 암호가 없거나 틀리면 pikepdf.PasswordError
+    - 권한 암호만 걸린 PDF(빈 사용자 암호)는 암호 없이 해제
+    """
+    with pikepdf.open(source_path, password=password or "") as pdf:
+        if not pdf.is_encrypted:
+            return None
+        return _save_copy(pdf, source_path)
+
+
+def pdf_encryption(source_path: str, password: Optional[str] = None) -> Dict:
+    """
+    암호화 여부와 암호 일치 여부 확인 -> {"encrypted", "password_ok"}
+    - PDF로 열 수 없으면 encrypted는 None
+    """
+    try:
+        with pikepdf.open(source_path, password=password or "") as pdf:
+            return {"encrypted": pdf.is_encrypted, "password_ok": True}
+    except pikepdf.PasswordError:
+        return {"encrypted": True, "password_ok": False}
+    except pikepdf.PdfError:
+        return {"encrypted": None, "password_ok": False}
@@ -0,0 +1,262 @@
+"""교재 페이지(범위) PDF 서비스"""
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import Executor
+from typing import BinaryIO, List, Optional, Tuple
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from pypdf import PdfReader, PdfWriter
+
+from app.core.config import settings
+from app.core.static_files import RangeFileResponse, UploadFiles
+from app.models.textbook import Textbook
+from app.services.file_service import FileService
+
+
+def _write_range(reader: PdfReader, output_path: str, from_page: int, to_page: int) -> int:
+    """열린 PDF의 from_page~to_page(1부터, 양 끝 포함)를 output_path에 저장 후 페이지 수 반환"""
+    total_pages = len(reader.pages)
+    if from_page < 1 or to_page > total_pages or from_page > to_page:
+        raise ValueError(f"잘못된 페이지 범위입니다. PDF는 총 {total_pages}페이지입니다.")
+
+    writer = PdfWriter()
+    for i in range(from_page - 1, to_page):  # 0-index 기반
+        writer.add_page(reader.pages[i])
+
+    # 같은 디렉토리의 임시 파일에 쓴 뒤 원자적으로 이동 (동시 생성 시에도 안전)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(output_path), suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer.write(f)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return to_page - from_page + 1
+
+
+def _open(input_path: str, password: Optional[str]) -> PdfReader:
+    reader = PdfReader(input_path)
+    if reader.is_encrypted and not reader.decrypt(password or ""):
+        raise ValueError("PDF 암호 해제에 실패했습니다")
+    return reader
+
+
+def split_pdf_range(
+    input_path: str,
+    output_path: str,
+    from_page: int,
+    to_page: int,
+    password: Optional[str] = None
+) -> int:
+    """
+    PDF의 from_page~to_page(1부터, 양 끝 포함)를 새 PDF로 저장 후 페이지 수 반환
+    - 잘못된 범위는 ValueError
+    """
+    return _write_range(_open(input_path, password), output_path, from_page, to_page)
+
+
+def split_pdf_ranges(
+    input_path: str,
+    ranges: List[Tuple[str, int, int]],
+    password: Optional[str] = None
+) -> List[int]:
+    """
+    PDF를 한 번 열어 여러 (output_path, from_page, to_page) 범위를 저장 (워커 프로세스에서 실행)
+    - 각 범위의 파일 크기를 순서대로 반환
+    """
+    reader = _open(input_path, password)
+    sizes = []
+    for output_path, from_page, to_page in ranges:
+        _write_range(reader, output_path, from_page, to_page)
+        sizes.append(os.path.getsize(output_path))
+    return sizes
+
+
+class PageCache:
+    """
+    페이지 PDF 디스크 캐시 (LRU, 크기 기반 제거)
+
+    사용 시각은 파일 mtime으로 기록하므로 여러 워커 프로세스가 같은 디렉토리를
+    공유해도 된다. 프로세스별로 추가된 크기를 누적하다가 PAGE_CACHE_MAX_BYTES를
+    넘으면 디렉토리를 훑어 오래된 파일부터 EVICT_TARGET 비율까지 지운다.
+    응답은 파일을 먼저 연 뒤 그 파일로 보내므로 전송 중인 파일이 지워져도 끝까지 전송된다.
+    """
+
+    EVICT_TARGET = 0.9
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._estimated_bytes: Optional[int] = None
+
+    @property
+    def directory(self) -> str:
+        os.makedirs(settings.PAGE_CACHE_DIR, exist_ok=True)
+        return settings.PAGE_CACHE_DIR
+
+    def path_for(self, file_url: str, from_page: int, to_page: int) -> str:
+        key = hashlib.sha256(file_url.encode("utf-8")).hexdigest()[:32]
+        return f"{self.directory}/{key}_{from_page}_{to_page}.pdf"
+
+    def touch(self, path: str) -> bool:
+        """캐시 적중 시 사용 시각 갱신 (없으면 False)"""
+        try:
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _scan(self) -> list:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".pdf"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def added(self, path: str) -> None:
+        """새 파일 추가 후 용량 확인 및 제거"""
+        size = os.path.getsize(path)
+        with self._lock:
+            if self._estimated_bytes is None:
+                self._estimated_bytes = sum(entry[1] for entry in self._scan())
+            else:
+                self._estimated_bytes += size
+            if self._estimated_bytes <= settings.PAGE_CACHE_MAX_BYTES:
+                return
+
+            entries = sorted(self._scan())
+            total = sum(entry[1] for entry in entries)
+            target = settings.PAGE_CACHE_MAX_BYTES * self.EVICT_TARGET
+            for _, entry_size, entry_path in entries:
+                if total <= target:
+                    break
+                if entry_path == path:
+                    continue
+                try:
+                    os.remove(entry_path)
+                    total -= entry_size
+                except FileNotFoundError:
+                    pass
+            self._estimated_bytes = total
+
+
+page_cache = PageCache()
+
+
+class PdfPageService:
+    """교재의 한 페이지 또는 페이지 범위를 작은 PDF로 제공"""
+
+    MAX_PAGE_RANGE = 50
+    OPEN_ATTEMPTS = 3
+
+    @staticmethod
+    def _open_cached(path: str) -> Optional[BinaryIO]:
+        """캐시 파일이 있으면 사용 시각을 갱신하고 열어 반환 (없거나 제거되었으면 None)"""
+        if not page_cache.touch(path):
+            return None
+        try:
+            return open(path, "rb")
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    async def _extract(
+        textbook: Textbook,
+        source_path: str,
+        from_page: int,
+        to_page: int,
+        executor: Executor
+    ) -> BinaryIO:
+        """
+        캐시 파일을 열어 반환, 없으면 추출 후 열기
+        - PDF 추출(CPU)은 executor(프로세스 풀)에서, 캐시 확인/열기는 스레드 풀에서 실행
+        - 응답 전에 열어 두므로 전송 중 다른 요청/워커가 캐시에서 제거해도 끝까지 읽을 수 있음
+        - 추출과 열기 사이에 제거되었으면 다시 추출
+        """
+        loop = asyncio.get_running_loop()
+        path = page_cache.path_for(textbook.file_url, from_page, to_page)
+        for _ in range(PdfPageService.OPEN_ATTEMPTS):
+            file = await run_in_threadpool(PdfPageService._open_cached, path)
+            if file is not None:
+                return file
+            await loop.run_in_executor(
+                executor, split_pdf_range, source_path, path, from_page, to_page
+            )
+            await run_in_threadpool(page_cache.added, path)
+        file = await run_in_threadpool(PdfPageService._open_cached, path)
+        if file is None:
+            raise FileNotFoundError(path)
+        return file
+
+    @staticmethod
+    async def open_range(
+        textbook: Textbook,
+        from_page: int,
+        to_page: Optional[int],
+        executor: Executor
+    ) -> BinaryIO:
+        """페이지 범위 PDF를 연 파일 (캐시 사용, 추출은 executor에서, 호출자가 닫음)"""
+        to_page = to_page or from_page
+        if from_page < 1 or to_page < from_page:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="잘못된 페이지 범위입니다"
+            )
+        if to_page - from_page + 1 > PdfPageService.MAX_PAGE_RANGE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"한 번에 최대 {PdfPageService.MAX_PAGE_RANGE}페이지까지 조회할 수 있습니다"
+            )
+        if textbook.total_pages and to_page > textbook.total_pages:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"잘못된 페이지 범위입니다. 교재는 총 {textbook.total_pages}페이지입니다."
+            )
+
+        source_path = FileService.local_path(textbook.file_url)
+        if not source_path or not os.path.exists(source_path):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="교재 파일을 찾을 수 없습니다"
+            )
+
+        try:
+            return await PdfPageService._extract(
+                textbook, source_path, from_page, to_page, executor
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+    @staticmethod
+    async def range_response(
+        textbook: Textbook,
+        from_page: int,
+        to_page: Optional[int],
+        request_headers: Headers,
+        executor: Executor
+    ) -> RangeFileResponse:
+        """페이지 범위 PDF 응답 (연 파일로 전송하므로 캐시 제거와 무관)"""
+        file = await PdfPageService.open_range(textbook, from_page, to_page, executor)
+        stat_result = os.fstat(file.fileno())
+        response = RangeFileResponse(
+            file.name,
+            stat_result,
+            etag=UploadFiles.etag_for(file.name, stat_result),
+            cache_control="private, max-age=86400",
+            request_headers=request_headers,
+            file=file
+        )
+        last_page = to_page or from_page
+        response.headers["Content-Disposition"] = (
+            f'inline; filename="textbook_{textbook.id}_{from_page}-{last_page}.pdf"'
+        )
+        return response
@@ -0,0 +1,172 @@
+"""문제 내보내기 서비스"""
+import csv
+import io
+import json
+import os
+import tempfile
+from typing import Iterator, List, Optional
+from uuid import UUID
+from sqlmodel import Session, select
+from fastapi import HTTPException, status
+from openpyxl import Workbook
+
+from app.core.database import engine
+from app.models.question import Question
+from app.models.subject import Subject
+
+
+class QuestionExportService:
+    """
+    문제 내보내기 서비스
+
+    서버 측 커서(yield_per)로 EXPORT_BATCH_SIZE개씩 읽어 바로 기록하므로
+    문제 수와 관계없이 워커 메모리가 일정하게 유지된다.
+    스트리밍 도중에는 요청 세션이 이미 닫혀 있으므로 별도 세션을 연다.
+    """
+
+    EXPORT_BATCH_SIZE = 1000
+    MAX_OPTIONS = 5  # QuestionCreate.options 최대 개수
+    XLSX_CHUNK_SIZE = 64 * 1024
+
+    MEDIA_TYPES = {
+        "csv": "text/csv; charset=utf-8",
+        "jsonl": "application/x-ndjson",
+        "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    }
+
+    COLUMNS = [
+        "id",
+        "subject_id",
+        "chapter_id",
+        "order_index",
+        "content",
+        *[f"option_{i + 1}" for i in range(MAX_OPTIONS)],
+        "correct_answer",
+        "explanation",
+        "textbook_page",
+    ]
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _iter_batches(
+        self,
+        subject_id: Optional[UUID] = None,
+        certificate_id: Optional[UUID] = None
+    ) -> Iterator[List[dict]]:
+        """서버 측 커서로 문제를 배치 단위로 조회"""
+        statement = select(
+            Question.id,
+            Question.subject_id,
+            Question.chapter_id,
+            Question.order_index,
+            Question.content,
+            Question.options,
+            Question.correct_answer,
+            Question.explanation,
+            Question.textbook_page
+        )
+        if subject_id is not None:
+            statement = statement.where(
+                Question.subject_id == subject_id
+            ).order_by(Question.order_index, Question.id)
+        else:
+            statement = statement.join(Subject).where(
+                Subject.certificate_id == certificate_id
+            ).order_by(Subject.order_index, Question.subject_id, Question.order_index, Question.id)
+
+        with Session(engine) as session:
+            result = session.exec(
+                statement.execution_options(yield_per=self.EXPORT_BATCH_SIZE)
+            )
+            for partition in result.partitions():
+                batch = []
+                for row in partition:
+                    batch.append({
+                        "id": str(row.id),
+                        "subject_id": str(row.subject_id),
+                        "chapter_id": str(row.chapter_id) if row.chapter_id else None,
+                        "order_index": row.order_index,
+                        "content": row.content,
+                        "options": row.options,
+                        "correct_answer": row.correct_answer,
+                        "explanation": row.explanation,
+                        "textbook_page": row.textbook_page
+                    })
+                yield batch
+
+    def _flatten(self, item: dict) -> list:
+        """한 문제를 표 형식의 한 행으로 변환"""
+        options = item["options"][:self.MAX_OPTIONS]
+        options += [None] * (self.MAX_OPTIONS - len(options))
+        return [
+            item["id"],
+            item["subject_id"],
+            item["chapter_id"],
+            item["order_index"],
+            item["content"],
+            *options,
+            item["correct_answer"],
+            item["explanation"],
+            item["textbook_page"],
+        ]
+
+    def _stream_csv(self, batches: Iterator[List[dict]]) -> Iterator[bytes]:
+        """CSV 스트림 (엑셀 한글 호환을 위해 BOM 포함)"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        buffer.write("\ufeff")
+        writer.writerow(self.COLUMNS)
+        for batch in batches:
+            for item in batch:
+                writer.writerow(self._flatten(item))
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+    def _stream_jsonl(self, batches: Iterator[List[dict]]) -> Iterator[bytes]:
+        """JSON Lines 스트림 (options는 리스트 그대로)"""
+        for batch in batches:
+            yield "".join(
+                json.dumps(item, ensure_ascii=False) + "\n" for item in batch
+            ).encode("utf-8")
+
+    def _stream_xlsx(self, batches: Iterator[List[dict]]) -> Iterator[bytes]:
+        """XLSX 스트림 (write-only 모드로 임시 파일에 기록 후 청크 전송)"""
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("questions")
+        sheet.append(self.COLUMNS)
+        for batch in batches:
+            for item in batch:
+                sheet.append(self._flatten(item))
+
+        fd, path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(fd)
+        try:
+            workbook.save(path)
+            with open(path, "rb") as f:
+                while chunk := f.read(self.XLSX_CHUNK_SIZE):
+                    yield chunk
+        finally:
+            os.remove(path)
+
+    def stream(
+        self,
+        export_format: str,
+        subject_id: Optional[UUID] = None,
+        certificate_id: Optional[UUID] = None
+    ) -> Iterator[bytes]:
+        """형식별 내보내기 스트림 생성"""
+        batches = self._iter_batches(subject_id=subject_id, certificate_id=certificate_id)
+        if export_format == "csv":
+            return self._stream_csv(batches)
+        if export_format == "jsonl":
+            return self._stream_jsonl(batches)
+        if export_format == "xlsx":
+            return self._stream_xlsx(batches)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 형식입니다. 허용: {set(self.MEDIA_TYPES)}"
+        )
@@ -1,17 +1,24 @@
+from collections import Counter
 from typing import List, Optional, Dict
 from uuid import UUID
 from sqlmodel import Session, select, func
+from sqlalchemy import tuple_
+from sqlalchemy.orm import aliased
 from fastapi import HTTPException, status
 
 from app.models.question import Question
+from app.models.chapter import Chapter
 from app.models.subject import Subject
 from app.models.certificate import Certificate
 from app.schemas.question import QuestionCreate, QuestionUpdate, QuestionMappingUpdate
+from app.services.grading_service import answer_key_cache
+from app.services.validation_counter_service import ValidationCounterService
 
 
 class QuestionService:
     def __init__(self, session: Session):
         self.session = session
+        self.counters = ValidationCounterService(session)
 
     def _verify_subject_ownership(self, subject_id: UUID, creator_id: UUID) -> Subject:
         """과목 소유권 확인"""
@@ -46,12 +53,17 @@ class QuestionService:
         statement = statement.order_by(Question.order_index)
         return list(self.session.exec(statement).all())
 
-    def get_by_id(self, question_id: UUID, creator_id: UUID) -> Optional[Question]:
-        """문제 ID로 조회"""
+    def get_by_id(self, question_id: UUID, creator_id: UUID, for_update: bool = False) -> Optional[Question]:
+        """
+        문제 ID로 조회
+        - for_update: 수정/삭제 전 행 잠금 (변경 전 상태로 검수 카운터를 증감하므로 동시 수정 시 어긋남 방지)
+        """
         statement = select(Question).join(Subject).join(Certificate).where(
             Question.id == question_id,
             Certificate.creator_id == creator_id
         )
+        if for_update:
+            statement = statement.with_for_update(of=Question).execution_options(populate_existing=True)
         return self.session.exec(statement).first()
 
     def create(self, subject_id: UUID, data: QuestionCreate, creator_id: UUID) -> Question:
@@ -68,21 +80,23 @@ class QuestionService:
         question = Question(
             subject_id=subject_id,
             content=data.content,
-            options={"options": data.options},  # JSON 형태로 변환
-            correct_answer=str(data.correct_answer),  # 문자열로 변환
+            options=data.options,
+            correct_answer=data.correct_answer,
             explanation=data.explanation,
             chapter_id=data.chapter_id,
             textbook_page=data.textbook_page,
             order_index=data.order_index
         )
         self.session.add(question)
+        self.counters.apply(subject_id, self.counters.question_state(question.textbook_page))
         self.session.commit()
         self.session.refresh(question)
+        answer_key_cache.invalidate(subject_id)
         return question
 
     def update(self, question_id: UUID, data: QuestionUpdate, creator_id: UUID) -> Question:
         """문제 수정"""
-        question = self.get_by_id(question_id, creator_id)
+        question = self.get_by_id(question_id, creator_id, for_update=True)
         if not question:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -91,22 +105,9 @@ class QuestionService:
         
         update_data = data.model_dump(exclude_unset=True)
         
-        # options와 correct_answer 변환
-        if 'options' in update_data:
-            update_data['options'] = {"options": update_data['options']}
-        if 'correct_answer' in update_data:
-            update_data['correct_answer'] = str(update_data['correct_answer'])
-        
         # 정답 인덱스 유효성 검사
         options = update_data.get('options', question.options)
-        if isinstance(options, dict) and 'options' in options:
-            options = options['options']
         correct_answer = update_data.get('correct_answer', question.correct_answer)
-        if isinstance(correct_answer, str):
-            try:
-                correct_answer = int(correct_answer)
-            except (ValueError, TypeError):
-                correct_answer = 0
         
         if correct_answer >= len(options):
             raise HTTPException(
@@ -114,25 +115,37 @@ class QuestionService:
                 detail="정답 인덱스가 보기 범위를 벗어났습니다"
             )
         
+        before = self.counters.question_state(question.textbook_page)
         for key, value in update_data.items():
             setattr(question, key, value)
         
         self.session.add(question)
+        self.counters.apply(
+            question.subject_id,
+            self.counters.diff(before, self.counters.question_state(question.textbook_page))
+        )
         self.session.commit()
         self.session.refresh(question)
+        answer_key_cache.invalidate(question.subject_id)
         return question
 
     def delete(self, question_id: UUID, creator_id: UUID) -> bool:
         """문제 삭제"""
-        question = self.get_by_id(question_id, creator_id)
+        question = self.get_by_id(question_id, creator_id, for_update=True)
         if not question:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="문제를 찾을 수 없습니다"
             )
         
+        subject_id = question.subject_id
         self.session.delete(question)
+        self.counters.apply(
+            subject_id,
+            self.counters.diff(self.counters.question_state(question.textbook_page), Counter())
+        )
         self.session.commit()
+        answer_key_cache.invalidate(subject_id)
         return True
 
     def bulk_create(
@@ -145,6 +158,7 @@ class QuestionService:
         self._verify_subject_ownership(subject_id, creator_id)
         
         created_questions = []
+        delta = Counter()
         for idx, data in enumerate(questions_data):
             # 정답 인덱스 유효성 검사
             if data.correct_answer >= len(data.options):
@@ -156,8 +170,8 @@ class QuestionService:
             question = Question(
                 subject_id=subject_id,
                 content=data.content,
-                options={"options": data.options},  # JSON 형태로 변환
-                correct_answer=str(data.correct_answer),  # 문자열로 변환
+                options=data.options,
+                correct_answer=data.correct_answer,
                 explanation=data.explanation,
                 chapter_id=data.chapter_id,
                 textbook_page=data.textbook_page,
@@ -165,10 +179,13 @@ class QuestionService:
             )
             self.session.add(question)
             created_questions.append(question)
+            delta.update(self.counters.question_state(question.textbook_page))
         
+        self.counters.apply(subject_id, delta)
         self.session.commit()
         for question in created_questions:
             self.session.refresh(question)
+        answer_key_cache.invalidate(subject_id)
         
         return created_questions
 
@@ -179,17 +196,22 @@ class QuestionService:
         creator_id: UUID
     ) -> Question:
         """문제-교재 매핑 수정"""
-        question = self.get_by_id(question_id, creator_id)
+        question = self.get_by_id(question_id, creator_id, for_update=True)
         if not question:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="문제를 찾을 수 없습니다"
             )
         
+        before = self.counters.question_state(question.textbook_page)
         question.textbook_page = data.textbook_page
         question.chapter_id = data.chapter_id
         
         self.session.add(question)
+        self.counters.apply(
+            question.subject_id,
+            self.counters.diff(before, self.counters.question_state(question.textbook_page))
+        )
         self.session.commit()
         self.session.refresh(question)
         return question
@@ -203,40 +225,130 @@ class QuestionService:
         """문제-교재 매핑 일괄 수정"""
         self._verify_subject_ownership(subject_id, creator_id)
         
+        # 변경 전 상태를 읽기 전에 대상 문제를 id 순서로 한 번에 잠금 (교착 방지)
+        ids = [mapping.get("question_id") for mapping in mappings]
+        statement = select(Question).where(
+            Question.id.in_(ids),
+            Question.subject_id == subject_id
+        ).order_by(Question.id).with_for_update().execution_options(populate_existing=True)
+        questions = {question.id: question for question in self.session.exec(statement).all()}
+        
         updated_count = 0
+        delta = Counter()
         for mapping in mappings:
             question_id = mapping.get("question_id")
             textbook_page = mapping.get("textbook_page")
             chapter_id = mapping.get("chapter_id")
             
-            question = self.session.get(Question, question_id)
-            if question and question.subject_id == subject_id:
+            question = questions.get(question_id)
+            if question:
+                delta.subtract(self.counters.question_state(question.textbook_page))
                 question.textbook_page = textbook_page
                 question.chapter_id = chapter_id
+                delta.update(self.counters.question_state(question.textbook_page))
                 self.session.add(question)
                 updated_count += 1
         
+        self.counters.apply(subject_id, delta)
         self.session.commit()
         return updated_count
 
-    def get_stats(self, subject_id: UUID, creator_id: UUID) -> Dict:
-        """문제 통계 조회"""
+    def get_stats(
+        self,
+        subject_id: UUID,
+        creator_id: UUID,
+        page_bucket_size: int = 10
+    ) -> Dict:
+        """문제 통계 조회 (전체/목차별/장별/페이지 구간별 집계를 한 번의 쿼리로)"""
         self._verify_subject_ownership(subject_id, creator_id)
         
-        total = self.session.exec(
-            select(func.count(Question.id)).where(Question.subject_id == subject_id)
-        ).one()
+        # 각 목차가 속한 장(depth 0) 계산
+        roots = select(
+            Chapter.id.label("chapter_id"),
+            Chapter.id.label("root_id"),
+            Chapter.title.label("root_title")
+        ).where(
+            Chapter.subject_id == subject_id,
+            Chapter.parent_id.is_(None)
+        ).cte("chapter_roots", recursive=True)
+        child = aliased(Chapter)
+        roots = roots.union_all(
+            select(child.id, roots.c.root_id, roots.c.root_title).join(
+                roots, child.parent_id == roots.c.chapter_id
+            )
+        )
+        
+        # 교재 페이지 구간 시작 번호 (1~10 -> 1, 11~20 -> 11, ...)
+        page_bucket = ((Question.textbook_page - 1) // page_bucket_size) * page_bucket_size + 1
         
-        mapped = self.session.exec(
-            select(func.count(Question.id)).where(
-                Question.subject_id == subject_id,
-                Question.textbook_page.isnot(None)
+        base = select(
+            Question.id,
+            Question.chapter_id,
+            Question.textbook_page,
+            page_bucket.label("page_bucket"),
+            roots.c.root_id,
+            roots.c.root_title
+        ).outerjoin(
+            roots, Question.chapter_id == roots.c.chapter_id
+        ).where(
+            Question.subject_id == subject_id
+        ).subquery()
+        
+        statement = select(
+            func.grouping(base.c.chapter_id, base.c.root_id, base.c.page_bucket).label("grouping_id"),
+            base.c.chapter_id,
+            base.c.root_id,
+            base.c.root_title,
+            base.c.page_bucket,
+            func.count(base.c.id).label("total"),
+            func.count(base.c.id).filter(base.c.textbook_page.isnot(None)).label("mapped")
+        ).group_by(
+            func.grouping_sets(
+                tuple_(),
+                tuple_(base.c.chapter_id),
+                tuple_(base.c.root_id, base.c.root_title),
+                tuple_(base.c.page_bucket)
             )
-        ).one()
+        )
+        
+        total = 0
+        mapped = 0
+        by_chapter = []
+        by_root_chapter = []
+        by_page_bucket = []
+        
+        # grouping_id 비트: (chapter_id, root_id, page_bucket) 중 집계에서 제외된 컬럼이 1
+        for row in self.session.exec(statement).all():
+            if row.grouping_id == 0b111:
+                total = row.total
+                mapped = row.mapped
+            elif row.grouping_id == 0b011:
+                by_chapter.append({
+                    "chapter_id": row.chapter_id,
+                    "total_count": row.total,
+                    "mapped_count": row.mapped
+                })
+            elif row.grouping_id == 0b101:
+                by_root_chapter.append({
+                    "chapter_id": row.root_id,
+                    "title": row.root_title,
+                    "total_count": row.total,
+                    "mapped_count": row.mapped
+                })
+            elif row.grouping_id == 0b110 and row.page_bucket is not None:
+                by_page_bucket.append({
+                    "page_start": row.page_bucket,
+                    "page_end": row.page_bucket + page_bucket_size - 1,
+                    "count": row.total
+                })
+        
+        by_page_bucket.sort(key=lambda x: x["page_start"])
         
         return {
             "total_count": total,
             "mapped_count": mapped,
-            "unmapped_count": total - mapped
+            "unmapped_count": total - mapped,
+            "by_chapter": by_chapter,
+            "by_root_chapter": by_root_chapter,
+            "by_page_bucket": by_page_bucket
         }
-
@@ -0,0 +1,289 @@
+"""이어 올리기(재개 가능) 업로드 서비스"""
+import fcntl
+import hashlib
+import json
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import AsyncIterator, BinaryIO, Dict
+from uuid import UUID
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.services.file_service import FileService
+
+
+class ResumableUploadService:
+    """
+    이어 올리기 업로드 서비스 (tus 방식)
+
+    생성(create) -> 오프셋을 지정한 청크 추가(append) -> 완료(finalize) 순서로 진행한다.
+    세션은 UPLOAD_DIR/_resumable 아래에 <upload_id>.part(데이터)와
+    <upload_id>.json(메타데이터)으로 저장되며, RESUMABLE_UPLOAD_EXPIRE_HOURS 동안
+    갱신이 없는 세션은 새 업로드 생성 시 정리된다. append와 finalize는 데이터 파일에
+    같은 배타 잠금을 잡고, 완료 결과는 메타데이터에 남겨 다시 완료 요청해도 같은 결과를 준다.
+    """
+
+    SESSION_DIR = "_resumable"
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    @staticmethod
+    def _session_dir() -> str:
+        path = f"{settings.UPLOAD_DIR}/{ResumableUploadService.SESSION_DIR}"
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @staticmethod
+    def _paths(upload_id: UUID) -> tuple:
+        base = f"{ResumableUploadService._session_dir()}/{upload_id}"
+        return f"{base}.part", f"{base}.json"
+
+    @staticmethod
+    def _expires_at(updated_at: float) -> datetime:
+        return datetime.utcfromtimestamp(
+            updated_at + settings.RESUMABLE_UPLOAD_EXPIRE_HOURS * 3600
+        )
+
+    @staticmethod
+    def _load(upload_id: UUID, subject_id: UUID, creator_id: UUID, finished: bool = False) -> Dict:
+        """
+        세션 메타데이터 조회 (다른 사용자/과목의 세션이면 404)
+        - finished=True면 이미 완료된 세션(데이터 파일 없이 result만 있는 메타데이터)도 반환
+        """
+        part_path, meta_path = ResumableUploadService._paths(upload_id)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            meta = None
+
+        if (
+            not meta
+            or meta["creator_id"] != str(creator_id)
+            or meta["subject_id"] != str(subject_id)
+            or not (os.path.exists(part_path) or (finished and "result" in meta))
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="업로드 세션을 찾을 수 없습니다"
+            )
+        return meta
+
+    @staticmethod
+    def _write_meta(meta_path: str, meta: Dict) -> None:
+        """메타데이터를 임시 파일에 쓴 뒤 원자적으로 교체"""
+        temp_path = f"{meta_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(temp_path, meta_path)
+
+    @staticmethod
+    def _lock(part_path: str) -> BinaryIO:
+        """
+        데이터 파일을 추가 모드로 열고 배타 잠금 (append/finalize 공통)
+        - 완료되어 옮겨진 파일을 다시 만들지 않도록 O_CREAT 없이 열기 (없으면 FileNotFoundError)
+        - 같은 세션에 다른 요청이 잠금을 잡고 있으면 409
+        """
+        f = os.fdopen(os.open(part_path, os.O_WRONLY | os.O_APPEND), "ab")
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            f.close()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="같은 업로드 세션에 다른 요청이 진행 중입니다"
+            )
+        return f
+
+    @staticmethod
+    def _info(upload_id: UUID, meta: Dict) -> Dict:
+        part_path, _ = ResumableUploadService._paths(upload_id)
+        return {
+            "upload_id": upload_id,
+            "file_name": meta["file_name"],
+            "file_size": meta["file_size"],
+            "offset": os.path.getsize(part_path),
+            "expires_at": ResumableUploadService._expires_at(os.path.getmtime(part_path))
+        }
+
+    @staticmethod
+    def purge_expired() -> int:
+        """만료된 세션 삭제"""
+        session_dir = ResumableUploadService._session_dir()
+        threshold = time.time() - settings.RESUMABLE_UPLOAD_EXPIRE_HOURS * 3600
+        removed = 0
+        for name in os.listdir(session_dir):
+            if not name.endswith(".json"):
+                continue
+            upload_id = name[:-len(".json")]
+            part_path = f"{session_dir}/{upload_id}.part"
+            meta_path = f"{session_dir}/{name}"
+            try:
+                updated_at = os.path.getmtime(part_path)
+            except FileNotFoundError:
+                updated_at = os.path.getmtime(meta_path)
+            if updated_at >= threshold:
+                continue
+            for path in (part_path, meta_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            removed += 1
+        return removed
+
+    @staticmethod
+    def create(subject_id: UUID, creator_id: UUID, file_name: str, file_size: int) -> Dict:
+        """업로드 세션 생성"""
+        file_ext = file_name.split(".")[-1].lower() if "." in file_name else ""
+        if file_ext != "pdf":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="허용되지 않는 파일 형식입니다. 허용: {'pdf'}"
+            )
+        if file_size > settings.RESUMABLE_MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"파일 크기가 너무 큽니다. 최대: {settings.RESUMABLE_MAX_FILE_SIZE / 1024 / 1024}MB"
+            )
+
+        ResumableUploadService.purge_expired()
+
+        upload_id = uuid.uuid4()
+        part_path, meta_path = ResumableUploadService._paths(upload_id)
+        meta = {
+            "subject_id": str(subject_id),
+            "creator_id": str(creator_id),
+            "file_name": file_name,
+            "file_size": file_size
+        }
+        open(part_path, "wb").close()
+        ResumableUploadService._write_meta(meta_path, meta)
+        return ResumableUploadService._info(upload_id, meta)
+
+    @staticmethod
+    def get(upload_id: UUID, subject_id: UUID, creator_id: UUID) -> Dict:
+        """업로드 세션 상태 (재개할 오프셋)"""
+        meta = ResumableUploadService._load(upload_id, subject_id, creator_id)
+        return ResumableUploadService._info(upload_id, meta)
+
+    @staticmethod
+    async def append(
+        upload_id: UUID,
+        subject_id: UUID,
+        creator_id: UUID,
+        offset: int,
+        chunks: AsyncIterator[bytes]
+    ) -> Dict:
+        """
+        청크 추가
+        - offset이 현재 저장된 크기와 다르면 409 (클라이언트는 상태 조회 후 재개)
+        - 같은 세션에 대한 동시 요청은 파일 잠금으로 거부
+        """
+        meta = ResumableUploadService._load(upload_id, subject_id, creator_id)
+        part_path, _ = ResumableUploadService._paths(upload_id)
+
+        try:
+            f = ResumableUploadService._lock(part_path)
+        except FileNotFoundError:
+            # 조회 후 완료(finalize)되어 데이터 파일이 옮겨짐
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="이미 완료된 업로드입니다"
+            )
+        try:
+            current = os.fstat(f.fileno()).st_size
+            if offset != current:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"업로드 오프셋이 일치하지 않습니다. 현재: {current}"
+                )
+
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                if current + len(chunk) > meta["file_size"]:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="선언한 파일 크기를 초과했습니다"
+                    )
+                await run_in_threadpool(f.write, chunk)
+                current += len(chunk)
+            await run_in_threadpool(f.flush)
+        finally:
+            # 잘린 청크까지 기록된 만큼이 다음 오프셋이 됨
+            f.close()
+
+        return ResumableUploadService._info(upload_id, meta)
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(ResumableUploadService.HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    async def finalize(upload_id: UUID, subject_id: UUID, creator_id: UUID) -> Dict:
+        """
+        업로드 완료 (FileService.save_file과 같은 형태의 결과 반환)
+        - append와 같은 잠금을 잡으므로 진행 중인 청크 전송이나 다른 완료 요청이 있으면 409
+        - 이미 완료된 세션이면 저장해 둔 결과를 그대로 반환 (응답을 못 받은 클라이언트의 재시도)
+        """
+        meta = ResumableUploadService._load(upload_id, subject_id, creator_id, finished=True)
+        if "result" in meta:
+            return meta["result"]
+        part_path, meta_path = ResumableUploadService._paths(upload_id)
+
+        try:
+            f = ResumableUploadService._lock(part_path)
+        except FileNotFoundError:
+            f = None
+        try:
+            # 잠금을 기다리는 사이 다른 요청이 완료했을 수 있으므로 잠근 뒤 다시 확인
+            meta = ResumableUploadService._load(upload_id, subject_id, creator_id, finished=True)
+            if "result" in meta:
+                return meta["result"]
+            if f is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="업로드 세션을 찾을 수 없습니다"
+                )
+
+            file_size = os.fstat(f.fileno()).st_size
+            if file_size != meta["file_size"]:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"업로드가 완료되지 않았습니다. 현재: {file_size} / {meta['file_size']}"
+                )
+
+            # 내용 주소 경로로 옮기기 전에 데이터를 디스크에 반영
+            await run_in_threadpool(os.fsync, f.fileno())
+            sha256 = await run_in_threadpool(ResumableUploadService._hash_file, part_path)
+            file_url = await run_in_threadpool(
+                FileService.store_blob,
+                part_path,
+                "textbooks",
+                sha256,
+                FileService.file_extension(meta["file_name"])
+            )
+            meta["result"] = {
+                "file_url": file_url,
+                "file_name": meta["file_name"],
+                "file_size": file_size,
+                "sha256": sha256
+            }
+            await run_in_threadpool(ResumableUploadService._write_meta, meta_path, meta)
+            return meta["result"]
+        finally:
+            if f is not None:
+                f.close()
+
+    @staticmethod
+    def cancel(upload_id: UUID, subject_id: UUID, creator_id: UUID) -> None:
+        """업로드 세션 취소"""
+        ResumableUploadService._load(upload_id, subject_id, creator_id)
+        for path in ResumableUploadService._paths(upload_id):
+            if os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,350 @@
+"""교재 본문 검색(페이지 역색인) 서비스"""
+import asyncio
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict, defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+from fastapi import HTTPException, status
+from sqlmodel import Session, select
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.models.textbook import Textbook, TextbookPage
+
+
+# 색인 파일 구조 (네이티브 바이트 순서)
+#   헤더: magic, version, 페이지 수, 토큰 수, 포스팅 수, 예약
+#   keys[토큰 수]       u64 정렬된 토큰 키 (음절 2-gram 뒤에 한 글자 키)
+#   offsets[토큰 수+1]  u32 토큰별 포스팅 시작 위치
+#   pages[포스팅 수]    u32 페이지 번호 (1부터)
+#   counts[포스팅 수]   u32 페이지 내 출현 횟수
+HEADER = struct.Struct("=4sIIIII")
+MAGIC = b"NLIX"
+VERSION = 2
+
+WORD = re.compile(r"\w+")
+CHAR_BITS = 21  # 유니코드 코드 포인트 최대 21비트
+CHAR_KEY = 1 << (CHAR_BITS * 2)  # 한 글자 검색용 키 표시 (모든 2-gram 키보다 큼)
+SNIPPET_RADIUS = 40
+
+
+def normalize(text: str) -> str:
+    """전각/호환 문자 정규화 후 소문자"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def _token_key(first: str, second: str = "") -> int:
+    """음절(문자) 2-gram -> u64 키 (한 글자 단어는 두 번째 자리 0)"""
+    return (ord(first) << CHAR_BITS) | (ord(second) if second else 0)
+
+
+def tokenize(text: str) -> Iterator[int]:
+    """
+    단어별 문자 2-gram 토큰 키
+    - 한국어는 띄어쓰기/조사 변화가 많아 형태소 대신 음절 2-gram 사용
+    - 한 글자 단어는 그 글자 하나를 토큰으로 사용
+    """
+    for word in WORD.findall(normalize(text)):
+        if len(word) == 1:
+            yield _token_key(word)
+        else:
+            for first, second in zip(word, word[1:]):
+                yield _token_key(first, second)
+
+
+def index_tokens(text: str) -> Iterator[int]:
+    """색인에 넣을 토큰 키 (2-gram + 한 글자 검색용 글자별 키)"""
+    for word in WORD.findall(normalize(text)):
+        if len(word) == 1:
+            yield _token_key(word)
+        else:
+            for first, second in zip(word, word[1:]):
+                yield _token_key(first, second)
+        for char in word:
+            yield CHAR_KEY | ord(char)
+
+
+def build_search_index(pages: List[str], output_path: str) -> int:
+    """
+    페이지 텍스트로 역색인 파일 생성 (워커 프로세스에서 실행)
+    - 임시 파일에 쓴 뒤 원자적으로 교체해 읽는 프로세스가 반쯤 쓴 파일을 보지 않음
+    - 토큰 수 반환
+    """
+    postings: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    for page_number, text in enumerate(pages, start=1):
+        for key, count in Counter(index_tokens(text)).items():
+            postings[key].append((page_number, count))
+
+    keys = array("Q", sorted(postings))
+    offsets = array("I", [0])
+    page_numbers = array("I")
+    counts = array("I")
+    for key in keys:
+        for page_number, count in postings[key]:
+            page_numbers.append(page_number)
+            counts.append(count)
+        offsets.append(len(page_numbers))
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(output_path), suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(pages), len(keys), len(page_numbers), 0))
+            for values in (keys, offsets, page_numbers, counts):
+                values.tofile(f)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return len(keys)
+
+
+class SearchIndex:
+    """
+    메모리 매핑된 역색인 (읽기 전용)
+
+    파일 전체를 힙에 올리지 않고 mmap 위의 memoryview로 바로 조회하므로
+    여러 워커 프로세스가 OS 페이지 캐시의 같은 메모리를 공유한다.
+    사용 중 표시(users)는 SearchIndexService가 잠금 안에서 관리한다.
+    """
+
+    def __init__(self, path: str):
+        self.users = 0
+        self.evicted = False
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.page_count, token_count, posting_count, _ = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("지원하지 않는 색인 파일입니다")
+
+        view = memoryview(self._mmap)
+        position = HEADER.size
+
+        def take(fmt: str, length: int, item_size: int) -> memoryview:
+            nonlocal position
+            start, position = position, position + length * item_size
+            return view[start:position].cast(fmt)
+
+        self._keys = take("Q", token_count, 8)
+        self._offsets = take("I", token_count + 1, 4)
+        self._pages = take("I", posting_count, 4)
+        self._counts = take("I", posting_count, 4)
+
+    def arrays(self) -> Tuple[memoryview, memoryview, memoryview, memoryview]:
+        """
+        2-gram 토큰의 (keys, offsets, pages, counts) 배열 뷰 (복사 없음, 행렬 계산용)
+        - 한 글자 검색용 키는 정렬 순서상 맨 뒤에 있으므로 잘라 냄
+        """
+        end = bisect_left(self._keys, CHAR_KEY)
+        postings_end = self._offsets[end]
+        return self._keys[:end], self._offsets[:end + 1], self._pages[:postings_end], self._counts[:postings_end]
+
+    def close(self) -> None:
+        """
+        매핑 해제
+        - 행렬 계산에 넘긴 배열 뷰가 아직 남아 있으면 mmap은 그 뷰가 사라질 때 닫힘
+        """
+        for view in (self._keys, self._offsets, self._pages, self._counts):
+            try:
+                view.release()
+            except BufferError:
+                pass
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def _postings(self, start_index: int, end_index: int) -> Counter:
+        """토큰 범위 [start_index, end_index)의 페이지별 출현 횟수"""
+        result: Counter = Counter()
+        for i in range(self._offsets[start_index], self._offsets[end_index]):
+            result[self._pages[i]] += self._counts[i]
+        return result
+
+    def lookup(self, key: int) -> Counter:
+        """토큰 하나의 페이지별 출현 횟수"""
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return self._postings(i, i + 1)
+        return Counter()
+
+    def search(self, query: str) -> List[Tuple[int, int]]:
+        """검색어의 모든 토큰을 포함하는 페이지 -> [(페이지, 점수)] (점수 내림차순)"""
+        matches: Optional[Counter] = None
+        for word in WORD.findall(normalize(query)):
+            if len(word) == 1:
+                # 단어 안 위치와 관계없이 그 글자가 나오는 페이지 ("법" -> "민법", "방법", "법률")
+                term_postings = [self.lookup(CHAR_KEY | ord(word))]
+            else:
+                term_postings = [self.lookup(_token_key(a, b)) for a, b in zip(word, word[1:])]
+            for postings in term_postings:
+                if matches is None:
+                    matches = postings
+                else:
+                    matches = Counter({
+                        page: score + postings[page]
+                        for page, score in matches.items() if page in postings
+                    })
+                if not matches:
+                    return []
+        if not matches:
+            return []
+        return sorted(matches.items(), key=lambda item: (-item[1], item[0]))
+
+
+def make_snippet(text: str, query: str) -> str:
+    """검색어(없으면 첫 단어)가 처음 나오는 위치 주변 본문"""
+    lowered = text.lower()
+    words = [word for word in query.lower().split() if word]
+    position = -1
+    for candidate in [query.lower().strip(), *words]:
+        position = lowered.find(candidate)
+        if position >= 0:
+            break
+
+    start = max(position - SNIPPET_RADIUS, 0) if position >= 0 else 0
+    end = min(start + SNIPPET_RADIUS * 2 + len(query), len(text))
+    snippet = " ".join(text[start:end].split())
+    return f"{'…' if start > 0 else ''}{snippet}{'…' if end < len(text) else ''}"
+
+
+class SearchIndexService:
+    """
+    교재 본문 검색 서비스
+
+    PDF 분석이 끝나면 페이지 텍스트로 교재별 색인 파일(SEARCH_INDEX_DIR/<교재 ID>.idx)을
+    만든다. 조회 시에는 파일을 mmap으로 열어 프로세스 안에서 재사용하고(최근 사용한
+    SEARCH_INDEX_OPEN_MAX개까지, 밀려난 색인은 사용이 끝나면 매핑 해제), 다시 분석되어
+    파일이 교체되면(inode 변경) 새로 연다. 색인이 없거나 형식이 바뀐 교재는 첫 검색 때 만든다.
+    """
+
+    _indexes: "OrderedDict[str, Tuple[int, SearchIndex]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def path_for(textbook_id: UUID) -> str:
+        return f"{settings.SEARCH_INDEX_DIR}/{textbook_id}.idx"
+
+    @staticmethod
+    async def build(textbook_id: UUID, pages: List[str], executor) -> int:
+        """페이지 텍스트로 색인 생성"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, build_search_index, pages, SearchIndexService.path_for(textbook_id)
+        )
+
+    @staticmethod
+    def _evict(index: SearchIndex) -> None:
+        """캐시에서 빠진 색인 매핑 해제 (사용 중이면 release에서 해제, 잠금 안에서 호출)"""
+        index.evicted = True
+        if index.users == 0:
+            index.close()
+
+    @staticmethod
+    def _open(path: str) -> Optional[SearchIndex]:
+        """
+        색인 열고 사용 중으로 표시 (끝나면 release 호출)
+        - 파일이 교체되었으면 다시 매핑, 없거나 이전 형식이면 None
+        """
+        try:
+            inode = os.stat(path).st_ino
+        except FileNotFoundError:
+            return None
+        with SearchIndexService._lock:
+            indexes = SearchIndexService._indexes
+            cached = indexes.get(path)
+            if cached and cached[0] == inode:
+                indexes.move_to_end(path)
+                index = cached[1]
+            else:
+                try:
+                    index = SearchIndex(path)
+                except ValueError:
+                    return None
+                if cached:
+                    SearchIndexService._evict(cached[1])
+                indexes[path] = (inode, index)
+                while len(indexes) > settings.SEARCH_INDEX_OPEN_MAX:
+                    _, (_, oldest) = indexes.popitem(last=False)
+                    SearchIndexService._evict(oldest)
+            index.users += 1
+            return index
+
+    @staticmethod
+    def release(index: SearchIndex) -> None:
+        """_open으로 연 색인 사용 종료"""
+        with SearchIndexService._lock:
+            index.users -= 1
+            if index.users == 0 and index.evicted:
+                index.close()
+
+    @staticmethod
+    def _page_texts(session: Session, textbook_id: UUID, page_numbers: List[int]) -> Dict[int, str]:
+        statement = select(TextbookPage.page_number, TextbookPage.text).where(
+            TextbookPage.textbook_id == textbook_id,
+            TextbookPage.page_number.in_(page_numbers)
+        )
+        return dict(session.exec(statement).all())
+
+    @staticmethod
+    @asynccontextmanager
+    async def open_index(session: Session, textbook: Textbook, executor) -> AsyncIterator[SearchIndex]:
+        """교재 색인 사용 구간 (없으면 저장된 페이지 텍스트로 생성)"""
+        path = SearchIndexService.path_for(textbook.id)
+        index = await run_in_threadpool(SearchIndexService._open, path)
+        if index is None:
+            statement = select(TextbookPage.text).where(
+                TextbookPage.textbook_id == textbook.id
+            ).order_by(TextbookPage.page_number)
+            pages = list(session.exec(statement).all())
+            if not pages:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="PDF 분석이 끝난 뒤 사용할 수 있습니다"
+                )
+            await SearchIndexService.build(textbook.id, pages, executor)
+            index = await run_in_threadpool(SearchIndexService._open, path)
+        try:
+            yield index
+        finally:
+            SearchIndexService.release(index)
+
+    @staticmethod
+    async def search(session: Session, textbook: Textbook, query: str, limit: int, executor) -> Dict:
+        """교재 본문 검색 -> 일치 페이지와 미리보기 문구"""
+        async with SearchIndexService.open_index(session, textbook, executor) as index:
+            # 흔한 토큰은 포스팅이 길어 이벤트 루프를 막지 않도록 스레드 풀에서 조회
+            matches = await run_in_threadpool(index.search, query)
+        top = matches[:limit]
+        texts = SearchIndexService._page_texts(session, textbook.id, [page for page, _ in top])
+        return {
+            "query": query,
+            "total": len(matches),
+            "results": [
+                {"page": page, "score": score, "snippet": make_snippet(texts.get(page, ""), query)}
+                for page, score in top
+            ]
+        }
+
+    @staticmethod
+    def delete(textbook_id: UUID) -> None:
+        """교재 색인 파일 삭제"""
+        path = SearchIndexService.path_for(textbook_id)
+        with SearchIndexService._lock:
+            cached = SearchIndexService._indexes.pop(path, None)
+            if cached:
+                SearchIndexService._evict(cached[1])
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -5,6 +5,7 @@ from fastapi import HTTPException, status
 
 from app.models.subject import Subject, SubjectProficiencyWeight
 from app.models.certificate import Certificate
+from app.models.validation_counter import SubjectValidationCounter
 from app.schemas.subject import SubjectCreate, SubjectUpdate, ProficiencyWeightCreate
 
 
@@ -83,6 +84,9 @@ class SubjectService:
                 time_weight=weight
             )
             self.session.add(pw)
+        
+        # 검수 카운터 행 (내용 버전으로 정답표/검수 캐시를 무효화하므로 과목과 함께 생성)
+        self.session.add(SubjectValidationCounter(subject_id=subject.id))
         self.session.commit()
         
         return subject
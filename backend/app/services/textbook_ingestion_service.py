@@ -0,0 +1,331 @@
+"""교재 PDF 분석(ingestion) 서비스"""
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+from sqlmodel import Session, select, delete
+from sqlalchemy import insert, update
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from pypdf import PdfReader
+import pikepdf
+
+from app.core.config import settings
+from app.core.database import engine
+from app.models.textbook import Textbook, TextbookPage, IngestionStatus
+from app.services.file_service import FileService
+from app.services.textbook_service import TextbookService
+from app.services.thumbnail_service import ThumbnailService
+from app.services.search_index_service import SearchIndexService
+from app.services.pdf_optimize_service import optimize_pdf, decrypt_pdf, pdf_encryption
+
+
+def _flatten_outline(reader: PdfReader) -> List[Dict]:
+    """중첩된 PDF outline을 (제목, 페이지, 깊이) 목록으로 변환"""
+    items: List[Dict] = []
+
+    def walk(nodes: list, depth: int) -> None:
+        for node in nodes:
+            # 하위 항목은 바로 앞 항목 다음의 리스트로 주어짐
+            if isinstance(node, list):
+                walk(node, depth + 1)
+                continue
+            try:
+                page = reader.get_destination_page_number(node) + 1
+            except Exception:
+                page = None
+            items.append({"title": str(node.title), "page": page, "depth": depth})
+
+    try:
+        walk(reader.outline, 0)
+    except Exception:
+        return []
+    return items
+
+
+def parse_pdf(path: str) -> Dict:
+    """PDF 분석 (워커 프로세스에서 실행)"""
+    reader = PdfReader(path)
+    if reader.is_encrypted and not reader.decrypt(""):
+        raise ValueError("암호가 설정된 PDF입니다")
+
+    pages: List[str] = []
+    for page in reader.pages:
+        try:
+            text = page.extract_text() or ""
+        except Exception:
+            text = ""
+        # PostgreSQL text에는 NUL 문자를 저장할 수 없음
+        pages.append(text.replace("\x00", ""))
+
+    return {
+        "total_pages": len(pages),
+        "pages": pages,
+        "outline": _flatten_outline(reader)
+    }
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_ingestion_executor() -> ProcessPoolExecutor:
+    """PDF 분석용 프로세스 풀 (첫 사용 시 생성)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=settings.INGESTION_WORKERS)
+        return _executor
+
+
+class TextbookIngestionService:
+    """
+    교재 PDF 분석 서비스
+
+    교재 등록 후 백그라운드 작업으로 실행된다. PDF 파싱은 프로세스 풀에서,
+    DB 기록은 스레드 풀에서 자체 세션으로 처리하므로 요청 경로와 이벤트 루프를
+    막지 않는다. 페이지 텍스트는 textbook_pages에 페이지당 한 행으로 저장된다
+    (긴 텍스트는 PostgreSQL TOAST로 압축 저장).
+
+    암호가 걸린 PDF는 분석 시 한 번만 복호화해 PROTECTED_UPLOAD_DIR에 작업 사본으로
+    저장하고 file_url을 교체한다 (원본은 original_file_url). 암호는 저장하지 않으며,
+    이후 조회/페이지 분할/썸네일은 모두 작업 사본을 사용한다.
+    """
+
+    INSERT_BATCH_SIZE = 500
+
+    @staticmethod
+    def _mark_processing(textbook_id: UUID) -> Optional[str]:
+        """분석 시작 표시 후 file_url 반환 (분석할 수 없으면 None)"""
+        with Session(engine) as session:
+            textbook = session.get(Textbook, textbook_id)
+            if not textbook:
+                return None
+
+            path = FileService.local_path(textbook.file_url)
+            if path is None:
+                textbook.ingestion_status = IngestionStatus.FAILED
+                textbook.ingestion_error = "업로드된 파일이 아닙니다"
+            else:
+                textbook.ingestion_status = IngestionStatus.PROCESSING
+                textbook.ingestion_error = None
+            session.add(textbook)
+            session.commit()
+            return textbook.file_url if path else None
+
+    @staticmethod
+    def _mark_failed(textbook_id: UUID, error: str) -> None:
+        with Session(engine) as session:
+            statement = update(Textbook).where(Textbook.id == textbook_id).values(
+                ingestion_status=IngestionStatus.FAILED,
+                ingestion_error=error[:500]
+            )
+            session.execute(statement)
+            session.commit()
+
+    @staticmethod
+    def _switch_file(textbook_id: UUID, old_url: str, new_url: str) -> bool:
+        """
+        file_url을 작업 사본/최적화본으로 교체 (원본은 original_file_url에 보존)
+        - 새 파일이 그 사이 다른 교재 정리로 삭제되었으면 교체하지 않고 False
+        """
+        with Session(engine) as session:
+            textbook = session.get(Textbook, textbook_id)
+            if not textbook or textbook.file_url != old_url:
+                return True
+
+            service = TextbookService(session)
+            if not service.file_available(new_url):
+                return False
+
+            textbook.original_file_url = textbook.original_file_url or old_url
+            textbook.file_url = new_url
+            session.add(textbook)
+            session.flush()
+
+            # 이전 최적화본을 더 이상 아무도 참조하지 않으면 삭제
+            if old_url != textbook.original_file_url:
+                service.delete_unreferenced_files({old_url})
+            session.commit()
+            return True
+
+    @staticmethod
+    def _find_decrypted(file_url: str) -> Optional[str]:
+        """같은 암호화 원본을 이미 복호화한 작업 사본 (다른 교재가 만든 것 포함, 재사용 전 암호 확인 필요)"""
+        with Session(engine) as session:
+            statement = select(Textbook.file_url).where(
+                Textbook.original_file_url == file_url,
+                Textbook.file_url.startswith(f"/uploads/{settings.PROTECTED_UPLOAD_DIR}/")
+            ).limit(1)
+            return session.exec(statement).first()
+
+    @staticmethod
+    async def _decrypt(textbook_id: UUID, file_url: str, password: Optional[str], executor) -> Optional[str]:
+        """암호화된 PDF면 작업 사본으로 file_url 교체 후 새 file_url 반환 (암호 오류 시 실패 처리 후 None)"""
+        if FileService.is_protected(file_url):
+            return file_url
+
+        loop = asyncio.get_running_loop()
+        source_path = FileService.local_path(file_url)
+        new_url = await run_in_threadpool(TextbookIngestionService._find_decrypted, file_url)
+        if new_url is not None:
+            # 같은 파일을 다른 사용자가 올렸을 수 있으므로 이 교재의 암호로 원본이 열릴 때만 재사용
+            checked = await loop.run_in_executor(executor, pdf_encryption, source_path, password)
+            if checked["encrypted"] is None:
+                return file_url
+            if not checked["password_ok"]:
+                await run_in_threadpool(
+                    TextbookIngestionService._mark_failed, textbook_id, "PDF 암호가 필요하거나 올바르지 않습니다"
+                )
+                return None
+        else:
+            try:
+                decrypted = await loop.run_in_executor(executor, decrypt_pdf, source_path, password)
+            except pikepdf.PasswordError:
+                await run_in_threadpool(
+                    TextbookIngestionService._mark_failed, textbook_id, "PDF 암호가 필요하거나 올바르지 않습니다"
+                )
+                return None
+            except Exception:
+                # 열 수 없는 파일은 분석 단계에서 오류로 기록
+                return file_url
+            if decrypted is None:
+                return file_url
+
+            new_url = await run_in_threadpool(
+                FileService.store_blob,
+                decrypted["path"],
+                f"{settings.PROTECTED_UPLOAD_DIR}/textbooks",
+                decrypted["sha256"],
+                "pdf"
+            )
+
+        if not await run_in_threadpool(TextbookIngestionService._switch_file, textbook_id, file_url, new_url):
+            await run_in_threadpool(
+                TextbookIngestionService._mark_failed, textbook_id, "작업 사본이 삭제되었습니다. 분석을 다시 시도하세요"
+            )
+            return None
+        return new_url
+
+    @staticmethod
+    async def _optimize(textbook_id: UUID, file_url: str, executor) -> str:
+        """선형화/이미지 축소 사본을 만들어 file_url 교체 후 새 file_url 반환 (실패 시 원본 유지)"""
+        loop = asyncio.get_running_loop()
+        try:
+            optimized = await loop.run_in_executor(
+                executor, optimize_pdf, FileService.local_path(file_url), settings.PDF_MAX_IMAGE_PIXELS
+            )
+        except Exception:
+            return file_url
+        if optimized is None:
+            return file_url
+
+        # 작업 사본과 같은 하위 폴더에 저장 (암호 해제본이면 계속 비공개)
+        new_url = await run_in_threadpool(
+            FileService.store_blob,
+            optimized["path"],
+            FileService.blob_subfolder(file_url),
+            optimized["sha256"],
+            "pdf"
+        )
+        if new_url != file_url and not await run_in_threadpool(
+            TextbookIngestionService._switch_file, textbook_id, file_url, new_url
+        ):
+            return file_url
+        return new_url
+
+    @staticmethod
+    def _store(textbook_id: UUID, result: Dict) -> None:
+        """분석 결과 저장 (페이지 텍스트 교체 + 교재 행 갱신)"""
+        with Session(engine) as session:
+            textbook = session.get(Textbook, textbook_id)
+            if not textbook:
+                return
+
+            session.exec(delete(TextbookPage).where(TextbookPage.textbook_id == textbook_id))
+            rows = [
+                {"textbook_id": textbook_id, "page_number": i + 1, "text": text}
+                for i, text in enumerate(result["pages"])
+            ]
+            for start in range(0, len(rows), TextbookIngestionService.INSERT_BATCH_SIZE):
+                session.execute(
+                    insert(TextbookPage),
+                    rows[start:start + TextbookIngestionService.INSERT_BATCH_SIZE]
+                )
+
+            textbook.total_pages = result["total_pages"]
+            textbook.outline = result["outline"]
+            textbook.ingestion_status = IngestionStatus.DONE
+            textbook.ingestion_error = None
+            textbook.ingested_at = datetime.utcnow()
+            session.add(textbook)
+            session.commit()
+
+    @staticmethod
+    async def ingest(textbook_id: UUID, password: Optional[str] = None) -> None:
+        """교재 PDF 암호 해제, 최적화, 분석 후 페이지 썸네일 생성 (BackgroundTasks에서 실행)"""
+        file_url = await run_in_threadpool(TextbookIngestionService._mark_processing, textbook_id)
+        if file_url is None:
+            return
+
+        executor = get_ingestion_executor()
+        file_url = await TextbookIngestionService._decrypt(textbook_id, file_url, password, executor)
+        if file_url is None:
+            return
+        if settings.PDF_OPTIMIZE:
+            file_url = await TextbookIngestionService._optimize(textbook_id, file_url, executor)
+
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(executor, parse_pdf, FileService.local_path(file_url))
+        except Exception as e:
+            await run_in_threadpool(TextbookIngestionService._mark_failed, textbook_id, str(e))
+            return
+
+        await run_in_threadpool(TextbookIngestionService._store, textbook_id, result)
+
+        # 검색 색인은 없으면 첫 검색 때 만들어지므로 실패해도 분석 상태는 유지
+        try:
+            await SearchIndexService.build(textbook_id, result["pages"], executor)
+        except Exception:
+            pass
+
+        # 썸네일은 분석 결과와 별개이므로 실패해도 분석 상태는 유지 (다시 분석 시 재시도)
+        try:
+            await ThumbnailService.generate(file_url, executor)
+        except Exception:
+            pass
+
+    @staticmethod
+    async def check_password(file_url: str, password: Optional[str]) -> Optional[bool]:
+        """업로드 파일의 암호화 여부 반환 (암호를 함께 보냈는데 틀리면 400)"""
+        path = FileService.local_path(file_url)
+        result = await run_in_threadpool(pdf_encryption, path, password)
+        if password and result["encrypted"] and not result["password_ok"]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="PDF 암호가 올바르지 않습니다"
+            )
+        return result["encrypted"]
+
+    @staticmethod
+    def get_status(textbook: Textbook) -> Dict:
+        """분석 상태 응답"""
+        return {
+            "textbook_id": textbook.id,
+            "status": textbook.ingestion_status,
+            "error": textbook.ingestion_error,
+            "total_pages": textbook.total_pages,
+            "ingested_at": textbook.ingested_at,
+            "outline": textbook.outline or []
+        }
+
+    @staticmethod
+    def get_page_texts(session: Session, textbook_id: UUID) -> List[str]:
+        """페이지 순서대로 추출 텍스트 조회 (분석 전이면 빈 목록)"""
+        statement = select(TextbookPage.text).where(
+            TextbookPage.textbook_id == textbook_id
+        ).order_by(TextbookPage.page_number)
+        return list(session.exec(statement).all())
@@ -1,12 +1,16 @@
-from typing import List, Optional
+import os
+from typing import List, Optional, Set
 from uuid import UUID
-from sqlmodel import Session, select
+from sqlmodel import Session, select, func, or_
 from fastapi import HTTPException, status
 
 from app.models.textbook import Textbook
 from app.models.subject import Subject
 from app.models.certificate import Certificate
 from app.schemas.textbook import TextbookCreate, TextbookUpdate
+from app.services.file_service import FileService
+from app.services.chapter_split_service import ChapterSplitService
+from app.services.search_index_service import SearchIndexService
 
 
 class TextbookService:
@@ -44,15 +48,56 @@ class TextbookService:
         )
         return self.session.exec(statement).first()
 
+    def lock_file_url(self, file_url: str) -> None:
+        """
+        파일 URL 단위 트랜잭션 잠금 (커밋/롤백 시 해제)
+        - 참조 수 확인 후 삭제와 새 참조 등록이 엇갈리지 않도록 양쪽 모두 잠금 후 진행
+        """
+        self.session.execute(select(func.pg_advisory_xact_lock(func.hashtext(file_url))))
+
+    def file_available(self, file_url: str) -> bool:
+        """새 참조를 등록해도 되는지 (잠금 후 호출, 업로드 파일이 아니면 항상 True)"""
+        self.lock_file_url(file_url)
+        path = FileService.local_path(file_url)
+        return path is None or os.path.exists(path)
+
+    def delete_unreferenced_files(self, file_urls: Set[str]) -> None:
+        """
+        참조하는 교재가 없는 파일 삭제 (커밋 전에 호출)
+        - 잠금을 잡은 채 삭제까지 끝내야 하므로 파일 삭제가 커밋보다 먼저 일어남
+        - 잠금 순서를 고정해 교착 방지
+        """
+        for file_url in sorted(file_urls):
+            self.lock_file_url(file_url)
+            if self.count_file_references(file_url) == 0:
+                FileService.delete_file(file_url)
+
     def create(self, subject_id: UUID, data: TextbookCreate, creator_id: UUID) -> Textbook:
         """교재 생성"""
         self._verify_subject_ownership(subject_id, creator_id)
         
+        # 교재 업로드 폴더의 파일 중 이 사용자가 직접 올린 파일만 등록 가능
+        # (다른 제작자의 파일이나 암호 해제본을 file_url로 지정해 내려받는 것 방지)
+        if not data.file_url.startswith("/uploads/textbooks/") or not FileService.verify_upload_token(
+            data.file_url, creator_id, data.upload_token
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="업로드한 파일만 교재로 등록할 수 있습니다. 파일을 다시 업로드하세요"
+            )
+        
+        # 업로드 후 등록 전에 같은 내용의 다른 교재가 삭제되며 파일이 지워졌을 수 있음
+        if not self.file_available(data.file_url):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="업로드된 파일을 찾을 수 없습니다. 파일을 다시 업로드하세요"
+            )
+        
         textbook = Textbook(
             subject_id=subject_id,
             title=data.title,
             file_url=data.file_url,
-            total_pages=data.total_pages
+            total_pages=data.total_pages or 0
         )
         self.session.add(textbook)
         self.session.commit()
@@ -77,8 +122,15 @@ class TextbookService:
         self.session.refresh(textbook)
         return textbook
 
+    def count_file_references(self, file_url: str) -> int:
+        """파일을 참조하는 교재 수 (최적화본/원본 모두)"""
+        statement = select(func.count(Textbook.id)).where(
+            or_(Textbook.file_url == file_url, Textbook.original_file_url == file_url)
+        )
+        return self.session.exec(statement).one()
+
     def delete(self, textbook_id: UUID, creator_id: UUID) -> bool:
-        """교재 삭제"""
+        """교재 삭제 (파일은 마지막 참조가 사라질 때 삭제)"""
         textbook = self.get_by_id(textbook_id, creator_id)
         if not textbook:
             raise HTTPException(
@@ -86,7 +138,13 @@ class TextbookService:
                 detail="교재를 찾을 수 없습니다"
             )
         
+        file_urls = {textbook.file_url, textbook.original_file_url} - {None}
         self.session.delete(textbook)
+        self.session.flush()
+        self.delete_unreferenced_files(file_urls)
         self.session.commit()
+        
+        ChapterSplitService.delete_files(textbook_id)
+        SearchIndexService.delete(textbook_id)
         return True
 
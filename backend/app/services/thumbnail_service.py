@@ -0,0 +1,199 @@
+"""교재 페이지 썸네일/스프라이트 서비스"""
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, Optional
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from PIL import Image
+import pypdfium2 as pdfium
+
+from app.core.config import settings
+from app.models.textbook import Textbook
+from app.services.file_service import FileService
+
+
+THUMBNAIL_WIDTH = 160
+SPRITE_PAGES = 50
+SPRITE_COLUMNS = 10
+WEBP_QUALITY = 70
+MANIFEST_NAME = "manifest.json"
+
+
+def render_thumbnails(source_path: str, output_dir: str) -> Dict:
+    """
+    페이지별 썸네일과 스프라이트(SPRITE_PAGES장씩 한 WebP)를 생성 (워커 프로세스에서 실행)
+    - 같은 폴더의 임시 디렉토리에 모두 쓴 뒤 output_dir로 원자적으로 옮김
+      (동시에 처음 생성해도 서로의 파일을 덮어쓰지 않고, 먼저 옮긴 결과를 사용)
+    """
+    parent = os.path.dirname(output_dir)
+    os.makedirs(parent, exist_ok=True)
+    work_dir = tempfile.mkdtemp(dir=parent, prefix=f".{os.path.basename(output_dir)}.")
+    try:
+        manifest = _render_into(source_path, work_dir)
+        try:
+            os.replace(work_dir, output_dir)
+        except OSError:
+            if os.path.exists(f"{output_dir}/{MANIFEST_NAME}"):
+                # 다른 워커가 먼저 완료
+                with open(f"{output_dir}/{MANIFEST_NAME}", "r", encoding="utf-8") as f:
+                    return json.load(f)
+            # manifest 없는 미완성 폴더(이전 방식으로 쓰다 중단)는 교체
+            shutil.rmtree(output_dir, ignore_errors=True)
+            os.replace(work_dir, output_dir)
+        return manifest
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _render_into(source_path: str, output_dir: str) -> Dict:
+    """output_dir에 페이지 썸네일, 스프라이트, manifest.json 기록"""
+    os.makedirs(f"{output_dir}/pages", exist_ok=True)
+    os.makedirs(f"{output_dir}/sprites", exist_ok=True)
+
+    pdf = pdfium.PdfDocument(source_path)
+    try:
+        page_count = len(pdf)
+        sprites = []
+        for sprite_index, first in enumerate(range(0, page_count, SPRITE_PAGES)):
+            last = min(first + SPRITE_PAGES, page_count)
+
+            # 스프라이트 하나 분량만 메모리에 유지
+            thumbnails = []
+            for i in range(first, last):
+                page = pdf[i]
+                try:
+                    bitmap = page.render(scale=THUMBNAIL_WIDTH / page.get_width())
+                    image = bitmap.to_pil().convert("RGB")
+                finally:
+                    page.close()
+                image.save(f"{output_dir}/pages/{i + 1}.webp", "WEBP", quality=WEBP_QUALITY)
+                thumbnails.append(image)
+
+            cell_width = max(image.width for image in thumbnails)
+            cell_height = max(image.height for image in thumbnails)
+            rows = (len(thumbnails) + SPRITE_COLUMNS - 1) // SPRITE_COLUMNS
+            columns = min(len(thumbnails), SPRITE_COLUMNS)
+            sheet = Image.new("RGB", (cell_width * columns, cell_height * rows), "white")
+            for n, image in enumerate(thumbnails):
+                sheet.paste(image, ((n % SPRITE_COLUMNS) * cell_width, (n // SPRITE_COLUMNS) * cell_height))
+            sheet.save(f"{output_dir}/sprites/{sprite_index}.webp", "WEBP", quality=WEBP_QUALITY)
+
+            sprites.append({
+                "index": sprite_index,
+                "first_page": first + 1,
+                "last_page": last,
+                "cell_width": cell_width,
+                "cell_height": cell_height
+            })
+    finally:
+        pdf.close()
+
+    manifest = {
+        "page_count": page_count,
+        "pages_per_sprite": SPRITE_PAGES,
+        "columns": SPRITE_COLUMNS,
+        "sprites": sprites
+    }
+    with open(f"{output_dir}/{MANIFEST_NAME}", "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    return manifest
+
+
+class ThumbnailService:
+    """
+    교재 페이지 썸네일 서비스
+
+    결과는 파일 내용(file_url) 기준 키 디렉토리에 저장되므로 같은 파일을 쓰는
+    교재끼리 공유되고, 키가 URL에 포함되어 immutable 캐시로 제공할 수 있다.
+    이미지 URL에는 만료 시각 없이 키에 대한 서명만 경로로 넣어 URL이 바뀌지 않게 한다
+    (키는 내용이 바뀌면 달라지므로 캐시가 무효화될 일이 없음).
+    """
+
+    CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+    @staticmethod
+    def key_for(file_url: str) -> str:
+        return hashlib.sha256(file_url.encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def directory_for(file_url: str) -> str:
+        return f"{settings.THUMBNAIL_DIR}/{ThumbnailService.key_for(file_url)}"
+
+    @staticmethod
+    async def generate(file_url: str, executor) -> Optional[Dict]:
+        """썸네일 생성 (이미 있으면 건너뜀)"""
+        source_path = FileService.local_path(file_url)
+        if not source_path or not os.path.exists(source_path):
+            return None
+
+        output_dir = ThumbnailService.directory_for(file_url)
+        if os.path.exists(f"{output_dir}/{MANIFEST_NAME}"):
+            return None
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, render_thumbnails, source_path, output_dir)
+
+    @staticmethod
+    def _read_manifest(output_dir: str) -> Optional[Dict]:
+        try:
+            with open(f"{output_dir}/{MANIFEST_NAME}", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def signature_for(key: str) -> str:
+        """
+        썸네일 이미지용 서명 (키 하나에 대한 서명으로 모든 페이지/스프라이트에 사용)
+        - 내용 키만 알아서는 이미지를 받을 수 없도록 썸네일 목록 조회 권한이 있을 때만 발급
+        """
+        message = f"thumbnails:{key}".encode("utf-8")
+        return hmac.new(settings.SECRET_KEY.encode("utf-8"), message, hashlib.sha256).hexdigest()[:32]
+
+    @staticmethod
+    async def get_manifest(textbook: Textbook, base_url: str) -> Dict:
+        """
+        썸네일 목록 (스프라이트 URL과 칸 크기 포함)
+        - 이미지 URL은 인증 헤더를 붙일 수 없는 <img>/CSS에서 쓰도록 서명이 경로에 포함된 고정 URL
+        """
+        key = ThumbnailService.key_for(textbook.file_url)
+        manifest = await run_in_threadpool(
+            ThumbnailService._read_manifest, ThumbnailService.directory_for(textbook.file_url)
+        )
+        if manifest is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="썸네일이 아직 생성되지 않았습니다"
+            )
+
+        prefix = f"{base_url}/{key}/{ThumbnailService.signature_for(key)}"
+        return {
+            **manifest,
+            "key": key,
+            "page_url_template": f"{prefix}/pages/{{page}}.webp",
+            "sprites": [
+                {**sprite, "url": f"{prefix}/sprites/{sprite['index']}.webp"}
+                for sprite in manifest["sprites"]
+            ]
+        }
+
+    @staticmethod
+    def get_image_path(key: str, signature: str, kind: str, number: int) -> str:
+        """서명 확인 후 썸네일/스프라이트 파일 경로 (서명이 틀리면 403, 없으면 404)"""
+        if not hmac.compare_digest(ThumbnailService.signature_for(key), signature):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="유효하지 않은 링크입니다"
+            )
+        path = f"{settings.THUMBNAIL_DIR}/{key}/{kind}/{number}.webp"
+        if kind not in ("pages", "sprites") or not os.path.exists(path):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="썸네일을 찾을 수 없습니다"
+            )
+        return path
@@ -0,0 +1,195 @@
+"""과목별 검수 카운터 서비스"""
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlmodel import Session, select, func
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.subject import Subject
+from app.models.chapter import Chapter
+from app.models.question import Question
+from app.models.validation_counter import SubjectValidationCounter
+
+
+COUNTER_FIELDS = [
+    "chapter_count",
+    "chapters_with_textbook",
+    "chapters_with_video",
+    "chapters_complete",
+    "question_count",
+    "questions_with_textbook",
+]
+
+
+class ValidationCounterService:
+    """
+    과목별 검수 카운터 서비스
+
+    ChapterService/QuestionService가 목차/문제를 바꿀 때 같은 트랜잭션에서
+    apply()로 증감하고(내용 버전도 증가), recompute()/recompute_all()로
+    원본 테이블에서 다시 계산한다. 변경 전 상태는 호출자가 행을 잠근 뒤
+    (SELECT ... FOR UPDATE) 읽어야 동시 수정에도 증감이 어긋나지 않는다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    @staticmethod
+    def chapter_state(textbook_page: Optional[int], video_id: Optional[UUID]) -> Counter:
+        """목차 한 건이 카운터에 기여하는 값"""
+        has_textbook = textbook_page is not None
+        has_video = video_id is not None
+        return Counter({
+            "chapter_count": 1,
+            "chapters_with_textbook": int(has_textbook),
+            "chapters_with_video": int(has_video),
+            "chapters_complete": int(has_textbook and has_video),
+        })
+
+    @staticmethod
+    def question_state(textbook_page: Optional[int]) -> Counter:
+        """문제 한 건이 카운터에 기여하는 값"""
+        return Counter({
+            "question_count": 1,
+            "questions_with_textbook": int(textbook_page is not None),
+        })
+
+    @staticmethod
+    def diff(before: Counter, after: Counter) -> Counter:
+        """변경 전후 기여값의 차이"""
+        delta = Counter(after)
+        delta.subtract(before)
+        return delta
+
+    def apply(self, subject_id: UUID, delta: Counter) -> None:
+        """카운터 증감 및 내용 버전 증가 (커밋은 호출자가 수행)"""
+        values = {key: value for key, value in delta.items() if value}
+
+        statement = update(SubjectValidationCounter).where(
+            SubjectValidationCounter.subject_id == subject_id
+        ).values(
+            **{
+                key: getattr(SubjectValidationCounter, key) + value
+                for key, value in values.items()
+            },
+            content_version=SubjectValidationCounter.content_version + 1,
+            updated_at=datetime.utcnow()
+        ).execution_options(synchronize_session=False)
+        result = self.session.execute(statement)
+
+        # 카운터 행이 없으면 원본 테이블에서 새로 계산
+        if result.rowcount == 0:
+            self.session.flush()
+            self.recompute(subject_id)
+
+    def bump_version(self, subject_id: UUID) -> None:
+        """카운터 값은 그대로 두고 내용 버전만 증가 (목차 제목/순서 변경 등, 커밋은 호출자가 수행)"""
+        self.apply(subject_id, Counter())
+
+    def _aggregate_statement(self, subject_id: Optional[UUID] = None, subject_ids=None):
+        """원본 테이블에서 카운터 값을 계산하는 SELECT (subject_ids: 대상 과목 id SELECT)"""
+        has_chapter_textbook = Chapter.textbook_page.isnot(None)
+        has_video = Chapter.video_id.isnot(None)
+
+        chapters = select(
+            Chapter.subject_id,
+            func.count(Chapter.id).label("chapter_count"),
+            func.count(Chapter.id).filter(has_chapter_textbook).label("chapters_with_textbook"),
+            func.count(Chapter.id).filter(has_video).label("chapters_with_video"),
+            func.count(Chapter.id).filter(has_chapter_textbook, has_video).label("chapters_complete")
+        ).group_by(Chapter.subject_id)
+
+        questions = select(
+            Question.subject_id,
+            func.count(Question.id).label("question_count"),
+            func.count(Question.id).filter(Question.textbook_page.isnot(None)).label("questions_with_textbook")
+        ).group_by(Question.subject_id)
+
+        if subject_id is not None:
+            chapters = chapters.where(Chapter.subject_id == subject_id)
+            questions = questions.where(Question.subject_id == subject_id)
+        if subject_ids is not None:
+            chapters = chapters.where(Chapter.subject_id.in_(subject_ids))
+            questions = questions.where(Question.subject_id.in_(subject_ids))
+
+        chapters = chapters.subquery()
+        questions = questions.subquery()
+
+        statement = select(
+            Subject.id,
+            func.coalesce(chapters.c.chapter_count, 0),
+            func.coalesce(chapters.c.chapters_with_textbook, 0),
+            func.coalesce(chapters.c.chapters_with_video, 0),
+            func.coalesce(chapters.c.chapters_complete, 0),
+            func.coalesce(questions.c.question_count, 0),
+            func.coalesce(questions.c.questions_with_textbook, 0),
+            func.timezone("utc", func.now())
+        ).select_from(Subject).outerjoin(
+            chapters, chapters.c.subject_id == Subject.id
+        ).outerjoin(
+            questions, questions.c.subject_id == Subject.id
+        )
+        if subject_id is not None:
+            statement = statement.where(Subject.id == subject_id)
+        if subject_ids is not None:
+            statement = statement.where(Subject.id.in_(subject_ids))
+        return statement
+
+    def _upsert(self, subject_id: Optional[UUID] = None) -> int:
+        """계산 결과로 카운터 행 삽입/갱신"""
+        statement = pg_insert(SubjectValidationCounter).from_select(
+            ["subject_id", *COUNTER_FIELDS, "updated_at"],
+            self._aggregate_statement(subject_id)
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["subject_id"],
+            set_={
+                **{
+                    field: statement.excluded[field]
+                    for field in [*COUNTER_FIELDS, "updated_at"]
+                },
+                "content_version": SubjectValidationCounter.content_version + 1
+            }
+        )
+        return self.session.execute(statement).rowcount
+
+    def insert_missing_statement(self, certificate_id: UUID):
+        """
+        자격증 과목 중 카운터 행이 없는 과목만 계산해 삽입하는 INSERT ... RETURNING
+        - 조회 쿼리의 CTE로 사용하면 같은 문장에서 삽입된 카운터 값도 함께 읽을 수 있음
+        """
+        missing = select(Subject.id).where(
+            Subject.certificate_id == certificate_id,
+            ~select(SubjectValidationCounter.subject_id).where(
+                SubjectValidationCounter.subject_id == Subject.id
+            ).exists()
+        )
+        statement = pg_insert(SubjectValidationCounter).from_select(
+            ["subject_id", *COUNTER_FIELDS, "updated_at"],
+            self._aggregate_statement(subject_ids=missing)
+        )
+        return statement.on_conflict_do_nothing(index_elements=["subject_id"]).returning(
+            SubjectValidationCounter.subject_id,
+            *[getattr(SubjectValidationCounter, field) for field in COUNTER_FIELDS]
+        )
+
+    def recompute(self, subject_id: UUID) -> None:
+        """과목 카운터 재계산 (커밋은 호출자가 수행)"""
+        self._upsert(subject_id)
+
+    def recompute_all(self) -> int:
+        """전체 과목 카운터 재계산 후 커밋 (복구 작업)"""
+        count = self._upsert()
+        self.session.commit()
+        return count
+
+    def get(self, subject_id: UUID) -> SubjectValidationCounter:
+        """과목 카운터 조회 (없으면 계산 후 저장)"""
+        counter = self.session.get(SubjectValidationCounter, subject_id)
+        if counter is None:
+            self.recompute(subject_id)
+            self.session.commit()
+            counter = self.session.get(SubjectValidationCounter, subject_id)
+        return counter
@@ -1,196 +1,646 @@
 """검수(Validation) 서비스"""
-from typing import List, Dict, Tuple
+import json
+import threading
+from collections import OrderedDict
+from typing import Iterator, List, Dict, Tuple, Optional
 from uuid import UUID
 from sqlmodel import Session, select, func
+from sqlalchemy import case, and_, or_, tuple_, literal_column, null, cast, union_all, Integer, String
+from sqlalchemy.dialects.postgresql import array, ARRAY
+from sqlalchemy.orm import aliased
 from fastapi import HTTPException, status
 
+from app.core.database import engine
 from app.models.subject import Subject
 from app.models.certificate import Certificate
 from app.models.chapter import Chapter
 from app.models.question import Question
-from app.schemas.validation import (
-    ValidationStatus,
-    ChapterValidationItem,
-    QuestionValidationItem,
-)
+from app.models.textbook import Textbook
+from app.models.video import Video
+from app.models.validation_counter import SubjectValidationCounter
+from app.schemas.validation import ValidationStatus
+from app.services.validation_counter_service import ValidationCounterService, COUNTER_FIELDS
+
+
+class ValidationResultCache:
+    """
+    전체 검수 결과 캐시 (프로세스 내, LRU)
+    - 키에 과목 내용 버전이 포함되므로 변경 시 별도 무효화가 필요 없음
+    - 항목 수가 아니라 결과의 JSON 크기 합으로 제한 (한 결과가 상한을 넘으면 저장하지 않음)
+    """
+
+    MAX_BYTES = 8 * 1024 * 1024
+
+    def __init__(self):
+        self._results: "OrderedDict[tuple, Tuple[Dict, int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Dict]:
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+            self._results.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: tuple, result: Dict) -> None:
+        size = len(json.dumps(result, default=str))
+        if size > self.MAX_BYTES:
+            return
+        with self._lock:
+            previous = self._results.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._results[key] = (result, size)
+            self._size += size
+            while self._size > self.MAX_BYTES:
+                _, (_, evicted_size) = self._results.popitem(last=False)
+                self._size -= evicted_size
+
+
+validation_result_cache = ValidationResultCache()
+
+
+# 교차 정합성 규칙 (규칙 -> 메시지)
+CONSISTENCY_RULES = {
+    "textbook_page_out_of_range": "교재 전체 페이지 수를 초과한 페이지",
+    "video_start_out_of_range": "영상 길이를 초과한 시작 시간",
+    "textbook_page_out_of_order": "목차 순서상 앞 단원보다 앞선 교재 페이지",
+    "question_chapter_mismatch": "다른 과목의 목차에 연결된 문제",
+}
 
 
 class ValidationService:
     """검수 서비스"""
     
+    STREAM_BATCH_SIZE = 1000
+    
     def __init__(self, session: Session):
         self.session = session
+        self.counters = ValidationCounterService(session)
 
-    def _verify_subject_ownership(self, subject_id: UUID, creator_id: UUID) -> Subject:
-        """과목 소유권 확인"""
-        statement = select(Subject).join(Certificate).where(
+    def _chapter_status_expr(self):
+        """목차 검수 상태 (SQL CASE)"""
+        has_textbook = Chapter.textbook_page.isnot(None)
+        has_video = Chapter.video_id.isnot(None)
+        return case(
+            (and_(has_textbook, has_video), ValidationStatus.OK.value),
+            (or_(has_textbook, has_video), ValidationStatus.WARNING.value),
+            else_=ValidationStatus.ERROR.value
+        )
+
+    def _question_status_expr(self):
+        """문제 검수 상태 (SQL CASE, 문제는 교재 매핑만 검수)"""
+        return case(
+            (Question.textbook_page.isnot(None), ValidationStatus.OK.value),
+            else_=ValidationStatus.WARNING.value
+        )
+
+    def _chapter_summary(self, counter) -> Dict:
+        """목차 검수 요약 (카운터 행 또는 같은 컬럼의 집계 행)"""
+        total = counter.chapter_count
+        ok = counter.chapters_complete
+        error = total - counter.chapters_with_textbook - counter.chapters_with_video + ok
+        return {
+            "total": total,
+            "with_textbook": counter.chapters_with_textbook,
+            "with_video": counter.chapters_with_video,
+            "ok": ok,
+            "warning": total - ok - error,
+            "error": error,
+            "textbook_percentage": round(counter.chapters_with_textbook / total * 100, 1) if total else 0,
+            "video_percentage": round(counter.chapters_with_video / total * 100, 1) if total else 0
+        }
+
+    def _question_summary(self, counter) -> Dict:
+        """
+        문제 검수 요약 (카운터 행 또는 같은 컬럼의 집계 행)
+        - 문제는 오류 상태가 없지만 상태별 필터/페이지 계산을 위해 error도 0으로 포함
+        """
+        total = counter.question_count
+        with_textbook = counter.questions_with_textbook
+        return {
+            "total": total,
+            "with_textbook": with_textbook,
+            "ok": with_textbook,
+            "warning": total - with_textbook,
+            "error": 0,
+            "textbook_percentage": round(with_textbook / total * 100, 1) if total else 0
+        }
+
+    def _overall_status(self, chapter_summary: Dict, question_summary: Dict) -> Tuple[ValidationStatus, float]:
+        """전체 상태와 완료율"""
+        total_items = chapter_summary["total"] + question_summary["total"]
+        ok_items = chapter_summary["ok"] + question_summary["ok"]
+        
+        if total_items == 0:
+            return ValidationStatus.ERROR, 0
+        
+        completion = round(ok_items / total_items * 100, 1)
+        if completion >= 100:
+            overall_status = ValidationStatus.OK
+        elif completion >= 50:
+            overall_status = ValidationStatus.WARNING
+        else:
+            overall_status = ValidationStatus.ERROR
+        return overall_status, completion
+
+    def _page_info(self, summary: Dict, status_filter: Optional[ValidationStatus], skip: int, limit: Optional[int]) -> Dict:
+        """페이지 정보 (필터에 맞는 전체 항목 수는 요약에서 계산)"""
+        total = summary[status_filter.value] if status_filter else summary["total"]
+        return {"skip": skip, "limit": limit, "total": total}
+
+    def _load_subject(self, subject_id: UUID, creator_id: UUID) -> Tuple[Subject, SubjectValidationCounter]:
+        """소유권 확인과 카운터 조회를 한 번의 쿼리로"""
+        statement = select(Subject, SubjectValidationCounter).join(Certificate).outerjoin(
+            SubjectValidationCounter,
+            SubjectValidationCounter.subject_id == Subject.id
+        ).where(
             Subject.id == subject_id,
             Certificate.creator_id == creator_id
         )
-        subject = self.session.exec(statement).first()
-        if not subject:
+        row = self.session.exec(statement).first()
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="과목을 찾을 수 없습니다"
             )
-        return subject
-
-    def validate_chapters(self, subject_id: UUID, creator_id: UUID) -> Dict:
-        """목차 검수"""
-        subject = self._verify_subject_ownership(subject_id, creator_id)
-        
-        # 모든 목차 조회
-        statement = select(Chapter).where(
-            Chapter.subject_id == subject_id
-        ).order_by(Chapter.depth, Chapter.order_index)
-        chapters = list(self.session.exec(statement).all())
-        
-        items = []
-        ok_count = 0
-        warning_count = 0
-        error_count = 0
-        textbook_count = 0
-        video_count = 0
-        
-        for chapter in chapters:
-            has_textbook = chapter.textbook_page is not None
-            has_video = chapter.video_id is not None
-            
-            if has_textbook:
-                textbook_count += 1
-            if has_video:
-                video_count += 1
-            
-            # 상태 판단
-            if has_textbook and has_video:
-                item_status = ValidationStatus.OK
-                message = None
-                ok_count += 1
-            elif has_textbook or has_video:
-                item_status = ValidationStatus.WARNING
-                if not has_textbook:
-                    message = "교재 매핑 누락"
-                else:
-                    message = "영상 매핑 누락"
-                warning_count += 1
-            else:
-                item_status = ValidationStatus.ERROR
-                message = "교재, 영상 모두 매핑 누락"
-                error_count += 1
-            
-            items.append(ChapterValidationItem(
-                id=chapter.id,
-                title=chapter.title,
-                depth=chapter.depth,
-                has_textbook_mapping=has_textbook,
-                has_video_mapping=has_video,
-                textbook_page=chapter.textbook_page,
-                video_start_seconds=chapter.video_start_seconds,
-                status=item_status,
-                message=message
-            ))
+        subject, counter = row
+        if counter is None:
+            counter = self.counters.get(subject_id)
+        return subject, counter
+
+    def _chapter_items_statement(self, subject_id: UUID, status_filter: Optional[ValidationStatus]):
+        """목차 검수 항목 조회 (상태 필터는 SQL에서 적용)"""
+        has_video = Chapter.video_id.isnot(None)
+        status_expr = self._chapter_status_expr()
         
-        summary = {
-            "total": len(chapters),
-            "with_textbook": textbook_count,
-            "with_video": video_count,
-            "ok": ok_count,
-            "warning": warning_count,
-            "error": error_count,
-            "textbook_percentage": round(textbook_count / len(chapters) * 100, 1) if chapters else 0,
-            "video_percentage": round(video_count / len(chapters) * 100, 1) if chapters else 0
+        statement = select(
+            Chapter.id,
+            Chapter.title,
+            Chapter.depth,
+            Chapter.textbook_page,
+            Chapter.video_start_seconds,
+            has_video.label("has_video"),
+            status_expr.label("status")
+        ).where(Chapter.subject_id == subject_id)
+        if status_filter:
+            statement = statement.where(status_expr == status_filter.value)
+        return statement.order_by(Chapter.depth, Chapter.order_index, Chapter.id)
+
+    def _chapter_item(self, row) -> Dict:
+        """목차 검수 항목 한 건"""
+        has_textbook = row.textbook_page is not None
+        if row.status == ValidationStatus.OK.value:
+            message = None
+        elif row.status == ValidationStatus.WARNING.value:
+            message = "교재 매핑 누락" if not has_textbook else "영상 매핑 누락"
+        else:
+            message = "교재, 영상 모두 매핑 누락"
+        
+        return {
+            "id": row.id,
+            "title": row.title,
+            "depth": row.depth,
+            "has_textbook_mapping": has_textbook,
+            "has_video_mapping": row.has_video,
+            "textbook_page": row.textbook_page,
+            "video_start_seconds": row.video_start_seconds,
+            "status": ValidationStatus(row.status),
+            "message": message
         }
+
+    def _chapter_items(
+        self,
+        subject_id: UUID,
+        status_filter: Optional[ValidationStatus],
+        skip: int,
+        limit: Optional[int]
+    ) -> List[Dict]:
+        """목차 검수 항목 (상태 필터/페이지는 SQL에서 적용)"""
+        statement = self._chapter_items_statement(subject_id, status_filter).offset(skip)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return [self._chapter_item(row) for row in self.session.exec(statement).all()]
+
+    def _question_items_statement(self, subject_id: UUID, status_filter: Optional[ValidationStatus]):
+        """문제 검수 항목 조회 (내용은 미리보기 100자만 조회)"""
+        status_expr = self._question_status_expr()
         
+        statement = select(
+            Question.id,
+            func.left(Question.content, 100).label("content"),
+            (func.length(Question.content) > 100).label("truncated"),
+            Question.textbook_page,
+            status_expr.label("status")
+        ).where(Question.subject_id == subject_id)
+        if status_filter:
+            statement = statement.where(status_expr == status_filter.value)
+        return statement.order_by(Question.order_index, Question.id)
+
+    def _question_item(self, row) -> Dict:
+        """문제 검수 항목 한 건"""
+        is_ok = row.status == ValidationStatus.OK.value
         return {
-            "summary": summary,
-            "items": [item.model_dump() for item in items]
+            "id": row.id,
+            "content": row.content + "..." if row.truncated else row.content,
+            "has_textbook_mapping": row.textbook_page is not None,
+            "textbook_page": row.textbook_page,
+            "status": ValidationStatus(row.status),
+            "message": None if is_ok else "교재 매핑 누락"
         }
 
-    def validate_questions(self, subject_id: UUID, creator_id: UUID) -> Dict:
-        """문제 검수"""
-        subject = self._verify_subject_ownership(subject_id, creator_id)
-        
-        # 모든 문제 조회
-        statement = select(Question).where(
-            Question.subject_id == subject_id
-        ).order_by(Question.order_index)
-        questions = list(self.session.exec(statement).all())
-        
-        items = []
-        ok_count = 0
-        warning_count = 0
-        textbook_count = 0
-        
-        for question in questions:
-            has_textbook = question.textbook_page is not None
-            
-            if has_textbook:
-                textbook_count += 1
-            
-            # 상태 판단 (문제는 교재 매핑만 검수)
-            if has_textbook:
-                item_status = ValidationStatus.OK
-                message = None
-                ok_count += 1
-            else:
-                item_status = ValidationStatus.WARNING
-                message = "교재 매핑 누락"
-                warning_count += 1
-            
-            items.append(QuestionValidationItem(
-                id=question.id,
-                content=question.content[:100] + "..." if len(question.content) > 100 else question.content,
-                has_textbook_mapping=has_textbook,
-                textbook_page=question.textbook_page,
-                status=item_status,
-                message=message
-            ))
+    def _question_items(
+        self,
+        subject_id: UUID,
+        status_filter: Optional[ValidationStatus],
+        skip: int,
+        limit: Optional[int]
+    ) -> List[Dict]:
+        """문제 검수 항목 (내용은 미리보기 100자만 조회)"""
+        statement = self._question_items_statement(subject_id, status_filter).offset(skip)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return [self._question_item(row) for row in self.session.exec(statement).all()]
+
+    def validate_chapters(
+        self,
+        subject_id: UUID,
+        creator_id: UUID,
+        status_filter: Optional[ValidationStatus] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> Dict:
+        """목차 검수 (요약은 카운터, 항목은 상태 필터/페이지 적용)"""
+        _, counter = self._load_subject(subject_id, creator_id)
+        summary = self._chapter_summary(counter)
         
-        summary = {
-            "total": len(questions),
-            "with_textbook": textbook_count,
-            "ok": ok_count,
-            "warning": warning_count,
-            "textbook_percentage": round(textbook_count / len(questions) * 100, 1) if questions else 0
+        return {
+            "summary": summary,
+            "items": self._chapter_items(subject_id, status_filter, skip, limit),
+            "pagination": self._page_info(summary, status_filter, skip, limit)
         }
+
+    def validate_questions(
+        self,
+        subject_id: UUID,
+        creator_id: UUID,
+        status_filter: Optional[ValidationStatus] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> Dict:
+        """문제 검수 (요약은 카운터, 항목은 상태 필터/페이지 적용)"""
+        _, counter = self._load_subject(subject_id, creator_id)
+        summary = self._question_summary(counter)
         
         return {
             "summary": summary,
-            "items": [item.model_dump() for item in items]
+            "items": self._question_items(subject_id, status_filter, skip, limit),
+            "pagination": self._page_info(summary, status_filter, skip, limit)
         }
 
-    def get_full_validation(self, subject_id: UUID, creator_id: UUID) -> Dict:
+    def _build_full_validation(
+        self,
+        subject: Subject,
+        counter: SubjectValidationCounter,
+        status_filter: Optional[ValidationStatus],
+        limit: Optional[int]
+    ) -> Dict:
+        """전체 검수 결과 구성 (소유권 확인 이후 한 번에)"""
+        chapter_summary = self._chapter_summary(counter)
+        question_summary = self._question_summary(counter)
+        overall_status, completion = self._overall_status(chapter_summary, question_summary)
+        
+        return {
+            "subject_id": str(subject.id),
+            "subject_name": subject.name,
+            "chapter_validation": {
+                "summary": chapter_summary,
+                "items": self._chapter_items(subject.id, status_filter, 0, limit),
+                "pagination": self._page_info(chapter_summary, status_filter, 0, limit)
+            },
+            "question_validation": {
+                "summary": question_summary,
+                "items": self._question_items(subject.id, status_filter, 0, limit),
+                "pagination": self._page_info(question_summary, status_filter, 0, limit)
+            },
+            "overall_status": overall_status,
+            "completion_percentage": completion
+        }
+
+    def get_full_validation(
+        self,
+        subject_id: UUID,
+        creator_id: UUID,
+        status_filter: Optional[ValidationStatus] = None,
+        limit: Optional[int] = None
+    ) -> Dict:
         """전체 검수 결과"""
-        subject = self._verify_subject_ownership(subject_id, creator_id)
+        subject, counter = self._load_subject(subject_id, creator_id)
+        return self._build_full_validation(subject, counter, status_filter, limit)
+
+    def get_full_validation_cached(
+        self,
+        subject_id: UUID,
+        creator_id: UUID,
+        status_filter: Optional[ValidationStatus] = None,
+        limit: Optional[int] = None,
+        if_none_match: Optional[str] = None
+    ) -> Tuple[str, Optional[Dict]]:
+        """
+        전체 검수 결과 (내용 버전 기반 캐시)
+        - (ETag, 결과) 반환, If-None-Match가 일치하면 결과는 None
+        """
+        subject, counter = self._load_subject(subject_id, creator_id)
         
-        chapter_result = self.validate_chapters(subject_id, creator_id)
-        question_result = self.validate_questions(subject_id, creator_id)
+        cache_key = (
+            subject_id,
+            counter.content_version,
+            status_filter.value if status_filter else None,
+            limit
+        )
+        etag = '"' + "-".join(str(part) for part in cache_key) + '"'
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return etag, None
         
-        # 전체 상태 판단
-        chapter_summary = chapter_result["summary"]
-        question_summary = question_result["summary"]
+        # limit 없는 요청은 결과 크기가 과목 크기에 비례하므로 캐시하지 않음 (ETag 304만 적용)
+        result = validation_result_cache.get(cache_key) if limit else None
+        if result is None:
+            result = self._build_full_validation(subject, counter, status_filter, limit)
+            if limit:
+                validation_result_cache.set(cache_key, result)
+        # 과목명은 내용 버전과 무관하게 바뀔 수 있으므로 항상 최신 값 사용
+        return etag, {**result, "subject_name": subject.name}
+
+    def _stream_lines(self, records: Iterator[Dict]) -> Iterator[bytes]:
+        """레코드를 NDJSON 줄로 변환"""
+        for record in records:
+            yield (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+    def _iter_item_records(
+        self,
+        subject_id: UUID,
+        status_filter: Optional[ValidationStatus]
+    ) -> Iterator[Dict]:
+        """서버 측 커서로 목차, 문제 항목을 차례로 조회 (스트리밍 전용 세션)"""
+        with Session(engine) as session:
+            for record_type, statement, to_item in (
+                ("chapter", self._chapter_items_statement(subject_id, status_filter), self._chapter_item),
+                ("question", self._question_items_statement(subject_id, status_filter), self._question_item),
+            ):
+                result = session.exec(
+                    statement.execution_options(yield_per=self.STREAM_BATCH_SIZE)
+                )
+                for partition in result.partitions():
+                    for row in partition:
+                        yield {"type": record_type, **to_item(row)}
+
+    def stream_full_validation(
+        self,
+        subject_id: UUID,
+        creator_id: UUID,
+        status_filter: Optional[ValidationStatus] = None
+    ) -> Iterator[bytes]:
+        """
+        전체 검수 결과 NDJSON 스트림
+        - 첫 줄은 요약(type=summary), 이후 목차(type=chapter), 문제(type=question) 항목
+        - 소유권 확인과 요약은 호출 시점에 요청 세션으로 처리
+        """
+        subject, counter = self._load_subject(subject_id, creator_id)
+        chapter_summary = self._chapter_summary(counter)
+        question_summary = self._question_summary(counter)
+        overall_status, completion = self._overall_status(chapter_summary, question_summary)
         
-        total_items = chapter_summary["total"] + question_summary["total"]
-        ok_items = chapter_summary["ok"] + question_summary["ok"]
+        summary = {
+            "type": "summary",
+            "subject_id": str(subject.id),
+            "subject_name": subject.name,
+            "chapter_summary": chapter_summary,
+            "question_summary": question_summary,
+            "overall_status": overall_status,
+            "completion_percentage": completion
+        }
         
-        if total_items == 0:
-            overall_status = ValidationStatus.ERROR
-            completion = 0
-        else:
-            completion = round(ok_items / total_items * 100, 1)
-            if completion >= 100:
-                overall_status = ValidationStatus.OK
-            elif completion >= 50:
-                overall_status = ValidationStatus.WARNING
-            else:
-                overall_status = ValidationStatus.ERROR
+        def records() -> Iterator[Dict]:
+            yield summary
+            yield from self._iter_item_records(subject_id, status_filter)
+        
+        return self._stream_lines(records())
+
+    def get_summary(self, subject_id: UUID, creator_id: UUID) -> Dict:
+        """검수 요약만 조회 (카운터 한 행 조회)"""
+        subject, counter = self._load_subject(subject_id, creator_id)
+        
+        chapter_summary = self._chapter_summary(counter)
+        question_summary = self._question_summary(counter)
+        overall_status, completion = self._overall_status(chapter_summary, question_summary)
         
         return {
             "subject_id": str(subject_id),
             "subject_name": subject.name,
-            "chapter_validation": chapter_result,
-            "question_validation": question_result,
+            "chapter_summary": chapter_summary,
+            "question_summary": question_summary,
             "overall_status": overall_status,
             "completion_percentage": completion
         }
 
+    def _certificate_rollup_rows(self, certificate_id: UUID) -> list:
+        """
+        과목별 카운터와 자격증 합계를 한 번의 그룹 쿼리로 조회
+        - 카운터 행이 없는 과목은 같은 문장의 CTE에서 계산해 삽입하고 그 값을 함께 집계
+          (PostgreSQL은 같은 문장에서 삽입한 행을 본 쿼리에서 볼 수 없으므로 RETURNING 결과를 합침)
+        """
+        inserted = self.counters.insert_missing_statement(certificate_id).cte("inserted_counters")
+        subject_ids = select(Subject.id).where(Subject.certificate_id == certificate_id)
+        counters = union_all(
+            select(
+                SubjectValidationCounter.subject_id,
+                *[getattr(SubjectValidationCounter, field) for field in COUNTER_FIELDS]
+            ).where(SubjectValidationCounter.subject_id.in_(subject_ids)),
+            select(inserted.c.subject_id, *[inserted.c[field] for field in COUNTER_FIELDS])
+        ).subquery("counters")
+        
+        statement = select(
+            Subject.id.label("subject_id"),
+            Subject.name.label("subject_name"),
+            *[
+                func.coalesce(func.sum(counters.c[field]), 0).label(field)
+                for field in COUNTER_FIELDS
+            ]
+        ).select_from(Subject).outerjoin(
+            counters,
+            counters.c.subject_id == Subject.id
+        ).where(
+            Subject.certificate_id == certificate_id
+        ).group_by(
+            func.grouping_sets(
+                tuple_(Subject.id, Subject.name, Subject.order_index),
+                tuple_()
+            )
+        ).order_by(Subject.order_index)
+        rows = list(self.session.exec(statement).all())
+        self.session.commit()
+        return rows
+
+    def get_certificate_validation(self, certificate_id: UUID, creator_id: UUID) -> Dict:
+        """자격증 전체 검수 요약 (과목별 + 전체 완료율)"""
+        statement = select(Certificate).where(
+            Certificate.id == certificate_id,
+            Certificate.creator_id == creator_id
+        )
+        certificate = self.session.exec(statement).first()
+        if not certificate:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="자격증을 찾을 수 없습니다"
+            )
+        
+        rows = self._certificate_rollup_rows(certificate_id)
+        
+        subjects = []
+        total_row = None
+        for row in rows:
+            if row.subject_id is None:
+                total_row = row
+                continue
+            chapter_summary = self._chapter_summary(row)
+            question_summary = self._question_summary(row)
+            overall_status, completion = self._overall_status(chapter_summary, question_summary)
+            subjects.append({
+                "subject_id": str(row.subject_id),
+                "subject_name": row.subject_name,
+                "chapter_summary": chapter_summary,
+                "question_summary": question_summary,
+                "overall_status": overall_status,
+                "completion_percentage": completion
+            })
+        
+        chapter_summary = self._chapter_summary(total_row)
+        question_summary = self._question_summary(total_row)
+        overall_status, completion = self._overall_status(chapter_summary, question_summary)
+        
+        return {
+            "certificate_id": str(certificate_id),
+            "certificate_name": certificate.name,
+            "subjects": subjects,
+            "chapter_summary": chapter_summary,
+            "question_summary": question_summary,
+            "overall_status": overall_status,
+            "completion_percentage": completion
+        }
+
+    def _consistency_statement(self, subject_id: UUID):
+        """교차 정합성 규칙을 하나의 UNION ALL 쿼리로 구성"""
+        def columns(rule: str, entity: str, item_id, title, value, bound):
+            return [
+                # UNION ALL 각 분기에서 타입이 정해지도록 바인드 파라미터 대신 상수 사용
+                literal_column(f"'{rule}'", String).label("rule"),
+                literal_column(f"'{entity}'", String).label("entity"),
+                item_id.label("id"),
+                title.label("title"),
+                value.label("value"),
+                bound.label("bound"),
+            ]
+        
+        # 1) 교재 전체 페이지 수 초과 (페이지 수를 모르는 교재(0)는 제외)
+        max_pages = select(func.max(Textbook.total_pages)).where(
+            Textbook.subject_id == subject_id,
+            Textbook.total_pages > 0
+        ).scalar_subquery()
+        page_out_of_range = select(
+            *columns(
+                "textbook_page_out_of_range", "chapter",
+                Chapter.id, Chapter.title, Chapter.textbook_page, max_pages
+            )
+        ).where(
+            Chapter.subject_id == subject_id,
+            Chapter.textbook_page > max_pages
+        )
+        
+        # 2) 영상 길이 초과 (길이를 모르는 영상(0)은 제외)
+        video_out_of_range = select(
+            *columns(
+                "video_start_out_of_range", "chapter",
+                Chapter.id, Chapter.title, Chapter.video_start_seconds, Video.duration_seconds
+            )
+        ).join(Video, Video.id == Chapter.video_id).where(
+            Chapter.subject_id == subject_id,
+            Video.duration_seconds > 0,
+            Chapter.video_start_seconds > Video.duration_seconds
+        )
+        
+        # 3) 목차 순서(트리 전위 순회)상 직전 매핑 단원보다 앞선 페이지
+        toc = select(
+            Chapter.id.label("chapter_id"),
+            array([Chapter.order_index], type_=Integer).label("path")
+        ).where(
+            Chapter.subject_id == subject_id,
+            Chapter.parent_id.is_(None)
+        ).cte("toc_order", recursive=True)
+        child = aliased(Chapter)
+        toc = toc.union_all(
+            select(
+                child.id,
+                toc.c.path.op("||", return_type=ARRAY(Integer))(child.order_index)
+            ).join(toc, child.parent_id == toc.c.chapter_id)
+        )
+        ordered = select(
+            Chapter.id,
+            Chapter.title,
+            Chapter.textbook_page,
+            func.lag(Chapter.textbook_page).over(
+                order_by=(toc.c.path, Chapter.id)
+            ).label("previous_page")
+        ).join(toc, toc.c.chapter_id == Chapter.id).where(
+            Chapter.textbook_page.isnot(None)
+        ).subquery("ordered")
+        page_out_of_order = select(
+            *columns(
+                "textbook_page_out_of_order", "chapter",
+                ordered.c.id, ordered.c.title, ordered.c.textbook_page, ordered.c.previous_page
+            )
+        ).where(ordered.c.textbook_page < ordered.c.previous_page)
+        
+        # 4) 다른 과목의 목차에 연결된 문제
+        chapter_mismatch = select(
+            *columns(
+                "question_chapter_mismatch", "question",
+                Question.id, func.left(Question.content, 100), cast(null(), Integer), cast(null(), Integer)
+            )
+        ).join(Chapter, Chapter.id == Question.chapter_id).where(
+            Question.subject_id == subject_id,
+            Chapter.subject_id != subject_id
+        )
+        
+        return union_all(page_out_of_range, video_out_of_range, page_out_of_order, chapter_mismatch)
+
+    def get_consistency_issues(self, subject_id: UUID, creator_id: UUID) -> Dict:
+        """교차 정합성 검수 (교재/영상/목차 순서/문제-목차 과목)"""
+        self._load_subject(subject_id, creator_id)
+        
+        issues: Dict[str, List[Dict]] = {rule: [] for rule in CONSISTENCY_RULES}
+        for row in self.session.exec(self._consistency_statement(subject_id)).all():
+            issues[row.rule].append({
+                "id": row.id,
+                "entity": row.entity,
+                "title": row.title,
+                "value": row.value,
+                "limit": row.bound,
+                "status": ValidationStatus.ERROR,
+                "message": CONSISTENCY_RULES[row.rule]
+            })
+        
+        return {
+            "subject_id": str(subject_id),
+            "total": sum(len(items) for items in issues.values()),
+            "rules": [
+                {
+                    "rule": rule,
+                    "message": message,
+                    "count": len(issues[rule]),
+                    "items": issues[rule]
+                }
+                for rule, message in CONSISTENCY_RULES.items()
+            ]
+        }
@@ -0,0 +1,26 @@
+"""과목별 검수 카운터 복구 스크립트 (원본 테이블에서 재계산)"""
+import sys
+from uuid import UUID
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.services.validation_counter_service import ValidationCounterService
+
+
+def repair_validation_counters(subject_id: UUID | None = None):
+    """검수 카운터 재계산"""
+    with Session(engine) as session:
+        service = ValidationCounterService(session)
+        if subject_id:
+            service.recompute(subject_id)
+            session.commit()
+            print(f"✓ 과목 {subject_id} 카운터를 재계산했습니다.")
+        else:
+            count = service.recompute_all()
+            print(f"✓ {count}개 과목 카운터를 재계산했습니다.")
+
+
+if __name__ == "__main__":
+    print("검수 카운터 재계산 중...")
+    repair_validation_counters(UUID(sys.argv[1]) if len(sys.argv) > 1 else None)
+    print("완료!")
@@ -0,0 +1,46 @@
+"""교재 목차별 PDF 분할 스크립트 (CPU 코어 수만큼 병렬 처리)"""
+import asyncio
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from uuid import UUID
+from fastapi import HTTPException
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.models.textbook import Textbook
+from app.services.chapter_split_service import ChapterSplitService
+
+
+def split_textbook_chapters(textbook_id: UUID, max_depth: int = 0):
+    """목차별 PDF 생성 및 등록"""
+    with Session(engine) as session:
+        textbook = session.get(Textbook, textbook_id)
+        if not textbook:
+            print(f"✗ 교재 {textbook_id}를 찾을 수 없습니다.")
+            return
+
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            try:
+                files = asyncio.run(
+                    ChapterSplitService.split(session, textbook, executor, workers, max_depth)
+                )
+            except HTTPException as e:
+                print(f"✗ {e.detail}")
+                return
+
+        for item in files:
+            indent = "  " * item["depth"]
+            print(f"  {indent}{item['title']}: {item['from_page']}~{item['to_page']}페이지")
+        print(f"✓ {len(files)}개 목차 PDF를 만들었습니다. (워커 {workers}개)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python split_textbook_chapters.py <교재 ID> [목차 깊이(0=장)]")
+        sys.exit(1)
+
+    print("목차별 PDF 분할 중...")
+    split_textbook_chapters(UUID(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+    print("완료!")
@@ -0,0 +1,21 @@
+"""테스트 공통 픽스처 (DB 없이 API 호출: 인증/세션 의존성 대체)"""
+from types import SimpleNamespace
+from uuid import uuid4
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.deps import get_session, get_current_active_user
+
+
+@pytest.fixture
+def current_user():
+    return SimpleNamespace(id=uuid4(), is_active=True, role="creator")
+
+
+@pytest.fixture
+def client(current_user):
+    app.dependency_overrides[get_current_active_user] = lambda: current_user
+    app.dependency_overrides[get_session] = lambda: None
+    yield TestClient(app)
+    app.dependency_overrides.clear()
@@ -0,0 +1,73 @@
+"""교재 PDF 목차(outline)로 목차 트리 생성 테스트"""
+from types import SimpleNamespace
+from uuid import uuid4
+import pytest
+
+from app.services.chapter_service import outline_to_chapters
+from app.services.textbook_service import TextbookService
+
+OUTLINE = [
+    {"title": "1장", "page": 1, "depth": 0},
+    {"title": "1절", "page": 2, "depth": 1},
+    {"title": "소단원", "page": 3, "depth": 2},
+    {"title": "너무 깊은 항목", "page": 3, "depth": 3},
+    {"title": "2절", "page": 999, "depth": 1},
+    {"title": "  ", "page": 10, "depth": 0},
+    {"title": "건너뛴 깊이", "page": 11, "depth": 2},
+]
+
+
+def test_outline_to_chapters_builds_tree():
+    rows = outline_to_chapters(OUTLINE, total_pages=20)
+    by_title = {row["title"]: row for row in rows}
+
+    assert [row["title"] for row in rows] == ["1장", "1절", "소단원", "2절", "(제목 없음)", "건너뛴 깊이"]
+    assert by_title["1절"]["parent_id"] == by_title["1장"]["id"]
+    assert by_title["2절"]["order_index"] == 1
+    assert by_title["2절"]["textbook_page"] is None  # 교재 페이지 범위 밖
+    assert by_title["(제목 없음)"]["order_index"] == 1
+    # 중간 깊이를 건너뛴 항목은 바로 위 항목의 하위(depth 1)로
+    assert by_title["건너뛴 깊이"]["depth"] == 1
+    assert by_title["건너뛴 깊이"]["parent_id"] == by_title["(제목 없음)"]["id"]
+
+
+def test_outline_to_chapters_max_depth():
+    rows = outline_to_chapters(OUTLINE, total_pages=20, max_depth=0)
+
+    assert [row["depth"] for row in rows] == [0, 0]
+
+
+@pytest.fixture
+def textbook(monkeypatch):
+    textbook = SimpleNamespace(
+        id=uuid4(), subject_id=uuid4(), outline=OUTLINE, total_pages=20
+    )
+    monkeypatch.setattr(
+        TextbookService, "get_by_id",
+        lambda self, textbook_id, creator_id: textbook if textbook_id == textbook.id else None
+    )
+    return textbook
+
+
+def test_outline_preview(client, textbook):
+    response = client.get(
+        f"/api/v1/subjects/{textbook.subject_id}/chapters/outline-preview",
+        params={"textbook_id": str(textbook.id), "max_depth": 1}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_count"] == 5
+    assert [chapter["title"] for chapter in body["chapters"]] == ["1장", "(제목 없음)"]
+    assert [chapter["title"] for chapter in body["chapters"][0]["children"]] == ["1절", "2절"]
+
+
+@pytest.mark.parametrize("path", ["outline-preview", "outline-import"])
+def test_outline_textbook_of_other_subject(client, textbook, path):
+    url = f"/api/v1/subjects/{uuid4()}/chapters/{path}"
+    if path == "outline-preview":
+        response = client.get(url, params={"textbook_id": str(textbook.id)})
+    else:
+        response = client.post(url, json={"textbook_id": str(textbook.id)})
+
+    assert response.status_code == 404
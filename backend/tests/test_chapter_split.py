@@ -0,0 +1,51 @@
+"""목차별 PDF 분할 잠금 테스트"""
+import fcntl
+import multiprocessing
+from uuid import uuid4
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.services.chapter_split_service import ChapterSplitService
+
+
+def _try_lock(path, result):
+    with open(path, "a") as f:
+        try:
+            fcntl.lockf(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            result.value = 1
+        except OSError:
+            result.value = 0
+
+
+def _locked_by_other_process(path) -> bool:
+    context = multiprocessing.get_context("fork")
+    result = context.Value("i", -1)
+    process = context.Process(target=_try_lock, args=(path, result))
+    process.start()
+    process.join()
+    return result.value == 0
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+
+
+def test_concurrent_split_rejected_without_dropping_lock():
+    textbook_id = uuid4()
+    lock_path = f"{ChapterSplitService.directory_for(textbook_id)}/.lock"
+    ChapterSplitService.acquire(textbook_id)
+    try:
+        with pytest.raises(HTTPException) as exc:
+            ChapterSplitService.acquire(textbook_id)
+
+        assert exc.value.status_code == 409
+        # 거부된 요청 뒤에도 첫 요청의 잠금이 유지되어 다른 프로세스가 잡을 수 없음
+        assert _locked_by_other_process(lock_path)
+    finally:
+        ChapterSplitService.release(textbook_id)
+
+    assert not _locked_by_other_process(lock_path)
+    ChapterSplitService.acquire(textbook_id)
+    ChapterSplitService.release(textbook_id)
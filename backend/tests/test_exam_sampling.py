@@ -0,0 +1,90 @@
+"""모의고사 층별 무작위 추출 테스트"""
+import random
+from types import SimpleNamespace
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+
+from app.schemas.exam import ExamGenerateRequest
+from app.services.exam_service import ExamService
+
+POOL = sorted(uuid4() for _ in range(50))
+
+
+class FakeSession:
+    """SELECT를 SQL로 기록하고 문제 ID 목록 또는 피벗 결과를 돌려주는 세션"""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.statements = []
+
+    def exec(self, statement):
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        if "LATERAL" in sql:
+            # 피벗마다 다음 id (여기서는 풀 앞에서부터)
+            rows = [SimpleNamespace(ord=i, id=question_id) for i, question_id in enumerate(self.pool)]
+            return SimpleNamespace(all=lambda: rows)
+        return SimpleNamespace(all=lambda: list(self.pool))
+
+
+def test_small_pool_uniform_and_reproducible():
+    seen = {POOL[0]}
+    first = ExamService(FakeSession(POOL))._sample_stratum([], 10, random.Random(7), seen)
+    again = ExamService(FakeSession(POOL))._sample_stratum([], 10, random.Random(7), {POOL[0]})
+
+    assert first == again
+    assert len(set(first)) == 10
+    assert POOL[0] not in first
+    assert seen >= set(first)
+
+
+def test_small_pool_reads_ids_once_without_count():
+    session = FakeSession(POOL)
+    ExamService(session)._sample_stratum([], 5, random.Random(1), set())
+
+    assert len(session.statements) == 1
+    assert "count(" not in session.statements[0]
+    assert "LIMIT" in session.statements[0]
+
+
+def test_large_pool_size_skips_id_scan(monkeypatch):
+    session = FakeSession(POOL)
+    monkeypatch.setattr(ExamService, "SMALL_POOL_ROWS", 10)
+    chosen = ExamService(session)._sample_stratum([], 5, random.Random(1), set(), pool_size=100)
+
+    assert len(chosen) == 5
+    assert all("LATERAL" in sql for sql in session.statements)
+
+
+def test_chapter_quota_includes_sub_chapters(monkeypatch):
+    subject_id, chapter_id, child_id = uuid4(), uuid4(), uuid4()
+    session = SimpleNamespace(
+        get=lambda model, key: SimpleNamespace(id=key),
+        exec=lambda statement: SimpleNamespace(all=lambda: [chapter_id])
+    )
+    service = ExamService(session)
+    captured = {}
+    monkeypatch.setattr(service, "_chapter_subtrees", lambda ids: {chapter_id: [chapter_id, child_id]})
+    monkeypatch.setattr(service, "_subject_pool_sizes", lambda ids: {subject_id: 20_000})
+    monkeypatch.setattr(
+        service, "_build_exam",
+        lambda strata, scope, data, seed, rng: captured.update(strata=strata, scope=scope)
+    )
+
+    service.generate_for_subject(subject_id, ExamGenerateRequest(
+        question_count=10, quotas=[{"target_id": chapter_id, "count": 4}], seed=1
+    ))
+
+    (chapter_conditions, chapter_count, chapter_pool), (_, remainder, scope_pool) = captured["strata"]
+    sql = str(chapter_conditions[0].compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert str(child_id) in sql
+    assert (chapter_count, chapter_pool) == (4, None)
+    assert (remainder, scope_pool) == (6, 20_000)
+    assert captured["scope"][1] == 20_000
+
+
+def test_chapter_subtrees_query_is_recursive():
+    session = FakeSession([])
+    ExamService(session)._chapter_subtrees([uuid4()])
+
+    assert session.statements[0].startswith("WITH RECURSIVE chapter_tree")
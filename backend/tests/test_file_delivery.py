@@ -0,0 +1,75 @@
+"""서명된 만료 URL 파일 전달 테스트"""
+import time
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+from uuid import uuid4
+import pytest
+
+from app.api.deps import get_owned_textbook
+from app.core.config import settings
+from app.main import app
+
+DATA = b"%PDF-1.4 " + bytes(range(100))
+FILE_URL = "/uploads/textbooks/ab/cd/book.pdf"
+
+
+@pytest.fixture
+def textbook(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "FILE_DELIVERY", "python")
+    path = tmp_path / "textbooks" / "ab" / "cd"
+    path.mkdir(parents=True)
+    (path / "book.pdf").write_bytes(DATA)
+    textbook = SimpleNamespace(id=uuid4(), subject_id=uuid4(), file_url=FILE_URL, title="교재")
+    app.dependency_overrides[get_owned_textbook] = lambda: textbook
+    yield textbook
+    app.dependency_overrides.pop(get_owned_textbook, None)
+
+
+@pytest.fixture
+def signed(client, textbook):
+    response = client.get(f"/api/v1/subjects/{textbook.subject_id}/textbooks/{textbook.id}/file-url")
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_signed_url_serves_file_until_expiry(client, signed):
+    assert signed["expires_at"] - time.time() <= settings.SIGNED_URL_EXPIRE_SECONDS
+
+    response = client.get(signed["url"])
+    assert response.status_code == 200
+    assert response.content == DATA
+
+    response = client.get(signed["url"], headers={"Range": "bytes=0-3"})
+    assert response.status_code == 206
+    assert response.content == DATA[:4]
+
+
+def test_expired_signed_url_is_forbidden(client, signed, monkeypatch):
+    expires_at = signed["expires_at"]
+    monkeypatch.setattr(time, "time", lambda: expires_at + 1)
+
+    assert client.get(signed["url"]).status_code == 403
+
+
+def test_tampered_signed_url_is_forbidden(client, signed):
+    url = urlsplit(signed["url"])
+    query = {key: value[0] for key, value in parse_qs(url.query).items()}
+
+    extended = {**query, "expires": int(query["expires"]) + 3600}
+    assert client.get(url.path, params=extended).status_code == 403
+
+    other_path = url.path.replace("book.pdf", "other.pdf")
+    assert client.get(other_path, params=query).status_code == 403
+
+    assert client.get(url.path, params={**query, "signature": "0" * 64}).status_code == 403
+
+
+def test_signed_url_delegates_to_proxy(client, signed, monkeypatch):
+    monkeypatch.setattr(settings, "FILE_DELIVERY", "x-accel")
+
+    response = client.get(signed["url"])
+
+    assert response.status_code == 200
+    assert response.headers["x-accel-redirect"].endswith("/textbooks/ab/cd/book.pdf")
+    assert response.content == b""
@@ -0,0 +1,77 @@
+"""일괄 채점과 정답표 캐시 테스트"""
+from types import SimpleNamespace
+from uuid import uuid4
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.grading import GradeAnswer
+from app.services.grading_service import AnswerKeyCache, GradingService
+
+SUBJECT_ID = uuid4()
+QUESTIONS = {uuid4(): (i % 4, f"해설 {i}") for i in range(5)}
+
+
+class FakeSession:
+    """쿼리 종류별로 미리 정한 결과를 돌려주고 실행한 쿼리를 기록하는 세션"""
+
+    def __init__(self, version):
+        self.version = version
+        self.queries = []
+
+    def exec(self, statement):
+        columns = [column.name for column in statement.selected_columns]
+        self.queries.append(columns)
+        if columns == ["subject_id", "content_version"]:
+            rows = [(SUBJECT_ID, self.version)] if self.version is not None else []
+        elif columns == ["id", "correct_answer"]:
+            rows = [SimpleNamespace(id=qid, correct_answer=answer) for qid, (answer, _) in QUESTIONS.items()]
+        else:
+            ids = set(statement.whereclause.right.value)
+            rows = [(qid, explanation) for qid, (_, explanation) in QUESTIONS.items() if qid in ids]
+        return SimpleNamespace(all=lambda: rows)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = AnswerKeyCache()
+    monkeypatch.setattr("app.services.grading_service.answer_key_cache", cache)
+    return cache
+
+
+def test_grade_batch_explains_only_wrong_answers(cache):
+    session = FakeSession(version=1)
+    answers = [
+        GradeAnswer(question_id=qid, chosen_index=answer if i % 2 == 0 else (answer + 1) % 4)
+        for i, (qid, (answer, _)) in enumerate(QUESTIONS.items())
+    ]
+
+    result = GradingService(session)._grade([SUBJECT_ID], answers)
+
+    assert (result["total"], result["correct_count"], result["score"]) == (5, 3, 60.0)
+    for item, (qid, (_, explanation)) in zip(result["items"], QUESTIONS.items()):
+        assert item["question_id"] == qid
+        assert item["explanation"] == (None if item["is_correct"] else explanation)
+    # 버전 1회, 정답표 1회, 틀린 문항 해설 IN 1회
+    assert session.queries == [["subject_id", "content_version"], ["id", "correct_answer"], ["id", "explanation"]]
+
+
+def test_answer_key_reused_until_version_changes(cache):
+    first = cache.get_many(FakeSession(version=1), [SUBJECT_ID])[0]
+    assert cache.get_many(FakeSession(version=1), [SUBJECT_ID])[0] is first
+    assert first.answers.typecode == "b"
+    assert cache.get_many(FakeSession(version=2), [SUBJECT_ID])[0] is not first
+
+
+def test_subject_without_counter_is_not_cached(cache):
+    first = cache.get_many(FakeSession(version=None), [SUBJECT_ID])[0]
+
+    assert cache.get_many(FakeSession(version=None), [SUBJECT_ID])[0] is not first
+
+
+def test_unknown_question_rejected(cache):
+    with pytest.raises(HTTPException) as exc:
+        GradingService(FakeSession(version=1))._grade(
+            [SUBJECT_ID], [GradeAnswer(question_id=uuid4(), chosen_index=0)]
+        )
+
+    assert exc.value.status_code == 400
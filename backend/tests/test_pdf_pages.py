@@ -0,0 +1,82 @@
+"""교재 페이지(범위) PDF 테스트"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from types import SimpleNamespace
+from uuid import uuid4
+import pikepdf
+import pytest
+from pypdf import PdfReader
+
+from app.api.deps import get_owned_textbook
+from app.api.v1.endpoints import textbooks as textbook_endpoints
+from app.core.config import settings
+from app.main import app
+from app.services.file_service import FileService
+from app.services.pdf_page_service import PdfPageService
+
+
+class SpyExecutor(ThreadPoolExecutor):
+    """제출된 함수 이름을 기록하는 실행기"""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.calls = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.calls.append(fn.__name__)
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.fixture
+def textbook(monkeypatch, tmp_path):
+    path = tmp_path / "source.pdf"
+    with pikepdf.new() as pdf:
+        for _ in range(5):
+            pdf.add_blank_page(page_size=(300, 400))
+        pdf.save(path)
+    monkeypatch.setattr(settings, "PAGE_CACHE_DIR", str(tmp_path / "pages"))
+    monkeypatch.setattr(FileService, "local_path", staticmethod(lambda file_url: str(path)))
+    return SimpleNamespace(
+        id=uuid4(), subject_id=uuid4(), file_url="/uploads/textbooks/ab/cd/abcd.pdf", total_pages=5
+    )
+
+
+def test_extraction_runs_in_process_pool(textbook):
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        file = asyncio.run(PdfPageService.open_range(textbook, 2, 4, executor))
+    with file:
+        assert len(PdfReader(file).pages) == 3
+
+
+def test_cached_range_skips_executor(textbook):
+    executor = SpyExecutor()
+    try:
+        asyncio.run(PdfPageService.open_range(textbook, 1, 2, executor)).close()
+        asyncio.run(PdfPageService.open_range(textbook, 1, 2, executor)).close()
+    finally:
+        executor.shutdown()
+
+    assert executor.calls == ["split_pdf_range"]
+
+
+@pytest.fixture
+def pages_url(monkeypatch, textbook):
+    executor = SpyExecutor()
+    monkeypatch.setattr(textbook_endpoints, "get_ingestion_executor", lambda: executor)
+    app.dependency_overrides[get_owned_textbook] = lambda: textbook
+    yield f"/api/v1/subjects/{textbook.subject_id}/textbooks/{textbook.id}/pages"
+    app.dependency_overrides.pop(get_owned_textbook, None)
+    executor.shutdown()
+
+
+def test_page_endpoint_returns_range_pdf(client, pages_url):
+    response = client.get(f"{pages_url}/2", params={"to": 3})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert textbook_endpoints.get_ingestion_executor().calls == ["split_pdf_range"]
+
+
+def test_page_endpoint_rejects_out_of_range(client, pages_url):
+    assert client.get(f"{pages_url}/4", params={"to": 6}).status_code == 400
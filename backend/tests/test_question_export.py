@@ -0,0 +1,81 @@
+"""문제 내보내기(CSV/JSONL/XLSX) 테스트"""
+import csv
+import io
+import json
+from uuid import uuid4
+import pytest
+from openpyxl import load_workbook
+
+from app.services.question_export_service import QuestionExportService
+from app.services.subject_service import SubjectService
+
+SUBJECT_ID = uuid4()
+QUESTIONS = [
+    {
+        "id": str(uuid4()),
+        "subject_id": str(SUBJECT_ID),
+        "chapter_id": None,
+        "order_index": i,
+        "content": f"문제 {i}, \"따옴표\"",
+        "options": ["가", "나", "다"],
+        "correct_answer": 1,
+        "explanation": "해설",
+        "textbook_page": i + 10
+    }
+    for i in range(3)
+]
+
+
+@pytest.fixture
+def owned(monkeypatch):
+    """과목 소유 확인 통과, 문제는 두 배치로 조회"""
+    monkeypatch.setattr(SubjectService, "get_by_id", lambda self, subject_id, creator_id: object())
+    monkeypatch.setattr(
+        QuestionExportService, "_iter_batches",
+        lambda self, subject_id=None, certificate_id=None: iter([QUESTIONS[:2], QUESTIONS[2:]])
+    )
+
+
+def export(client, export_format):
+    return client.get(f"/api/v1/subjects/{SUBJECT_ID}/questions/export", params={"format": export_format})
+
+
+def test_export_csv(client, owned):
+    response = export(client, "csv")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert f"questions_{SUBJECT_ID}.csv" in response.headers["content-disposition"]
+    rows = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))
+    assert rows[0] == QuestionExportService.COLUMNS
+    assert len(rows) == 1 + len(QUESTIONS)
+    assert rows[1][4] == QUESTIONS[0]["content"]
+    assert rows[1][5:10] == ["가", "나", "다", "", ""]
+
+
+def test_export_jsonl(client, owned):
+    response = export(client, "jsonl")
+
+    assert response.status_code == 200
+    assert [json.loads(line) for line in response.text.splitlines()] == QUESTIONS
+
+
+def test_export_xlsx(client, owned):
+    response = export(client, "xlsx")
+
+    assert response.status_code == 200
+    sheet = load_workbook(io.BytesIO(response.content), read_only=True)["questions"]
+    rows = list(sheet.iter_rows(values_only=True))
+    assert list(rows[0]) == QuestionExportService.COLUMNS
+    assert rows[3][4] == QUESTIONS[2]["content"]
+    assert rows[3][-1] == QUESTIONS[2]["textbook_page"]
+
+
+def test_export_requires_owned_subject(client, monkeypatch):
+    monkeypatch.setattr(SubjectService, "get_by_id", lambda self, subject_id, creator_id: None)
+
+    assert export(client, "csv").status_code == 404
+
+
+def test_export_rejects_unknown_format(client, owned):
+    assert export(client, "pdf").status_code == 422
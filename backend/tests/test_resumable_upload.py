@@ -0,0 +1,95 @@
+"""이어 올리기 업로드 테스트 (오프셋, 완료 잠금/재시도)"""
+import asyncio
+import fcntl
+import os
+from uuid import uuid4
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.services.file_service import FileService
+from app.services.resumable_upload_service import ResumableUploadService
+
+DATA = b"%PDF-1.4 " + bytes(range(256)) * 4
+
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+
+@pytest.fixture
+def upload(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    subject_id, creator_id = uuid4(), uuid4()
+    info = ResumableUploadService.create(subject_id, creator_id, "book.pdf", len(DATA))
+    return info["upload_id"], subject_id, creator_id
+
+
+def append(upload, offset, *parts):
+    return asyncio.run(ResumableUploadService.append(*upload, offset, chunks(*parts)))
+
+
+def finalize(upload):
+    return asyncio.run(ResumableUploadService.finalize(*upload))
+
+
+def test_offsets_resume_from_stored_size(upload):
+    assert ResumableUploadService.get(*upload)["offset"] == 0
+    assert append(upload, 0, DATA[:100], DATA[100:300])["offset"] == 300
+
+    with pytest.raises(HTTPException) as error:
+        append(upload, 100, DATA[100:])
+    assert error.value.status_code == 409
+    assert "현재: 300" in error.value.detail
+
+    with pytest.raises(HTTPException) as error:
+        append(upload, 300, DATA[300:], b"extra")
+    assert error.value.status_code == 400
+    # 크기를 넘기 전까지 기록된 청크는 남아 다음 오프셋이 됨
+    assert ResumableUploadService.get(*upload)["offset"] == len(DATA)
+
+
+def test_finalize_rejects_incomplete_upload(upload):
+    append(upload, 0, DATA[:10])
+    with pytest.raises(HTTPException) as error:
+        finalize(upload)
+    assert error.value.status_code == 409
+
+
+def test_finalize_conflicts_with_request_holding_lock(upload):
+    append(upload, 0, DATA)
+    part_path, _ = ResumableUploadService._paths(upload[0])
+
+    with open(part_path, "ab") as other:
+        fcntl.flock(other.fileno(), fcntl.LOCK_EX)
+        with pytest.raises(HTTPException) as error:
+            finalize(upload)
+    assert error.value.status_code == 409
+    assert os.path.exists(part_path)
+
+
+def test_finalize_syncs_before_storing_and_retry_returns_result(monkeypatch, upload):
+    append(upload, 0, DATA)
+    events = []
+    fsync, store_blob = os.fsync, FileService.store_blob
+    monkeypatch.setattr(os, "fsync", lambda fd: (events.append("fsync"), fsync(fd)))
+    monkeypatch.setattr(
+        FileService, "store_blob",
+        staticmethod(lambda *args: (events.append("store"), store_blob(*args))[1])
+    )
+
+    first = finalize(upload)
+    second = finalize(upload)  # 응답을 못 받은 클라이언트의 재시도
+
+    assert events == ["fsync", "store"]
+    assert first == second
+    assert first["file_size"] == len(DATA)
+    with open(FileService.local_path(first["file_url"]), "rb") as f:
+        assert f.read() == DATA
+
+    # 완료 후에는 데이터 파일을 다시 만들지 않음
+    with pytest.raises(HTTPException) as error:
+        append(upload, 0, DATA)
+    assert error.value.status_code == 404
+    assert not os.path.exists(ResumableUploadService._paths(upload[0])[0])
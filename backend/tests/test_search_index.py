@@ -0,0 +1,86 @@
+"""교재 본문 검색 색인 테스트"""
+import struct
+from uuid import uuid4
+import pytest
+
+from app.core.config import settings
+from app.services.search_index_service import (
+    CHAR_KEY, HEADER, MAGIC, SearchIndex, SearchIndexService, build_search_index
+)
+
+PAGES = [
+    "민법 총칙",
+    "문제 해결 방법",
+    "법률 행위의 효력",
+    "상법과 회사",
+]
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    path = str(tmp_path / "textbook.idx")
+    build_search_index(PAGES, path)
+    return path
+
+
+@pytest.fixture
+def index_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "SEARCH_INDEX_DIR", str(tmp_path))
+    monkeypatch.setattr(SearchIndexService, "_indexes", type(SearchIndexService._indexes)())
+    return tmp_path
+
+
+def test_search_bigrams(index_path):
+    index = SearchIndex(index_path)
+
+    assert index.search("법률 효력") == [(3, 2)]
+    assert index.search("회사 없는말") == []
+
+
+def test_single_character_matches_any_position(index_path):
+    index = SearchIndex(index_path)
+
+    # 단어 끝(민법, 방법), 단어 처음(법률), 단어 중간(상법과) 모두 일치
+    assert sorted(page for page, _ in index.search("법")) == [1, 2, 3, 4]
+
+
+def test_arrays_exclude_character_keys(index_path):
+    keys, offsets, pages, counts = SearchIndex(index_path).arrays()
+
+    assert len(keys) and all(key < CHAR_KEY for key in keys)
+    assert len(offsets) == len(keys) + 1
+    assert len(pages) == len(counts) == offsets[-1]
+
+
+def _open(textbook_id):
+    index = SearchIndexService._open(SearchIndexService.path_for(textbook_id))
+    SearchIndexService.release(index)
+    return index
+
+
+def test_open_indexes_bounded_and_evicted_closed(index_dir, monkeypatch):
+    monkeypatch.setattr(settings, "SEARCH_INDEX_OPEN_MAX", 2)
+    textbook_ids = [uuid4() for _ in range(3)]
+    for textbook_id in textbook_ids:
+        build_search_index(PAGES, SearchIndexService.path_for(textbook_id))
+
+    first = _open(textbook_ids[0])
+    in_use = SearchIndexService._open(SearchIndexService.path_for(textbook_ids[1]))
+    _open(textbook_ids[0])  # 최근 사용으로 갱신 -> 다음에 밀려나는 것은 두 번째
+    _open(textbook_ids[2])
+
+    assert len(SearchIndexService._indexes) == 2
+    assert in_use.evicted
+    assert in_use.search("민법") == [(1, 1)]  # 사용 중에는 닫지 않음
+    SearchIndexService.release(in_use)
+    assert in_use._mmap.closed
+    assert not first._mmap.closed
+
+
+def test_previous_format_is_rebuilt(index_dir):
+    textbook_id = uuid4()
+    path = SearchIndexService.path_for(textbook_id)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, 1, 0, 0, 0, 0) + struct.pack("=I", 0))
+
+    assert SearchIndexService._open(path) is None
@@ -0,0 +1,113 @@
+"""업로드 파일 서빙 테스트 (Range/206/416, If-Range, 내부 디렉토리)"""
+import asyncio
+import hashlib
+import os
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.datastructures import Headers
+
+from app.core.static_files import RangeFileResponse, UploadFiles, parse_range
+
+DATA = bytes(range(100))
+SHA256 = hashlib.sha256(DATA).hexdigest()
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-9", (0, 9)),
+    ("bytes=90-", (90, 99)),
+    ("bytes=-10", (90, 99)),
+    ("bytes=-500", (0, 99)),
+    ("bytes=50-500", (50, 99)),
+    ("bytes=0-1,5-6", None),
+    ("items=0-9", None),
+    ("bytes=9-0", None),
+    ("bytes=abc", None),
+])
+def test_parse_range(header, expected):
+    assert parse_range(header, len(DATA)) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=200-300", "bytes=-0"])
+def test_parse_range_unsatisfiable(header):
+    with pytest.raises(ValueError):
+        parse_range(header, len(DATA))
+
+
+@pytest.fixture
+def files(tmp_path):
+    (tmp_path / "textbooks").mkdir()
+    (tmp_path / "textbooks" / f"{SHA256}.pdf").write_bytes(DATA)
+    (tmp_path / "_resumable").mkdir()
+    (tmp_path / "_resumable" / "upload.part").write_bytes(DATA)
+    app = Starlette()
+    app.mount("/uploads", UploadFiles(directory=str(tmp_path)))
+    return TestClient(app)
+
+
+URL = f"/uploads/textbooks/{SHA256}.pdf"
+
+
+def test_full_response_has_strong_etag(files):
+    response = files.get(URL)
+
+    assert response.status_code == 200
+    assert response.content == DATA
+    assert response.headers["etag"] == f'"{SHA256}"'
+    assert response.headers["accept-ranges"] == "bytes"
+    assert "immutable" in response.headers["cache-control"]
+    assert files.get(URL, headers={"If-None-Match": f'"{SHA256}"'}).status_code == 304
+
+
+def test_range_returns_partial_content(files):
+    response = files.get(URL, headers={"Range": "bytes=10-19"})
+
+    assert response.status_code == 206
+    assert response.content == DATA[10:20]
+    assert response.headers["content-range"] == "bytes 10-19/100"
+    assert response.headers["content-length"] == "10"
+
+
+def test_unsatisfiable_range_returns_416(files):
+    response = files.get(URL, headers={"Range": "bytes=100-"})
+
+    assert response.status_code == 416
+    assert response.content == b""
+    assert response.headers["content-range"] == "bytes */100"
+
+
+def test_stale_if_range_returns_full_content(files):
+    response = files.get(URL, headers={"Range": "bytes=10-19", "If-Range": '"stale"'})
+    assert response.status_code == 200
+    assert response.content == DATA
+
+    response = files.get(URL, headers={"Range": "bytes=10-19", "If-Range": f'"{SHA256}"'})
+    assert response.status_code == 206
+
+
+def test_internal_directories_are_hidden(files):
+    assert files.get("/uploads/_resumable/upload.part").status_code == 404
+
+
+def test_zerocopy_extension_sends_range_offset(tmp_path):
+    path = tmp_path / "file.pdf"
+    path.write_bytes(DATA)
+    response = RangeFileResponse(
+        str(path),
+        os.stat(path),
+        etag='"etag"',
+        cache_control="no-cache",
+        request_headers=Headers({"range": "bytes=10-19"})
+    )
+    messages = []
+
+    async def send(message):
+        messages.append({key: value for key, value in message.items() if key != "file"})
+
+    scope = {"method": "GET", "extensions": {"http.response.zerocopysend": {}}}
+    asyncio.run(response(scope, None, send))
+
+    assert messages[0]["status"] == 206
+    assert messages[1] == {
+        "type": "http.response.zerocopysend", "offset": 10, "count": 10, "more_body": False
+    }
@@ -0,0 +1,56 @@
+"""교재 PDF 암호 해제 테스트"""
+import asyncio
+from uuid import uuid4
+import pikepdf
+import pytest
+
+from app.core.config import settings
+from app.services.file_service import FileService
+from app.services.textbook_ingestion_service import TextbookIngestionService
+
+ORIGINAL_URL = "/uploads/textbooks/ab/cd/abcd.pdf"
+DECRYPTED_URL = f"/uploads/{settings.PROTECTED_UPLOAD_DIR}/textbooks/ef/01/ef01.pdf"
+
+
+@pytest.fixture
+def encrypted_pdf(tmp_path):
+    path = tmp_path / "encrypted.pdf"
+    with pikepdf.new() as pdf:
+        pdf.add_blank_page()
+        pdf.save(path, encryption=pikepdf.Encryption(user="secret", owner="owner"))
+    return str(path)
+
+
+@pytest.fixture
+def shared_upload(monkeypatch, encrypted_pdf):
+    """다른 사용자가 같은 암호화 파일을 이미 올려 복호화 사본이 있는 상태"""
+    calls = {"failed": [], "switched": []}
+    monkeypatch.setattr(FileService, "local_path", staticmethod(lambda file_url: encrypted_pdf))
+    monkeypatch.setattr(TextbookIngestionService, "_find_decrypted", staticmethod(lambda file_url: DECRYPTED_URL))
+    monkeypatch.setattr(
+        TextbookIngestionService, "_mark_failed",
+        staticmethod(lambda textbook_id, error: calls["failed"].append(textbook_id))
+    )
+    monkeypatch.setattr(
+        TextbookIngestionService, "_switch_file",
+        staticmethod(lambda textbook_id, old_url, new_url: calls["switched"].append(new_url) or True)
+    )
+    return calls
+
+
+@pytest.mark.parametrize("password", [None, "wrong"])
+def test_wrong_password_does_not_reuse_decrypted_copy(shared_upload, password):
+    textbook_id = uuid4()
+    result = asyncio.run(TextbookIngestionService._decrypt(textbook_id, ORIGINAL_URL, password, None))
+
+    assert result is None
+    assert shared_upload["failed"] == [textbook_id]
+    assert shared_upload["switched"] == []
+
+
+def test_correct_password_reuses_decrypted_copy(shared_upload):
+    result = asyncio.run(TextbookIngestionService._decrypt(uuid4(), ORIGINAL_URL, "secret", None))
+
+    assert result == DECRYPTED_URL
+    assert shared_upload["failed"] == []
+    assert shared_upload["switched"] == [DECRYPTED_URL]
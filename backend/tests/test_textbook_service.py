@@ -0,0 +1,60 @@
+"""교재 등록 시 업로드 파일 소유 확인 테스트"""
+from types import SimpleNamespace
+from uuid import uuid4
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.schemas.textbook import TextbookCreate
+from app.services.file_service import FileService
+from app.services.textbook_service import TextbookService
+
+FILE_URL = "/uploads/textbooks/ab/cd/abcd.pdf"
+
+
+@pytest.fixture
+def service(monkeypatch):
+    added = []
+    session = SimpleNamespace(add=added.append, commit=lambda: None, refresh=lambda obj: None)
+    service = TextbookService(session)
+    monkeypatch.setattr(service, "_verify_subject_ownership", lambda subject_id, creator_id: None)
+    monkeypatch.setattr(service, "file_available", lambda file_url: True)
+    service.added = added
+    return service
+
+
+def test_create_accepts_own_upload(service):
+    creator_id = uuid4()
+    data = TextbookCreate(title="교재", file_url=FILE_URL, upload_token=FileService.upload_token(FILE_URL, creator_id))
+
+    textbook = service.create(uuid4(), data, creator_id)
+
+    assert textbook.file_url == FILE_URL
+    assert service.added == [textbook]
+
+
+@pytest.mark.parametrize("file_url, token_url, token_owner", [
+    (FILE_URL, FILE_URL, "other"),  # 다른 제작자가 올린 파일
+    (FILE_URL, "/uploads/textbooks/ef/01/ef01.pdf", "self"),  # 다른 파일의 토큰
+    (f"/uploads/{settings.PROTECTED_UPLOAD_DIR}/textbooks/ef/01/ef01.pdf", None, "self"),  # 암호 해제본
+])
+def test_create_rejects_foreign_file(service, file_url, token_url, token_owner):
+    creator_id = uuid4()
+    owner_id = creator_id if token_owner == "self" else uuid4()
+    token = FileService.upload_token(token_url or file_url, owner_id)
+    data = TextbookCreate(title="교재", file_url=file_url, upload_token=token)
+
+    with pytest.raises(HTTPException) as exc:
+        service.create(uuid4(), data, creator_id)
+
+    assert exc.value.status_code == 403
+    assert service.added == []
+
+
+def test_expired_upload_token(monkeypatch):
+    creator_id = uuid4()
+    monkeypatch.setattr(settings, "UPLOAD_TOKEN_EXPIRE_HOURS", -1)
+    token = FileService.upload_token(FILE_URL, creator_id)
+
+    assert not FileService.verify_upload_token(FILE_URL, creator_id, token)
+    assert not FileService.verify_upload_token(FILE_URL, creator_id, "garbage")
@@ -0,0 +1,85 @@
+"""교재 페이지 썸네일 테스트"""
+import os
+from types import SimpleNamespace
+from uuid import uuid4
+import pikepdf
+import pytest
+
+from app.api.deps import get_owned_textbook
+from app.core.config import settings
+from app.main import app
+from app.services.thumbnail_service import ThumbnailService, render_thumbnails
+
+FILE_URL = "/uploads/textbooks/ab/cd/abcd.pdf"
+
+
+@pytest.fixture
+def source_pdf(tmp_path):
+    path = tmp_path / "source.pdf"
+    with pikepdf.new() as pdf:
+        for _ in range(3):
+            pdf.add_blank_page(page_size=(300, 400))
+        pdf.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def thumbnail_dir(monkeypatch, tmp_path):
+    directory = tmp_path / "thumbnails"
+    monkeypatch.setattr(settings, "THUMBNAIL_DIR", str(directory))
+    return directory
+
+
+def test_render_is_atomic_and_first_result_wins(source_pdf, thumbnail_dir):
+    output_dir = ThumbnailService.directory_for(FILE_URL)
+
+    first = render_thumbnails(source_pdf, output_dir)
+    second = render_thumbnails(source_pdf, output_dir)  # 동시에 시작했다가 늦게 끝난 생성
+
+    assert first == second
+    assert first["page_count"] == 3
+    assert sorted(os.listdir(f"{output_dir}/pages")) == ["1.webp", "2.webp", "3.webp"]
+    # 임시 작업 디렉토리가 남지 않음
+    assert os.listdir(thumbnail_dir) == [os.path.basename(output_dir)]
+
+
+def test_render_replaces_unfinished_directory(source_pdf, thumbnail_dir):
+    output_dir = ThumbnailService.directory_for(FILE_URL)
+    os.makedirs(f"{output_dir}/pages")
+    open(f"{output_dir}/pages/1.webp", "wb").close()
+
+    render_thumbnails(source_pdf, output_dir)
+
+    assert os.path.getsize(f"{output_dir}/pages/1.webp") > 0
+
+
+@pytest.fixture
+def textbook(source_pdf, thumbnail_dir):
+    render_thumbnails(source_pdf, ThumbnailService.directory_for(FILE_URL))
+    textbook = SimpleNamespace(id=uuid4(), subject_id=uuid4(), file_url=FILE_URL)
+    app.dependency_overrides[get_owned_textbook] = lambda: textbook
+    yield textbook
+    app.dependency_overrides.pop(get_owned_textbook, None)
+
+
+def test_manifest_urls_are_stable_and_immutable(client, textbook):
+    base = f"/api/v1/subjects/{textbook.subject_id}/textbooks/{textbook.id}/thumbnails"
+    manifest = client.get(base).json()
+
+    assert manifest == client.get(base).json()
+    sprite_url = manifest["sprites"][0]["url"]
+    assert "?" not in sprite_url and "expires" not in manifest
+
+    response = client.get(sprite_url)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    assert "immutable" in response.headers["cache-control"]
+    assert client.get(manifest["page_url_template"].format(page=2)).status_code == 200
+
+
+def test_image_requires_signature(client, textbook):
+    key = ThumbnailService.key_for(FILE_URL)
+    base = f"/api/v1/subjects/{textbook.subject_id}/textbooks/{textbook.id}/thumbnails/{key}"
+
+    assert client.get(f"{base}/{'0' * 32}/pages/1.webp").status_code == 403
+    assert client.get(f"{base}/{ThumbnailService.signature_for(key)}/pages/9.webp").status_code == 404
@@ -0,0 +1,96 @@
+"""검수 API 상태 필터 및 자격증 집계 테스트"""
+from types import SimpleNamespace
+from uuid import uuid4
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.schemas.validation import ValidationStatus
+from app.services.validation_service import ValidationService
+
+
+@pytest.fixture
+def subject(monkeypatch):
+    """카운터만 있는 과목 (항목 조회는 빈 목록)"""
+    subject = SimpleNamespace(id=uuid4(), name="과목")
+    counter = SimpleNamespace(
+        chapter_count=4,
+        chapters_with_textbook=2,
+        chapters_with_video=2,
+        chapters_complete=1,
+        question_count=3,
+        questions_with_textbook=2,
+        content_version=uuid4().int % 1000
+    )
+    monkeypatch.setattr(ValidationService, "_load_subject", lambda self, subject_id, creator_id: (subject, counter))
+    monkeypatch.setattr(ValidationService, "_chapter_items", lambda self, *args: [])
+    monkeypatch.setattr(ValidationService, "_question_items", lambda self, *args: [])
+    return subject
+
+
+@pytest.mark.parametrize("status_value", [item.value for item in ValidationStatus])
+@pytest.mark.parametrize("path", ["", "/chapters", "/questions"])
+def test_status_filter(client, subject, path, status_value):
+    response = client.get(f"/api/v1/subjects/{subject.id}/validation{path}", params={"status": status_value})
+    assert response.status_code == 200
+
+    body = response.json()
+    sections = [body["chapter_validation"], body["question_validation"]] if path == "" else [body]
+    for section in sections:
+        assert section["pagination"]["total"] == section["summary"][status_value]
+
+
+def test_question_summary_has_no_errors(client, subject):
+    response = client.get(f"/api/v1/subjects/{subject.id}/validation/questions", params={"status": "error"})
+    assert response.json()["summary"]["error"] == 0
+    assert response.json()["pagination"]["total"] == 0
+
+
+class RollupSession:
+    """자격증 조회 후 미리 정한 집계 행을 돌려주고 실행한 SQL을 기록하는 세션"""
+
+    def __init__(self, certificate, rows):
+        self.results = [SimpleNamespace(first=lambda: certificate), SimpleNamespace(all=lambda: rows)]
+        self.statements = []
+        self.commits = 0
+
+    def exec(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return self.results.pop(0)
+
+    def commit(self):
+        self.commits += 1
+
+
+def rollup_row(subject_id, name, chapters, questions):
+    return SimpleNamespace(
+        subject_id=subject_id,
+        subject_name=name,
+        chapter_count=chapters,
+        chapters_with_textbook=chapters,
+        chapters_with_video=chapters,
+        chapters_complete=chapters,
+        question_count=questions,
+        questions_with_textbook=0
+    )
+
+
+def test_certificate_rollup_is_one_statement():
+    certificate = SimpleNamespace(id=uuid4(), name="자격증")
+    rows = [
+        rollup_row(uuid4(), "과목1", 2, 1),
+        rollup_row(uuid4(), "과목2", 0, 0),  # 카운터가 없어 같은 문장에서 계산된 과목
+        rollup_row(None, None, 2, 1),
+    ]
+    session = RollupSession(certificate, rows)
+
+    result = ValidationService(session).get_certificate_validation(certificate.id, uuid4())
+
+    assert len(session.statements) == 2  # 자격증 조회 + 집계 한 번
+    rollup = session.statements[1]
+    assert rollup.startswith("WITH inserted_counters AS \n(INSERT INTO subject_validation_counters")
+    assert "ON CONFLICT (subject_id) DO NOTHING RETURNING" in rollup
+    assert "GROUPING SETS" in rollup and "subject_rows" not in rollup
+    assert session.commits == 1
+    assert [item["subject_name"] for item in result["subjects"]] == ["과목1", "과목2"]
+    assert result["chapter_summary"]["total"] == 2
+    assert result["question_summary"]["total"] == 1
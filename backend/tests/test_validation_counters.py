@@ -0,0 +1,73 @@
+"""검수 카운터 증감 테스트 (변경 전 상태를 행 잠금 후 읽는지)"""
+from collections import Counter
+from types import SimpleNamespace
+from uuid import uuid4
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.schemas.chapter import ChapterUpdate
+from app.schemas.question import QuestionUpdate
+from app.services.chapter_service import ChapterService
+from app.services.question_service import QuestionService
+from app.services.validation_counter_service import ValidationCounterService
+
+
+class FakeSession:
+    """실행한 SELECT를 SQL로 기록하고 미리 정한 행을 돌려주는 세션"""
+
+    def __init__(self, row):
+        self.row = row
+        self.statements = []
+
+    def exec(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return SimpleNamespace(first=lambda: self.row, all=lambda: [])
+
+    def add(self, obj):
+        pass
+
+    def commit(self):
+        pass
+
+    def refresh(self, obj):
+        pass
+
+
+@pytest.fixture
+def applied(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        ValidationCounterService, "apply",
+        lambda self, subject_id, delta: calls.append((subject_id, +delta))
+    )
+    return calls
+
+
+def test_question_update_locks_row_before_diff(applied):
+    question = SimpleNamespace(
+        id=uuid4(), subject_id=uuid4(), textbook_page=None, options=["a", "b"], correct_answer=0
+    )
+    session = FakeSession(question)
+
+    QuestionService(session).update(question.id, QuestionUpdate(textbook_page=12), uuid4())
+
+    assert session.statements[0].endswith("FOR UPDATE OF questions")
+    assert applied == [(question.subject_id, Counter({"questions_with_textbook": 1}))]
+
+
+def test_chapter_update_bumps_version_only(applied):
+    chapter = SimpleNamespace(id=uuid4(), subject_id=uuid4(), title="1장")
+    session = FakeSession(chapter)
+
+    ChapterService(session).update(chapter.id, ChapterUpdate(title="제1장"), uuid4())
+
+    assert session.statements[0].endswith("FOR UPDATE OF chapters")
+    assert chapter.title == "제1장"
+    assert applied == [(chapter.subject_id, Counter())]
+
+
+def test_state_diff():
+    before = ValidationCounterService.chapter_state(3, None)
+    after = ValidationCounterService.chapter_state(3, uuid4())
+
+    assert +ValidationCounterService.diff(before, after) == Counter({"chapters_with_video": 1, "chapters_complete": 1})
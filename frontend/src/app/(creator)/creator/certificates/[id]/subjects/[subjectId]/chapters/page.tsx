@@ -153,6 +153,7 @@ export default function ChaptersPage() {
   const [uploadedFile, setUploadedFile] = useState<FileUploadResponse | null>(null);
   const [newTextbookTitle, setNewTextbookTitle] = useState('');
   const [newTextbookPages, setNewTextbookPages] = useState<number>(0);
+  const [newTextbookPassword, setNewTextbookPassword] = useState('');
   const fileInputRef = useRef<HTMLInputElement>(null);
   const [selectedFileName, setSelectedFileName] = useState<string>('');
 
@@ -321,7 +322,9 @@ export default function ChaptersPage() {
         body: {
           title: newTextbookTitle,
           file_url: uploadedFile.file_url,
-          total_pages: newTextbookPages
+          upload_token: uploadedFile.upload_token,
+          total_pages: newTextbookPages,
+          ...(uploadedFile.encrypted && { pdf_password: newTextbookPassword })
         } as TextbookCreateRequest
       });
 
@@ -329,6 +332,7 @@ export default function ChaptersPage() {
       setUploadedFile(null);
       setNewTextbookTitle('');
       setNewTextbookPages(0);
+      setNewTextbookPassword('');
       alert('교재가 등록되었습니다');
     } catch (error) {
       console.error('Failed to create textbook:', error);
@@ -520,6 +524,18 @@ export default function ChaptersPage() {
                           placeholder="페이지 수"
                         />
                       </div>
+                      {uploadedFile.encrypted && (
+                        <div className="space-y-2">
+                          <Label htmlFor="textbook-password">PDF 암호</Label>
+                          <Input
+                            id="textbook-password"
+                            type="password"
+                            value={newTextbookPassword}
+                            onChange={(e) => setNewTextbookPassword(e.target.value)}
+                            placeholder="암호가 설정된 PDF입니다 (등록 시 한 번만 사용)"
+                          />
+                        </div>
+                      )}
                       <Button 
                         onClick={handleCreateTextbook}
                         disabled={isSubmitting || !newTextbookTitle || newTextbookPages <= 0}
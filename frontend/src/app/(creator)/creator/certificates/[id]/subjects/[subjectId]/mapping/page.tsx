@@ -4,7 +4,7 @@ import { useState, useEffect } from 'react';
 import dynamic from 'next/dynamic';
 import { useRouter, useParams } from 'next/navigation';
 import { useAuth } from '@/hooks/useAuth';
-import { apiClient } from '@/lib/api';
+import { apiClient, getTextbookPdfUrl } from '@/lib/api';
 import { ChapterTreeNode, Textbook, ChapterMappingUpdateRequest } from '@/types';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
@@ -109,6 +109,7 @@ export default function MappingPage() {
   const [chapters, setChapters] = useState<ChapterTreeNode[]>([]);
   const [textbooks, setTextbooks] = useState<Textbook[]>([]);
   const [selectedTextbook, setSelectedTextbook] = useState<Textbook | null>(null);
+  const [pdfUrl, setPdfUrl] = useState<string | null>(null);
   const [selectedChapter, setSelectedChapter] = useState<ChapterTreeNode | null>(null);
   const [isLoading, setIsLoading] = useState(true);
   const [isSaving, setIsSaving] = useState(false);
@@ -141,6 +142,15 @@ export default function MappingPage() {
     }
   }, [authLoading, user, subjectId]);
 
+  // 교재 PDF 주소 (암호 해제본은 서명 URL)
+  useEffect(() => {
+    setPdfUrl(null);
+    if (!selectedTextbook) return;
+    getTextbookPdfUrl(selectedTextbook)
+      .then(setPdfUrl)
+      .catch((error) => console.error('Failed to get textbook url:', error));
+  }, [selectedTextbook]);
+
   // 인증 체크
   useEffect(() => {
     if (!authLoading && !user) {
@@ -357,12 +367,14 @@ export default function MappingPage() {
             </div>
           ) : (
             <div className="flex-1">
-              <PdfViewer
-                fileUrl={`${process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000'}${selectedTextbook.file_url}`}
-                onPageSelect={handlePageSelect}
-                selectedPage={selectedChapter?.textbook_page || null}
-                height={600}
-              />
+              {pdfUrl && (
+                <PdfViewer
+                  fileUrl={pdfUrl}
+                  onPageSelect={handlePageSelect}
+                  selectedPage={selectedChapter?.textbook_page || null}
+                  height={600}
+                />
+              )}
             </div>
           )}
         </div>
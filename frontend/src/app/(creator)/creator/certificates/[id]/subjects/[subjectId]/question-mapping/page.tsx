@@ -4,7 +4,7 @@ import { useState, useEffect } from 'react';
 import dynamic from 'next/dynamic';
 import { useRouter, useParams } from 'next/navigation';
 import { useAuth } from '@/hooks/useAuth';
-import { apiClient } from '@/lib/api';
+import { apiClient, getTextbookPdfUrl } from '@/lib/api';
 import { Question, Textbook, QuestionMappingUpdateRequest } from '@/types';
 import { Button } from '@/components/ui/button';
 import {
@@ -43,6 +43,7 @@ export default function QuestionMappingPage() {
   const [textbooks, setTextbooks] = useState<Textbook[]>([]);
   const [selectedQuestion, setSelectedQuestion] = useState<Question | null>(null);
   const [selectedTextbook, setSelectedTextbook] = useState<Textbook | null>(null);
+  const [pdfUrl, setPdfUrl] = useState<string | null>(null);
   const [isLoading, setIsLoading] = useState(true);
   const [isSaving, setIsSaving] = useState(false);
   const [filterMapped, setFilterMapped] = useState<string>('all');
@@ -81,6 +82,15 @@ export default function QuestionMappingPage() {
     }
   }, [authLoading, user, subjectId, filterMapped]);
 
+  // 교재 PDF 주소 (암호 해제본은 서명 URL)
+  useEffect(() => {
+    setPdfUrl(null);
+    if (!selectedTextbook) return;
+    getTextbookPdfUrl(selectedTextbook)
+      .then(setPdfUrl)
+      .catch((error) => console.error('Failed to get textbook url:', error));
+  }, [selectedTextbook]);
+
   // 인증 체크
   useEffect(() => {
     if (!authLoading && !user) {
@@ -405,12 +415,14 @@ export default function QuestionMappingPage() {
             </div>
           ) : (
             <div className="flex-1">
-              <PdfViewer
-                fileUrl={`http://localhost:8000${selectedTextbook.file_url}`}
-                onPageSelect={handlePageSelect}
-                selectedPage={selectedQuestion?.textbook_page || null}
-                height={500}
-              />
+              {pdfUrl && (
+                <PdfViewer
+                  fileUrl={pdfUrl}
+                  onPageSelect={handlePageSelect}
+                  selectedPage={selectedQuestion?.textbook_page || null}
+                  height={500}
+                />
+              )}
             </div>
           )}
         </div>
@@ -47,6 +47,21 @@ export async function apiClient<T>(
   }
 }
 
+// 교재 PDF 주소 (암호 해제본 등 /uploads로 공개되지 않는 파일은 서명 URL 발급)
+export async function getTextbookPdfUrl(textbook: {
+  id: string;
+  subject_id: string;
+  file_url: string;
+}): Promise<string> {
+  if (!textbook.file_url.startsWith('/uploads/protected/')) {
+    return `${API_BASE_URL}${textbook.file_url}`;
+  }
+  const { url } = await apiClient<{ url: string; expires_at: number }>(
+    `/api/v1/subjects/${textbook.subject_id}/textbooks/${textbook.id}/file-url`
+  );
+  return `${API_BASE_URL}${url}`;
+}
+
 // API 함수들
 export const api = {
   auth: {
@@ -56,7 +56,40 @@ export interface Textbook {
   subject_id: string;
   title: string;
   file_url: string;
+  original_file_url?: string | null;
   total_pages: number;
+  ingestion_status: 'pending' | 'processing' | 'done' | 'failed';
+  ingestion_error?: string | null;
+}
+
+// 교재 본문 검색
+export interface TextbookSearchResult {
+  page: number;
+  score: number;
+  snippet: string;
+}
+
+export interface TextbookSearchResponse {
+  query: string;
+  total: number;
+  results: TextbookSearchResult[];
+}
+
+// 목차별 분할 PDF
+export interface TextbookChapterFile {
+  chapter_id: string;
+  title: string;
+  depth: number;
+  from_page: number;
+  to_page: number;
+  file_size: number;
+  created_at: string;
+}
+
+// 목차별 PDF 생성 요청 결과 (백그라운드 생성)
+export interface TextbookChapterSplitResponse {
+  textbook_id: string;
+  chapters: number;
 }
 
 // ===== 영상 =====
@@ -172,11 +205,51 @@ export interface ChapterVideoMappingUpdateRequest {
   video_start_seconds: number | null;
 }
 
+// 교재 PDF 목차(책갈피)로 목차 생성
+export interface ChapterOutlineImportRequest {
+  textbook_id: string;
+  max_depth?: number;
+}
+
+export interface ChapterOutlineNode {
+  title: string;
+  order_index: number;
+  depth: number;
+  textbook_page: number | null;
+  children: ChapterOutlineNode[];
+}
+
+// 목차-교재 페이지 자동 매핑 추천
+export interface ChapterAutoMappingSuggestion {
+  chapter_id: string;
+  title: string;
+  depth: number;
+  current_page: number | null;
+  page: number | null;
+  score: number;
+  candidates: { page: number; score: number }[];
+}
+
+export interface ChapterAutoMappingResponse {
+  textbook_id: string;
+  suggestions: ChapterAutoMappingSuggestion[];
+  mappings: { chapter_id: string; textbook_page: number | null }[];
+}
+
+export interface ChapterOutlinePreview {
+  textbook_id: string;
+  total_count: number;
+  mapped_count: number;
+  chapters: ChapterOutlineNode[];
+}
+
 // ===== 교재 API 요청 =====
 export interface TextbookCreateRequest {
   title: string;
   file_url: string;
-  total_pages: number;
+  upload_token: string;
+  total_pages?: number;
+  pdf_password?: string;
 }
 
 export interface TextbookUpdateRequest {
@@ -189,6 +262,9 @@ export interface FileUploadResponse {
   file_url: string;
   file_name: string;
   file_size: number;
+  sha256?: string | null;
+  encrypted?: boolean | null;
+  upload_token: string;
 }
 
 // ===== 영상 API 요청 =====
@@ -240,10 +316,26 @@ export interface QuestionMappingUpdateRequest {
 }
 
 // ===== 문제 통계 =====
+export interface QuestionChapterCount {
+  chapter_id: string | null;
+  title: string | null;
+  total_count: number;
+  mapped_count: number;
+}
+
+export interface QuestionPageBucket {
+  page_start: number;
+  page_end: number;
+  count: number;
+}
+
 export interface QuestionStats {
   total_count: number;
   mapped_count: number;
   unmapped_count: number;
+  by_chapter: QuestionChapterCount[];
+  by_root_chapter: QuestionChapterCount[];
+  by_page_bucket: QuestionPageBucket[];
 }
 
 // ===== 공통 응답 =====